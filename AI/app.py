@@ -1,15 +1,37 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, BackgroundTasks, Response
 from dotenv import dotenv_values
 from fastapi.middleware.cors import CORSMiddleware
-from src.features.ai_schedule.schedule_controller import GenSchedule
+from src.features.ai_schedule.schedule_controller import GenSchedule, GetLearningPathDay, GetLearningPathDays, PrefetchDays
 from src.constant.ScheduleType import Schedule
-from src.config.connectDatabase import  connect_db
+from src.config.connectDatabase import  connect_db, ping_db
+from src.config.readiness import engine_status, is_warmup_done, set_warmup_done
+from src.config.warmup import warm_up_engines, WARMUP_ON_STARTUP
 from src.features.face_recognition.face_recognition_controller import router as face_recognition_router
+from src.utils.http_clients import close_http_clients
+from src.database.outbox import get_schedule_outbox, SCHEDULE_WRITE_MODE
 
 
 config = dotenv_values(".env")
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    connect_db()
+    if SCHEDULE_WRITE_MODE == "outbox":
+        # Drain schedules left in the outbox by a previous run
+        get_schedule_outbox().start()
+    if WARMUP_ON_STARTUP:
+        # Serve liveness right away, /ready turns green once the engines are loaded
+        app.state.warmup = asyncio.create_task(asyncio.to_thread(warm_up_engines))
+    else:
+        set_warmup_done()
+    yield
+    await close_http_clients()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 app.add_middleware(
@@ -20,15 +42,49 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-connect_db()
-
 @app.get("/")
 def root():
     return {"Hello": "World"}
 
+@app.get("/ready")
+def ready(response: Response):
+    is_ready = is_warmup_done()
+    if not is_ready:
+        response.status_code = 503
+    return {
+        "ready": is_ready,
+        "mongodb": ping_db(),
+        "engines": engine_status(),
+    }
+
 @app.post("/generate_schedule")
-async def query_schedule(req: Schedule):
-    return GenSchedule(req)
+def query_schedule(req: Schedule, background_tasks: BackgroundTasks):
+    # Plain def: generation blocks for up to the deadline, FastAPI runs it in the threadpool
+    result = GenSchedule(req)
+    if result.get("success"):
+        # Fill the first pending days (template hits) without holding the response
+        background_tasks.add_task(PrefetchDays, result["roadmapId"], 1)
+    return result
+
+@app.get("/learning_path/{roadmap_id}/days")
+def get_learning_path_days(roadmap_id: str, start: int = 1, end: int | None = None):
+    return GetLearningPathDays(roadmap_id, start, end)
+
+@app.get("/learning_path/{roadmap_id}/days/{day}")
+def get_learning_path_day(roadmap_id: str, day: int, background_tasks: BackgroundTasks, response: Response):
+    result = GetLearningPathDay(roadmap_id, day)
+    if result.get("status") == "pending":
+        response.status_code = 503
+        response.headers["Retry-After"] = str(result["retryAfter"])
+    if result.get("success"):
+        # Keep the days the learner is approaching generated ahead of time
+        background_tasks.add_task(PrefetchDays, roadmap_id, day + 1)
+    return result
+
+@app.post("/learning_path/{roadmap_id}/prefetch")
+def prefetch_learning_path(roadmap_id: str, background_tasks: BackgroundTasks):
+    background_tasks.add_task(PrefetchDays, roadmap_id)
+    return {"success": True, "roadmapId": roadmap_id, "message": "Prefetch scheduled"}
 
 # Face Recognition routes
 app.include_router(face_recognition_router, prefix="/face-recognition", tags=["Face Recognition"])
@@ -0,0 +1,59 @@
+"""
+Compare the old full-size PIL decode with the reduced BGR decode of face uploads.
+
+    python benchmarks/face_decode.py path/to/photo.jpg [--runs 20] [--max-side 1280]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from io import BytesIO
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def pil_full_size(data: bytes):
+    import cv2
+    import numpy as np
+    from PIL import Image
+
+    image = Image.open(BytesIO(data))
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    # The detector then needed a BGR copy of the full image
+    return cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR), 1.0
+
+
+def measure(label, fn, data, runs):
+    fn(data)
+    started = time.perf_counter()
+    for _ in range(runs):
+        image, scale = fn(data)
+    elapsed = (time.perf_counter() - started) / runs * 1000
+
+    tracemalloc.start()
+    fn(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<10} {elapsed:>8.1f} ms  peak {peak / 2**20:>7.1f} MB  shape {image.shape}  scale {scale:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("image")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--max-side", type=int, default=None)
+    args = parser.parse_args()
+
+    from src.features.face_recognition.face_recognition_service import FaceRecognitionService, FACE_MAX_IMAGE_SIDE
+
+    with open(args.image, "rb") as f:
+        data = f.read()
+    max_side = args.max_side or FACE_MAX_IMAGE_SIDE
+    measure("pil", pil_full_size, data, args.runs)
+    measure("reduced", lambda d: FaceRecognitionService.decode_image_bytes(d, max_side), data, args.runs)
+
+
+if __name__ == "__main__":
+    main()
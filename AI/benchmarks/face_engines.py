@@ -0,0 +1,69 @@
+"""
+Compare the full buffalo_l pack with the per-endpoint InsightFace engines.
+
+For each engine prints model load memory (RSS growth) and the CPU time of
+FaceAnalysis.get per image, i.e. what /detect and /encode pay per request.
+
+    python benchmarks/face_engines.py path/to/face.jpg [--runs 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def rss_mb() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def load(engine_name):
+    if engine_name is None:
+        from insightface.app import FaceAnalysis
+
+        engine = FaceAnalysis(providers=["CPUExecutionProvider"], name="buffalo_l")
+        engine.prepare(ctx_id=-1, det_size=(640, 640))
+        return engine
+    from src.features.face_recognition.face_recognition_service import load_face_analysis
+
+    return load_face_analysis(engine_name)
+
+
+def main():
+    import cv2
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("image")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    from src.features.face_recognition.face_recognition_service import FACE_ENGINE_MODULES
+
+    image = cv2.imread(args.image)
+    if image is None:
+        raise SystemExit(f"❌ Cannot read {args.image}")
+
+    engines = {"full buffalo_l": None}
+    engines.update({f"{name} (/{'detect' if name == 'detection' else 'encode, /verify'})": name for name in FACE_ENGINE_MODULES})
+    for label, engine_name in engines.items():
+        before = rss_mb()
+        engine = load(engine_name)
+        loaded = rss_mb() - before
+        engine.get(image)  # first run allocates the onnxruntime buffers
+
+        cpu_started, wall_started = time.process_time(), time.perf_counter()
+        for _ in range(args.runs):
+            faces = engine.get(image)
+        cpu = (time.process_time() - cpu_started) / args.runs * 1000
+        wall = (time.perf_counter() - wall_started) / args.runs * 1000
+        print(f"{label:<38} models={','.join(sorted(engine.models)):<45} +{loaded:>7.1f} MB  cpu {cpu:>7.1f} ms  wall {wall:>7.1f} ms  faces={len(faces)}")
+        del engine
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Accuracy parity report of int8 face models against the fp32 pack.
+
+    python benchmarks/face_model_parity.py images/ --det models_int8/det_10g_int8.onnx --rec models_int8/w600k_r50_int8.onnx
+
+Reports, over all images:
+  - detection: face count agreement, IoU and score drift of matched boxes
+  - recognition: cosine similarity of fp32 and int8 embeddings of the same
+    aligned crop (crops from the fp32 detector, so only the model differs)
+  - latency of both engines per image
+With --identities (images grouped in one sub-directory per person) it also
+reports genuine/impostor verification rates at --tolerance for both engines.
+"""
+import argparse
+import glob
+import itertools
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def iou(a, b) -> float:
+    x1, y1 = max(a[0], b[0]), max(a[1], b[1])
+    x2, y2 = min(a[2], b[2]), min(a[3], b[3])
+    inter = max(0.0, x2 - x1) * max(0.0, y2 - y1)
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter
+    return inter / union if union > 0 else 0.0
+
+
+def timed_get(engine, image):
+    started = time.perf_counter()
+    faces = engine.get(image)
+    return faces, time.perf_counter() - started
+
+
+def verification_rates(embeddings, tolerance):
+    """(genuine accept rate, impostor accept rate) over all pairs of the first face of each image."""
+    from src.features.face_recognition.face_recognition_service import face_distances
+
+    genuine, impostor = [], []
+    for (id_a, emb_a), (id_b, emb_b) in itertools.combinations(embeddings, 2):
+        accepted = face_distances(emb_a, emb_b)[0] <= tolerance
+        (genuine if id_a == id_b else impostor).append(accepted)
+    return (np.mean(genuine) if genuine else float("nan"), np.mean(impostor) if impostor else float("nan"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("image_dir")
+    parser.add_argument("--det", help="int8 detection model (default: fp32 pack model)")
+    parser.add_argument("--rec", help="int8 recognition model (default: fp32 pack model)")
+    parser.add_argument("--identities", action="store_true", help="sub-directories of image_dir are identities")
+    parser.add_argument("--tolerance", type=float, default=0.6)
+    args = parser.parse_args()
+
+    from insightface.utils import face_align
+    from src.features.face_recognition.face_recognition_service import load_face_analysis, pack_model_path
+
+    baseline = load_face_analysis("recognition", {"detection": pack_model_path("detection"), "recognition": pack_model_path("recognition")})
+    candidate = load_face_analysis("recognition", {"detection": args.det or pack_model_path("detection"), "recognition": args.rec or pack_model_path("recognition")})
+    rec_model = candidate.models["recognition"]
+
+    paths = sorted(p for p in glob.glob(os.path.join(args.image_dir, "**", "*"), recursive=True) if p.lower().endswith((".jpg", ".jpeg", ".png", ".webp")))
+    count_agree, ious, score_drift, similarities = [], [], [], []
+    base_time, cand_time = [], []
+    base_embeddings, cand_embeddings = [], []
+    for path in paths:
+        image = cv2.imread(path)
+        if image is None:
+            continue
+        base_faces, elapsed = timed_get(baseline, image)
+        base_time.append(elapsed)
+        cand_faces, elapsed = timed_get(candidate, image)
+        cand_time.append(elapsed)
+
+        count_agree.append(len(base_faces) == len(cand_faces))
+        for face in base_faces:
+            best = max(cand_faces, key=lambda other: iou(face.bbox, other.bbox), default=None)
+            if best is not None:
+                ious.append(iou(face.bbox, best.bbox))
+                score_drift.append(abs(float(face.det_score) - float(best.det_score)))
+            crop = face_align.norm_crop(image, landmark=face.kps, image_size=rec_model.input_size[0])
+            cand_embedding = rec_model.get_feat(crop).flatten()
+            similarities.append(float(np.dot(face.embedding, cand_embedding) / (np.linalg.norm(face.embedding) * np.linalg.norm(cand_embedding))))
+
+        identity = os.path.basename(os.path.dirname(path))
+        if base_faces:
+            base_embeddings.append((identity, base_faces[0].embedding))
+        if cand_faces:
+            cand_embeddings.append((identity, cand_faces[0].embedding))
+
+    if not base_time:
+        raise SystemExit(f"❌ No images found in {args.image_dir}")
+    print(f"📊 {len(base_time)} images, {len(similarities)} faces")
+    print(f"detection   count agreement {np.mean(count_agree) * 100:.1f}%  IoU mean {np.mean(ious) if ious else float('nan'):.3f} min {min(ious, default=float('nan')):.3f}  score drift mean {np.mean(score_drift) if score_drift else float('nan'):.4f}")
+    if similarities:
+        print(f"recognition cosine(fp32, int8) mean {np.mean(similarities):.4f}  p1 {np.percentile(similarities, 1):.4f}  min {min(similarities):.4f}")
+    print(f"latency     fp32 {np.mean(base_time) * 1000:.1f} ms  candidate {np.mean(cand_time) * 1000:.1f} ms  speedup x{np.mean(base_time) / np.mean(cand_time):.2f}")
+    if args.identities:
+        for label, embeddings in (("fp32", base_embeddings), ("candidate", cand_embeddings)):
+            genuine, impostor = verification_rates(embeddings, args.tolerance)
+            print(f"verify@{args.tolerance} {label:<9} genuine accept {genuine * 100:.2f}%  impostor accept {impostor * 100:.3f}%")
+
+
+if __name__ == "__main__":
+    main()
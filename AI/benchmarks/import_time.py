@@ -0,0 +1,60 @@
+"""
+Measure how long importing the FastAPI app takes.
+
+Runs `python -X importtime -c "import app"` in a fresh interpreter from the
+AI directory and prints the total import time and the slowest modules.
+
+    python benchmarks/import_time.py [--top 20] [--module app]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(module: str):
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - started
+    if result.returncode != 0:
+        tail = "\n".join(line for line in result.stderr.splitlines() if not line.startswith("import time:"))
+        raise SystemExit(f"❌ import {module} failed:\n{tail}")
+
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        # "import time: self [us] | cumulative | imported package", nesting is shown by indentation
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if not cumulative_us.strip().isdigit():
+            continue
+        modules.append((int(cumulative_us), int(self_us), name[1:]))
+    return wall, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="app")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    wall, modules = measure(args.module)
+    # Top level packages are the ones imported with no leading indentation
+    top_level = [m for m in modules if not m[2].startswith(" ")]
+    total_us = sum(cumulative for cumulative, _, _ in top_level)
+    print(f"⏱️ import {args.module}: {total_us / 1e6:.2f}s of imports, {wall:.2f}s wall clock (interpreter start included)")
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    for cumulative, self_us, name in sorted(modules, key=lambda m: m[0], reverse=True)[:args.top]:
+        print(f"{cumulative / 1e3:>10.1f}ms {self_us / 1e3:>8.1f}ms  {name.strip()}")
+
+
+if __name__ == "__main__":
+    main()
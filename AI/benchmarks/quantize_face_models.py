@@ -0,0 +1,107 @@
+"""
+Build int8 versions of the face detection and recognition models.
+
+Static QDQ quantization (per channel weights) calibrated on your own face
+photos, which matter more than the image count: use 100-300 images close
+to production (webcam frames, ID photos).
+
+    python benchmarks/quantize_face_models.py calib_images/ --output-dir models_int8
+
+Then set FACE_DET_MODEL_PATH / FACE_REC_MODEL_PATH to the written files and
+check accuracy with benchmarks/face_model_parity.py before rolling out.
+"""
+import argparse
+import glob
+import os
+import sys
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def load_images(directory: str, limit: int):
+    paths = sorted(p for p in glob.glob(os.path.join(directory, "**", "*"), recursive=True) if p.lower().endswith((".jpg", ".jpeg", ".png", ".webp")))
+    images = [cv2.imread(path) for path in paths[:limit]]
+    return [image for image in images if image is not None]
+
+
+class _Reader:
+    """CalibrationDataReader over prepared input blobs."""
+
+    def __init__(self, input_name: str, blobs):
+        self.input_name = input_name
+        self.blobs = iter(blobs)
+
+    def get_next(self):
+        blob = next(self.blobs, None)
+        return None if blob is None else {self.input_name: blob}
+
+
+def detection_blobs(images, det_size: int):
+    # Same letterbox and normalization as SCRFD.detect
+    for image in images:
+        ratio = min(det_size / image.shape[0], det_size / image.shape[1])
+        resized = cv2.resize(image, (int(image.shape[1] * ratio), int(image.shape[0] * ratio)))
+        canvas = np.zeros((det_size, det_size, 3), dtype=np.uint8)
+        canvas[:resized.shape[0], :resized.shape[1]] = resized
+        yield cv2.dnn.blobFromImage(canvas, 1.0 / 128, (det_size, det_size), (127.5, 127.5, 127.5), swapRB=True)
+
+
+def recognition_blobs(images, detector):
+    from insightface.utils import face_align
+
+    for image in images:
+        for face in detector.get(image):
+            crop = face_align.norm_crop(image, landmark=face.kps, image_size=112)
+            yield cv2.dnn.blobFromImages([crop], 1.0 / 127.5, (112, 112), (127.5, 127.5, 127.5), swapRB=True)
+
+
+def quantize(model_path: str, output_path: str, blobs) -> None:
+    import onnx
+    from onnxruntime.quantization import CalibrationMethod, QuantFormat, QuantType, quantize_static
+    from onnxruntime.quantization.shape_inference import quant_pre_process
+
+    prepared_path = output_path + ".pre.onnx"
+    quant_pre_process(model_path, prepared_path)
+    input_name = onnx.load(prepared_path, load_external_data=False).graph.input[0].name
+    quantize_static(
+        prepared_path,
+        output_path,
+        _Reader(input_name, blobs),
+        quant_format=QuantFormat.QDQ,
+        per_channel=True,
+        activation_type=QuantType.QUInt8,
+        weight_type=QuantType.QInt8,
+        calibrate_method=CalibrationMethod.MinMax,
+    )
+    os.remove(prepared_path)
+    print(f"✅ {model_path} -> {output_path} ({os.path.getsize(model_path) / 2**20:.1f} MB -> {os.path.getsize(output_path) / 2**20:.1f} MB)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("calibration_dir")
+    parser.add_argument("--output-dir", default="models_int8")
+    parser.add_argument("--limit", type=int, default=300)
+    args = parser.parse_args()
+
+    from src.features.face_recognition.face_recognition_service import FACE_DET_SIZE, pack_model_path, load_face_analysis
+
+    images = load_images(args.calibration_dir, args.limit)
+    if not images:
+        raise SystemExit(f"❌ No images found in {args.calibration_dir}")
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    det_path = pack_model_path("detection")
+    quantize(det_path, os.path.join(args.output_dir, os.path.basename(det_path).replace(".onnx", "_int8.onnx")), detection_blobs(images, FACE_DET_SIZE))
+
+    # Crops come from the fp32 detector so only the recognition model changes here
+    rec_path = pack_model_path("recognition")
+    detector = load_face_analysis("detection", {"detection": det_path})
+    quantize(rec_path, os.path.join(args.output_dir, os.path.basename(rec_path).replace(".onnx", "_int8.onnx")), recognition_blobs(images, detector))
+
+
+if __name__ == "__main__":
+    main()
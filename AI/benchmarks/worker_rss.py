@@ -0,0 +1,66 @@
+"""
+Report the memory of the gunicorn master, its workers and the inference sidecar.
+
+Reads /proc/<pid>/smaps_rollup (Linux). PSS splits shared pages between the
+processes that map them, so the PSS total is the real footprint of the pod;
+compare it with GUNICORN_PRELOAD=false, =true and with INFERENCE_SIDECAR_SOCKET.
+
+    python benchmarks/worker_rss.py <master pid>
+"""
+import argparse
+import os
+
+FIELDS = ("Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty")
+
+
+def read_rollup(pid: int) -> dict:
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in FIELDS:
+                values[key] = int(rest.split()[0])  # kB
+    return values
+
+
+def children(pid: int) -> list:
+    result = []
+    for task in os.listdir(f"/proc/{pid}/task"):
+        try:
+            with open(f"/proc/{pid}/task/{task}/children") as f:
+                result.extend(int(child) for child in f.read().split())
+        except FileNotFoundError:
+            continue
+    return result
+
+
+def command(pid: int) -> str:
+    with open(f"/proc/{pid}/cmdline", "rb") as f:
+        return f.read().replace(b"\0", b" ").decode(errors="replace").strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pid", type=int, help="gunicorn master pid")
+    args = parser.parse_args()
+
+    rows = [("master", args.pid)]
+    for child in children(args.pid):
+        role = "sidecar" if "inference_sidecar" in command(child) else "worker"
+        rows.append((role, child))
+
+    totals = dict.fromkeys(FIELDS, 0)
+    print(f"{'role':<8} {'pid':>7} " + " ".join(f"{field + ' MB':>16}" for field in FIELDS))
+    for role, pid in rows:
+        values = read_rollup(pid)
+        for field in FIELDS:
+            totals[field] += values.get(field, 0)
+        print(f"{role:<8} {pid:>7} " + " ".join(f"{values.get(field, 0) / 1024:>16.1f}" for field in FIELDS))
+    print(f"{'total':<16} " + " ".join(f"{totals[field] / 1024:>16.1f}" for field in FIELDS))
+    workers = [pid for role, pid in rows if role == "worker"]
+    if workers:
+        print(f"📊 {len(workers)} workers, {sum(read_rollup(pid)['Pss'] for pid in workers) / 1024 / len(workers):.1f} MB PSS per worker")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# Preload-and-fork deployment: gunicorn -c gunicorn.conf.py app:app
+import subprocess
+import sys
+from dotenv import dotenv_values
+
+config = dotenv_values(".env")
+
+bind = config.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(config.get("WEB_CONCURRENCY", 4))
+worker_class = "uvicorn.workers.UvicornWorker"
+timeout = int(config.get("GUNICORN_TIMEOUT", 180))
+# Import the app (and the models, see when_ready) once in the master, workers share its pages
+preload_app = str(config.get("GUNICORN_PRELOAD", "true")).lower() in ("1", "true", "yes")
+
+_sidecar = None
+
+
+def on_starting(server):
+    global _sidecar
+    from src.config.inference_sidecar import INFERENCE_SIDECAR_SOCKET, wait_for_sidecar
+
+    if INFERENCE_SIDECAR_SOCKET:
+        _sidecar = subprocess.Popen([sys.executable, "-m", "src.config.inference_sidecar"])
+        wait_for_sidecar(process=_sidecar)
+        server.log.info("Inference sidecar started (pid %s)", _sidecar.pid)
+
+
+def when_ready(server):
+    if not preload_app:
+        return
+    from src.config.preload import preload_models, freeze_for_fork
+
+    preload_models()
+    freeze_for_fork()
+
+
+def post_fork(server, worker):
+    from src.config.preload import after_fork
+
+    after_fork()
+
+
+def on_exit(server):
+    if _sidecar is not None and _sidecar.poll() is None:
+        _sidecar.terminate()
+        _sidecar.wait(timeout=10)
@@ -0,0 +1,104 @@
+"""
+Create the indexes the schedule service queries on Road_Map and Learning_Path.
+
+Both collections are shared with the NestJS backend, so the models do not
+declare these indexes (mongoengine would create them on first use from every
+pod); run this once per environment instead, from the AI directory so the
+.env is picked up:
+
+    python scripts/create_schedule_indexes.py            # show what would change
+    python scripts/create_schedule_indexes.py --apply    # create the indexes
+
+Indexes:
+- {roadmapId: 1}, unique and sparse: save_generated_schedule upserts by
+  roadmapId, the unique index keeps concurrent retries from inserting twice.
+  It is skipped when the collection already holds duplicate roadmapIds, which
+  are listed so they can be cleaned up first.
+- {userId: 1, createdAt: -1}: the backend lists a user's roadmaps and
+  learning paths newest first.
+
+Existing indexes with the same keys are left untouched. Drop them with
+--drop if the migration has to be rolled back.
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymongo import ASCENDING, DESCENDING
+
+COLLECTIONS = ("Road_Map", "Learning_Path")
+INDEXES = [
+    {"name": "roadmapId_1", "keys": [("roadmapId", ASCENDING)], "unique": True, "sparse": True},
+    {"name": "userId_1_createdAt_-1", "keys": [("userId", ASCENDING), ("createdAt", DESCENDING)]},
+]
+
+
+def duplicate_roadmap_ids(collection, limit: int = 20):
+    pipeline = [
+        {"$match": {"roadmapId": {"$type": "string"}}},
+        {"$group": {"_id": "$roadmapId", "count": {"$sum": 1}}},
+        {"$match": {"count": {"$gt": 1}}},
+        {"$limit": limit},
+    ]
+    return [(row["_id"], row["count"]) for row in collection.aggregate(pipeline)]
+
+
+def migrate(db, apply: bool = False) -> bool:
+    """Create the missing indexes (only print them unless apply); False when one had to be skipped."""
+    ok = True
+    for name in COLLECTIONS:
+        collection = db[name]
+        existing = {tuple(info["key"]): index_name for index_name, info in collection.index_information().items()}
+        for index in INDEXES:
+            keys = [(field, int(direction)) for field, direction in index["keys"]]
+            if tuple(keys) in existing:
+                print(f"✅ {name}.{existing[tuple(keys)]} already exists")
+                continue
+            if index.get("unique"):
+                duplicates = duplicate_roadmap_ids(collection)
+                if duplicates:
+                    ok = False
+                    print(f"⚠️  {name}: skipping unique {index['name']}, duplicate roadmapIds: {duplicates}")
+                    continue
+            options = {key: value for key, value in index.items() if key != "keys"}
+            if apply:
+                collection.create_index(keys, **options)
+                print(f"✅ {name}.{index['name']} created")
+            else:
+                print(f"➡️  {name}.{index['name']} would be created {options}")
+    return ok
+
+
+def drop(db, apply: bool = False) -> None:
+    for name in COLLECTIONS:
+        existing = db[name].index_information()
+        for index in INDEXES:
+            if index["name"] in existing:
+                if apply:
+                    db[name].drop_index(index["name"])
+                    print(f"🗑️  {name}.{index['name']} dropped")
+                else:
+                    print(f"➡️  {name}.{index['name']} would be dropped")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--apply", action="store_true", help="change the database, otherwise only print the plan")
+    parser.add_argument("--drop", action="store_true", help="drop the indexes this script creates")
+    args = parser.parse_args()
+
+    from mongoengine.connection import get_db
+    from src.config.connectDatabase import connect_db
+
+    connect_db()
+    db = get_db()
+    if args.drop:
+        drop(db, args.apply)
+    elif not migrate(db, args.apply):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
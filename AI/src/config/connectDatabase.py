@@ -32,28 +32,30 @@ def connect_db():
     
     print(f"📊 Using database: {db_name}")
 
+    # In-memory MongoDB for tests and local runs without a mongod
+    use_mock = str(config.get("MONGO_MOCK", "false")).lower() in ("1", "true", "yes")
+
     try:
-        connect(
-            db=db_name,
-            host=uri,
-            alias="default"
-        )
-        conn = get_connection()
-        # Verify collections exist
-        db = conn[db_name]
-        collections = db.list_collection_names()
-        
-        # Check if our collections exist
-        if 'Road_Map' in collections:
-            count = db['Road_Map'].count_documents({})
-        else:
-            print(f"Road_Map collection does not exist yet (will be created on first save)")
-            
-        if 'Learning_Path' in collections:
-            count = db['Learning_Path'].count_documents({})
+        if use_mock:
+            import mongomock
+            connect(
+                db=db_name,
+                host="mongodb://localhost",
+                alias="default",
+                mongo_client_class=mongomock.MongoClient
+            )
         else:
-            print(f"  Learning_Path collection does not exist yet (will be created on first save)")
-            
+            connect(
+                db=db_name,
+                host=uri,
+                alias="default",
+                maxPoolSize=int(config.get("MONGO_MAX_POOL_SIZE", 50)),
+                minPoolSize=int(config.get("MONGO_MIN_POOL_SIZE", 0)),
+                maxIdleTimeMS=int(config.get("MONGO_MAX_IDLE_TIME_MS", 60000)),
+                serverSelectionTimeoutMS=int(config.get("MONGO_SERVER_SELECTION_TIMEOUT_MS", 10000)),
+                connectTimeoutMS=int(config.get("MONGO_CONNECT_TIMEOUT_MS", 10000))
+            )
+        # No round trip here: pymongo connects lazily, readiness is checked by /ready
     except Exception as e:
         print(f"⚠️  MongoDB connection error: {e}")
         print("⚠️  Warning: MongoDB connection failed. Some features may not work.")
@@ -61,4 +63,16 @@ def connect_db():
         # Don't raise - allow app to start without MongoDB
         # MongoDB is only needed for schedule/learning path features
         import traceback
-        traceback.print_exc()
\ No newline at end of file
+        traceback.print_exc()
+
+
+def ping_db(timeout: float = 1.0) -> bool:
+    import pymongo
+
+    try:
+        with pymongo.timeout(timeout):
+            get_connection().admin.command("ping")
+        return True
+    except Exception as e:
+        print(f"⚠️  MongoDB ping failed: {e}")
+        return False
@@ -0,0 +1,192 @@
+"""
+Optional inference sidecar.
+
+One process loads the embeddings model and the InsightFace pack, and the
+API workers send it inference calls over a Unix socket. Model memory is
+then paid once per pod instead of once per worker.
+
+    python -m src.config.inference_sidecar
+
+Workers use it when INFERENCE_SIDECAR_SOCKET is set; gunicorn.conf.py
+starts it before the workers.
+"""
+import os
+import threading
+import time
+from multiprocessing.connection import Client, Listener
+from typing import Any, List, Optional
+from dotenv import dotenv_values
+
+config = dotenv_values(".env")
+
+# Unix socket of the sidecar; unset keeps the models inside each worker
+INFERENCE_SIDECAR_SOCKET = config.get("INFERENCE_SIDECAR_SOCKET")
+INFERENCE_SIDECAR_AUTHKEY = config.get("INFERENCE_SIDECAR_AUTHKEY", "").encode() or None
+INFERENCE_SIDECAR_START_TIMEOUT_SECONDS = float(config.get("INFERENCE_SIDECAR_START_TIMEOUT_SECONDS", 180))
+
+
+class RemoteFace(dict):
+    """Face returned by the sidecar, with the attribute access of insightface's Face."""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+class SidecarClient:
+    """Per-thread connections to the sidecar; calls are retried once on a fresh connection."""
+
+    def __init__(self, address: str = INFERENCE_SIDECAR_SOCKET, authkey: Optional[bytes] = INFERENCE_SIDECAR_AUTHKEY):
+        self.address = address
+        self.authkey = authkey
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = Client(self.address, family="AF_UNIX", authkey=self.authkey)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def call(self, op: str, *args) -> Any:
+        for attempt in range(2):
+            try:
+                conn = self._connection()
+                conn.send((op, args))
+                status, result = conn.recv()
+                break
+            except (EOFError, OSError):
+                # The sidecar restarted or the connection was dropped, all ops are pure so retrying is safe
+                self._local.conn = None
+                if attempt:
+                    raise
+        if status == "error":
+            raise RuntimeError(f"Inference sidecar {op} failed: {result}")
+        return result
+
+
+_client: Optional[SidecarClient] = None
+_client_lock = threading.Lock()
+
+
+def get_sidecar_client() -> SidecarClient:
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = SidecarClient()
+        return _client
+
+
+class SidecarEmbeddings:
+    """Drop-in for CustomEmbeddings that embeds in the sidecar."""
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return get_sidecar_client().call("embed_documents", list(texts))
+
+    def embed_query(self, text: str) -> List[float]:
+        return get_sidecar_client().call("embed_query", text)
+
+
+class SidecarFaceAnalysis:
+    """Drop-in for insightface's FaceAnalysis.get that runs in the sidecar."""
+
+    def __init__(self, engine: str = "recognition"):
+        self.engine = engine
+
+    def get(self, image, det_size=None) -> List[RemoteFace]:
+        return [RemoteFace(face) for face in get_sidecar_client().call("face_get", self.engine, image, det_size)]
+
+    def get_batch(self, images, quality_gate: bool = False) -> List[List[RemoteFace]]:
+        return [[RemoteFace(face) for face in faces] for faces in get_sidecar_client().call("face_get_batch", self.engine, images, quality_gate)]
+
+
+def _load_engines() -> dict:
+    from src.utils.custom_emb import create_embeddings
+    from src.features.face_recognition.face_recognition_service import load_face_analysis, detection_only
+
+    engines = {"embeddings": create_embeddings()}
+    try:
+        engines["face_recognition"] = load_face_analysis("recognition")
+        engines["face_detection"] = detection_only(engines["face_recognition"])
+    except Exception as e:
+        print(f"⚠️ Inference sidecar: InsightFace not loaded, face calls will fail: {e}")
+    return engines
+
+
+def _dispatch(engines: dict, op: str, args: tuple) -> Any:
+    if op == "ping":
+        return sorted(engines)
+    if op == "embed_documents":
+        return engines["embeddings"].embed_documents(*args)
+    if op == "embed_query":
+        return engines["embeddings"].embed_query(*args)
+    if op == "face_get":
+        from src.features.face_recognition.face_recognition_service import analyze_faces
+
+        engine, image, det_size = args
+        if f"face_{engine}" not in engines:
+            raise RuntimeError(f"InsightFace {engine} engine is not loaded in the sidecar")
+        return [dict(face) for face in analyze_faces(engines[f"face_{engine}"], image, det_size)]
+    if op == "face_get_batch":
+        from src.features.face_recognition.face_recognition_service import analyze_faces_batch
+
+        engine, images, quality_gate = args
+        if f"face_{engine}" not in engines:
+            raise RuntimeError(f"InsightFace {engine} engine is not loaded in the sidecar")
+        return [[dict(face) for face in faces] for faces in analyze_faces_batch(engines[f"face_{engine}"], images, quality_gate)]
+    raise ValueError(f"Unknown op {op}")
+
+
+def _handle(conn, engines: dict) -> None:
+    with conn:
+        while True:
+            try:
+                op, args = conn.recv()
+            except (EOFError, OSError):
+                return
+            try:
+                conn.send(("ok", _dispatch(engines, op, args)))
+            except Exception as e:
+                conn.send(("error", str(e)))
+
+
+def serve(address: str = INFERENCE_SIDECAR_SOCKET) -> None:
+    if not address:
+        raise SystemExit("INFERENCE_SIDECAR_SOCKET is not set")
+    engines = _load_engines()
+
+    if os.path.exists(address):
+        os.unlink(address)
+    with Listener(address, family="AF_UNIX", authkey=INFERENCE_SIDECAR_AUTHKEY) as listener:
+        os.chmod(address, 0o600)
+        print(f"🧠 Inference sidecar listening on {address} (engines: {', '.join(sorted(engines))})")
+        while True:
+            try:
+                conn = listener.accept()
+            except Exception as e:
+                print(f"⚠️ Inference sidecar rejected a connection: {e}")
+                continue
+            threading.Thread(target=_handle, args=(conn, engines), daemon=True).start()
+
+
+def wait_for_sidecar(address: str = INFERENCE_SIDECAR_SOCKET, timeout: float = INFERENCE_SIDECAR_START_TIMEOUT_SECONDS, process=None) -> None:
+    """Block until the sidecar answers a ping, so workers never start before it."""
+    client = SidecarClient(address)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            client.call("ping")
+            return
+        except (OSError, EOFError):
+            if process is not None and process.poll() is not None:
+                raise RuntimeError(f"Inference sidecar exited with code {process.returncode}")
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Inference sidecar did not start within {timeout:.0f}s")
+            time.sleep(0.5)
+
+
+if __name__ == "__main__":
+    serve()
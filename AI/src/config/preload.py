@@ -0,0 +1,53 @@
+import gc
+from dotenv import dotenv_values
+
+config = dotenv_values(".env")
+
+# Threads used by torch in each worker after fork, 0 keeps torch's default
+TORCH_NUM_THREADS = int(config.get("TORCH_NUM_THREADS", 0))
+
+_torch_threads = None
+
+
+def preload_models() -> None:
+    """
+    Load what can be shared with forked workers, in the gunicorn master.
+
+    The embeddings weights are loaded here and shared copy-on-write by every
+    worker. torch runs single threaded while loading so no OpenMP pool
+    exists at fork time. onnxruntime sessions start their thread pools when
+    created and those threads do not survive fork, so InsightFace is only
+    imported here; its models are shared through the inference sidecar.
+    """
+    global _torch_threads
+    from src.config.inference_sidecar import INFERENCE_SIDECAR_SOCKET
+
+    if INFERENCE_SIDECAR_SOCKET:
+        return
+    try:
+        import torch
+
+        _torch_threads = torch.get_num_threads()
+        torch.set_num_threads(1)
+        from src.utils.custom_emb import get_embeddings
+        get_embeddings()
+    except Exception as e:
+        print(f"⚠️ Preloading the embeddings model failed, workers will load it: {e}")
+    try:
+        import insightface.app  # noqa: F401
+        import onnxruntime  # noqa: F401
+    except Exception as e:
+        print(f"⚠️ Preloading InsightFace failed: {e}")
+
+
+def freeze_for_fork() -> None:
+    """Move everything loaded so far out of the GC so collections in workers do not dirty shared pages."""
+    gc.collect()
+    gc.freeze()
+
+
+def after_fork() -> None:
+    threads = TORCH_NUM_THREADS or _torch_threads
+    if threads:
+        import torch
+        torch.set_num_threads(threads)
@@ -0,0 +1,43 @@
+import threading
+import time
+from typing import Callable, Dict, Any
+
+# engine name -> {"loaded": bool, "seconds": float | None, "error": str | None}
+_engines: Dict[str, Dict[str, Any]] = {}
+_lock = threading.Lock()
+_warmup_done = threading.Event()
+
+
+def mark_loaded(name: str, seconds: float = None) -> None:
+    with _lock:
+        _engines[name] = {"loaded": True, "seconds": round(seconds, 3) if seconds is not None else None, "error": None}
+
+
+def mark_failed(name: str, error: str) -> None:
+    with _lock:
+        _engines[name] = {"loaded": False, "seconds": None, "error": error}
+
+
+def load_engine(name: str, loader: Callable[[], Any]) -> Any:
+    """Run a loader once it is needed and record how long it took."""
+    started = time.perf_counter()
+    try:
+        engine = loader()
+    except Exception as e:
+        mark_failed(name, str(e))
+        raise
+    mark_loaded(name, time.perf_counter() - started)
+    return engine
+
+
+def engine_status() -> Dict[str, Dict[str, Any]]:
+    with _lock:
+        return {name: dict(status) for name, status in _engines.items()}
+
+
+def set_warmup_done() -> None:
+    _warmup_done.set()
+
+
+def is_warmup_done() -> bool:
+    return _warmup_done.is_set()
@@ -0,0 +1,32 @@
+from dotenv import dotenv_values
+from src.config.readiness import set_warmup_done
+
+config = dotenv_values(".env")
+
+# Load engines at startup instead of on the first request
+WARMUP_ON_STARTUP = str(config.get("WARMUP_ON_STARTUP", "false")).lower() in ("1", "true", "yes")
+# Comma separated subset of: vector_store, face_detector, local_llm
+WARMUP_ENGINES = [name.strip() for name in config.get("WARMUP_ENGINES", "vector_store,face_detector").split(",") if name.strip()]
+
+
+def warm_up_engines(engines=None) -> None:
+    """Load the heavy engines of this process; failures are reported by /ready, not raised."""
+    for name in engines if engines is not None else WARMUP_ENGINES:
+        try:
+            if name == "vector_store":
+                from src.features.ai_schedule.schedule_controller import get_vector_store
+                get_vector_store()
+            elif name == "face_detector":
+                from src.features.face_recognition.face_recognition_service import FaceRecognitionService
+                FaceRecognitionService.get_scrfd_detector("recognition")
+                # Shares the detector model of the recognition engine
+                FaceRecognitionService.get_scrfd_detector("detection")
+            elif name == "local_llm":
+                from src.utils.local_llm import get_local_engine
+                from src.config.readiness import load_engine
+                load_engine("local_llm", lambda: get_local_engine(config["LLM_MODEL_PATH"]))
+            else:
+                print(f"⚠️ Unknown warm-up engine: {name}")
+        except Exception as e:
+            print(f"⚠️ Warm-up of {name} failed: {e}")
+    set_warmup_done()
@@ -1,8 +1,13 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import List, Literal, Optional, Union
+
+# Face encodings are a list of floats, or the compact base64 form of src/features/face_recognition/encoding_codec.py
+FaceEncoding = Union[str, List[float]]
+EncodingFormat = Literal["json", "f16", "f32"]
 
 class EncodeFaceRequest(BaseModel):
     image_base64: str = Field(..., description="Base64 encoded image string")
+    encoding_format: EncodingFormat = Field("json", description="json (list of floats), or compact base64 f16 / f32")
 
     class Config:
         schema_extra = {
@@ -13,7 +18,7 @@ class EncodeFaceRequest(BaseModel):
 
 class EncodeFaceResponse(BaseModel):
     success: bool
-    encoding: Optional[List[float]] = None
+    encoding: Optional[FaceEncoding] = None
     error: Optional[str] = None
 
     class Config:
@@ -27,7 +32,7 @@ class EncodeFaceResponse(BaseModel):
 
 class VerifyFaceRequest(BaseModel):
     image_base64: str = Field(..., description="Base64 encoded image string to verify")
-    encoding: List[float] = Field(..., description="Face encoding vector to compare against")
+    encoding: FaceEncoding = Field(..., description="Face encoding vector (or compact encoding) to compare against")
     tolerance: float = Field(0.6, description="Face recognition tolerance (default 0.6)")
 
     class Config:
@@ -90,3 +95,83 @@ class DetectFaceResponse(BaseModel):
             }
         }
 
+class EncodeFaceBatchRequest(BaseModel):
+    images_base64: List[str] = Field(..., description="Base64 encoded images, one face each")
+    encoding_format: EncodingFormat = Field("json", description="json (list of floats), or compact base64 f16 / f32")
+
+class EncodeFaceBatchResponse(BaseModel):
+    success: bool
+    results: List[EncodeFaceResponse] = Field(default_factory=list, description="One result per image, in request order")
+    error: Optional[str] = None
+
+class VerifyFaceBatchRequest(BaseModel):
+    items: List[VerifyFaceRequest] = Field(..., description="Images with the encoding each one is compared against")
+
+class VerifyFaceBatchResponse(BaseModel):
+    success: bool
+    results: List[VerifyFaceResponse] = Field(default_factory=list, description="One result per item, in request order")
+    error: Optional[str] = None
+
+class DetectFaceBatchRequest(BaseModel):
+    images_base64: List[str] = Field(..., description="Base64 encoded images")
+
+class DetectFaceBatchResponse(BaseModel):
+    success: bool
+    results: List[DetectFaceResponse] = Field(default_factory=list, description="One result per image, in request order")
+    error: Optional[str] = None
+
+class GalleryEnrollRequest(BaseModel):
+    user_id: str = Field(..., description="Id the face is enrolled under")
+    image_base64: Optional[str] = Field(None, description="Base64 encoded image with one face")
+    encoding: Optional[FaceEncoding] = Field(None, description="Already computed encoding, used when no image is given")
+
+class GalleryEnrollResponse(BaseModel):
+    success: bool
+    user_id: Optional[str] = None
+    gallery_size: int = 0
+    error: Optional[str] = None
+
+class VerifyUserFaceRequest(BaseModel):
+    user_id: str = Field(..., description="Enrolled user to verify against")
+    image_base64: str = Field(..., description="Base64 encoded image string to verify")
+    tolerance: float = Field(0.6, description="Face recognition tolerance (default 0.6)")
+
+class IdentifyFaceRequest(BaseModel):
+    image_base64: str = Field(..., description="Base64 encoded image string")
+    top_k: int = Field(5, ge=1, le=100, description="Number of closest enrolled users to return")
+    tolerance: float = Field(0.6, description="Distance under which a candidate counts as a match")
+
+class IdentifyMatch(BaseModel):
+    user_id: str
+    distance: float
+    match: bool
+
+class IdentifyFaceResponse(BaseModel):
+    success: bool
+    matches: List[IdentifyMatch] = Field(default_factory=list, description="Closest enrolled users, best first")
+    error: Optional[str] = None
+
+class VerifyBurstRequest(BaseModel):
+    frames_base64: List[str] = Field(..., description="Base64 encoded frames, in capture order")
+    encoding: FaceEncoding = Field(..., description="Face encoding vector (or compact encoding) to compare against")
+    tolerance: float = Field(0.6, description="Face recognition tolerance (default 0.6)")
+    min_matches: int = Field(2, ge=1, description="Matching frames needed to accept (capped at the number of frames)")
+    max_no_face_frames: int = Field(3, ge=1, description="Consecutive frames without a face that reject the burst")
+
+class VerifyBurstResponse(BaseModel):
+    success: bool
+    match: bool
+    distance: Optional[float] = Field(None, description="Mean distance over the frames with a face")
+    frames_processed: int = 0
+    frames_with_face: int = 0
+    matched_frames: int = 0
+    error: Optional[str] = None
+
+class ProctorSetup(BaseModel):
+    """First message of the /proctor websocket; neither user_id nor encoding only tracks."""
+    user_id: Optional[str] = Field(None, description="Enrolled user whose gallery embedding is the reference face")
+    encoding: Optional[FaceEncoding] = Field(None, description="Reference encoding, used when no user_id is given")
+    tolerance: float = Field(0.6, ge=0, description="Face recognition tolerance (default 0.6)")
+
+class ProctorFrame(BaseModel):
+    image_base64: str = Field(..., description="Base64 encoded webcam frame")
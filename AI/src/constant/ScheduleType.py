@@ -6,6 +6,7 @@ class Schedule(BaseModel):
     discription: str | None = Field(None, example="This is a course to learn Computer Vision step by step")
     estimated_hours: int = Field(..., example=40)
     userId: str | None = Field(None, example="user123")
+    deadline_seconds: float | None = Field(None, gt=0, example=110, description="Generation budget, defaults to GENERATION_DEADLINE_SECONDS")
 
     class Config:
         schema_extra = {
@@ -0,0 +1,24 @@
+from mongoengine import Document, StringField, ListField, EmbeddedDocumentField, DateTimeField
+from datetime import datetime
+from src.database.Learning_Path import Question
+
+class Content(Document):
+    # Day content shared by every learner of a (domain, level, subskill, version)
+    contentId = StringField(required=True)
+    domain = StringField()
+    level = StringField()
+    skill = StringField()
+    subskill = StringField()
+    version = StringField()
+    youtube_links = StringField()
+    theory = StringField()
+    question_review = ListField(EmbeddedDocumentField(Question))
+    createdAt = DateTimeField(default=datetime.now)
+
+    meta = {
+        'collection': 'Content',
+        'indexes': [
+            {'fields': ['contentId'], 'unique': True},
+            ('domain', 'level', 'subskill', 'version'),
+        ]
+    }
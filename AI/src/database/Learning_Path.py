@@ -16,6 +16,10 @@ class Day(EmbeddedDocument):
     youtube_links = StringField()
     theory = StringField()
     question_review = ListField(EmbeddedDocumentField(Question))
+    # "pending" days only hold skill/subskill until their content is generated
+    status = StringField(default="ready")
+    # Reference to the shared Content document holding youtube_links/theory/question_review
+    contentId = StringField()
 
 
 class LearningPath(Document):
@@ -23,6 +27,8 @@ class LearningPath(Document):
     course = StringField()
     schedule = ListField(EmbeddedDocumentField(Day))
     roadmapId = StringField()
+    domain = StringField()
+    level = StringField()
     createdAt = DateTimeField(default=datetime.now)
     currentDay = IntField(default=1)
     completedDays = ListField(IntField(), default=[])
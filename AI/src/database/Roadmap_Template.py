@@ -0,0 +1,19 @@
+from mongoengine import Document, StringField, MapField, ListField, DictField, DateTimeField
+from datetime import datetime
+
+class RoadmapTemplate(Document):
+    # Shared (non user specific) output of the roadmap agent for one corpus slice
+    domain = StringField(required=True)
+    level = StringField(required=True)
+    contentVersion = StringField(required=True)
+    skills = MapField(field=ListField(StringField()))
+    days = ListField(DictField(), default=[])
+    createdAt = DateTimeField(default=datetime.now)
+    updatedAt = DateTimeField(default=datetime.now)
+
+    meta = {
+        'collection': 'Roadmap_Template',
+        'indexes': [
+            {'fields': ['domain', 'level', 'contentVersion'], 'unique': True}
+        ]
+    }
@@ -0,0 +1,151 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+from bson import ObjectId
+from dotenv import dotenv_values
+from src.database.RoadMap_Schema import RoadMap
+from src.database.Learning_Path import LearningPath
+from src.database.persistence import save_generated_schedule
+
+config = dotenv_values(".env")
+
+# "sync" waits for MongoDB, "outbox" answers once the schedule is on local disk
+SCHEDULE_WRITE_MODE = config.get("SCHEDULE_WRITE_MODE", "sync").lower()
+# Absolute path on a persistent volume, required by the outbox mode
+SCHEDULE_OUTBOX_PATH = config.get("SCHEDULE_OUTBOX_PATH", "")
+OUTBOX_FLUSH_INTERVAL_SECONDS = float(config.get("OUTBOX_FLUSH_INTERVAL_SECONDS", 2))
+OUTBOX_MAX_BACKOFF_SECONDS = float(config.get("OUTBOX_MAX_BACKOFF_SECONDS", 60))
+
+if SCHEDULE_WRITE_MODE == "outbox" and not os.path.isabs(SCHEDULE_OUTBOX_PATH):
+    # A relative or missing path lands in the container filesystem and is lost with it
+    print(f"⚠️ SCHEDULE_WRITE_MODE=outbox needs an absolute SCHEDULE_OUTBOX_PATH on a persistent volume (got {SCHEDULE_OUTBOX_PATH!r}), writing schedules synchronously")
+    SCHEDULE_WRITE_MODE = "sync"
+
+
+class ScheduleOutbox:
+    """
+    Durable local queue of generated schedules waiting to be written to MongoDB.
+
+    Entries are keyed by roadmapId (the idempotency key) and are removed only
+    after save_generated_schedule succeeded, so a crash or a Mongo outage
+    never loses a completed generation. Failed flushes are retried with
+    exponential backoff by a background writer thread.
+
+    Opt-in (SCHEDULE_WRITE_MODE=outbox) because of two trade-offs:
+    - /generate_schedule returns the roadmapId before the documents are in
+      MongoDB, so the backend reading Road_Map/Learning_Path directly can get
+      a 404 for it until the entry is flushed.
+    - Only the process holding the SQLite file can flush it. A read of a
+      missing id flushes that entry first (_get_learning_path), which only
+      helps when the request reaches the same pod; other replicas see the
+      schedule once the writer thread of the owning pod has written it.
+    """
+
+    def __init__(self, path: str = SCHEDULE_OUTBOX_PATH):
+        if not path:
+            raise ValueError("SCHEDULE_OUTBOX_PATH is not configured")
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=FULL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS schedule_outbox ("
+            "roadmap_id TEXT PRIMARY KEY, payload TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, "
+            "next_attempt_at REAL NOT NULL, last_error TEXT, created_at REAL NOT NULL)"
+        )
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+
+    def enqueue(self, roadmap: RoadMap, learning_path: LearningPath) -> None:
+        """Append a schedule to the outbox; ids are assigned here so callers can return them at once."""
+        for doc in (roadmap, learning_path):
+            if doc.pk is None:
+                doc.pk = ObjectId()
+            doc.validate()
+
+        payload = json.dumps({"roadmap": roadmap.to_json(), "learningPath": learning_path.to_json()})
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR IGNORE INTO schedule_outbox (roadmap_id, payload, next_attempt_at, created_at) VALUES (?, ?, ?, ?)",
+                (roadmap.roadmapId, payload, now, now),
+            )
+        self.start()
+        self._wakeup.set()
+
+    def depth(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM schedule_outbox").fetchone()[0]
+
+    def flush(self, roadmap_id: Optional[str] = None) -> int:
+        """Write due entries (or one entry, regardless of backoff) to MongoDB. Returns how many were written."""
+        with self._flush_lock:
+            with self._lock:
+                if roadmap_id:
+                    rows = self._db.execute(
+                        "SELECT roadmap_id, payload, attempts FROM schedule_outbox WHERE roadmap_id = ?", (roadmap_id,)
+                    ).fetchall()
+                else:
+                    rows = self._db.execute(
+                        "SELECT roadmap_id, payload, attempts FROM schedule_outbox WHERE next_attempt_at <= ? ORDER BY created_at",
+                        (time.time(),),
+                    ).fetchall()
+
+            written = 0
+            for entry_id, payload, attempts in rows:
+                try:
+                    payload = json.loads(payload)
+                    roadmap = RoadMap.from_json(payload["roadmap"], created=True)
+                    learning_path = LearningPath.from_json(payload["learningPath"], created=True)
+                    save_generated_schedule(roadmap, learning_path)
+                except Exception as e:
+                    backoff = min(OUTBOX_MAX_BACKOFF_SECONDS, OUTBOX_FLUSH_INTERVAL_SECONDS * 2 ** attempts)
+                    print(f"⚠️ Outbox flush failed for roadmapId {entry_id} (attempt {attempts + 1}), retrying in {backoff:.0f}s: {e}")
+                    with self._lock:
+                        self._db.execute(
+                            "UPDATE schedule_outbox SET attempts = attempts + 1, next_attempt_at = ?, last_error = ? WHERE roadmap_id = ?",
+                            (time.time() + backoff, str(e), entry_id),
+                        )
+                    continue
+
+                with self._lock:
+                    self._db.execute("DELETE FROM schedule_outbox WHERE roadmap_id = ?", (entry_id,))
+                written += 1
+                print(f"✅ Outbox flushed roadmapId {entry_id} to MongoDB")
+            return written
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(OUTBOX_FLUSH_INTERVAL_SECONDS)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"⚠️ Outbox writer error: {e}")
+
+    def start(self) -> None:
+        """Start the background writer (idempotent); it also drains entries left by a previous run."""
+        with self._lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._run, name="schedule-outbox", daemon=True)
+                self._writer.start()
+        self._wakeup.set()
+
+
+_outbox: Optional[ScheduleOutbox] = None
+_outbox_lock = threading.Lock()
+
+
+def get_schedule_outbox() -> ScheduleOutbox:
+    global _outbox
+    with _outbox_lock:
+        if _outbox is None:
+            _outbox = ScheduleOutbox()
+        return _outbox
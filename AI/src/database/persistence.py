@@ -0,0 +1,70 @@
+from bson import ObjectId
+from dotenv import dotenv_values
+from mongoengine.connection import get_connection
+from pymongo.errors import OperationFailure
+from src.database.RoadMap_Schema import RoadMap
+from src.database.Learning_Path import LearningPath
+
+config = dotenv_values(".env")
+
+# "auto" uses transactions when the server is a replica set or mongos, "on"/"off" forces it
+MONGO_TRANSACTIONS = config.get("MONGO_TRANSACTIONS", "auto").lower()
+
+_transactions_supported = None
+
+
+def _supports_transactions(client) -> bool:
+    global _transactions_supported
+    if MONGO_TRANSACTIONS in ("on", "off"):
+        return MONGO_TRANSACTIONS == "on"
+    if _transactions_supported is None:
+        try:
+            hello = client.admin.command("hello")
+            _transactions_supported = bool(hello.get("setName")) or hello.get("msg") == "isdbgrid"
+        except Exception:
+            # mongomock and very old servers
+            _transactions_supported = False
+    return _transactions_supported
+
+
+def save_generated_schedule(roadmap: RoadMap, learning_path: LearningPath) -> None:
+    """
+    Persist a RoadMap and its LearningPath together.
+
+    Both documents are written in one transaction on replica sets and mongos;
+    on standalone servers (and mongomock) they are written back to back.
+    Writes only insert documents whose roadmapId does not exist yet (with
+    client generated ids), so retrying or replaying the same pair is
+    idempotent and never overwrites later updates such as materialized days.
+    """
+    for doc in (roadmap, learning_path):
+        if doc.pk is None:
+            doc.pk = ObjectId()
+        doc.validate()
+
+    roadmap_id = roadmap.roadmapId
+    roadmap_son = roadmap.to_mongo()
+    learning_path_son = learning_path.to_mongo()
+
+    def write(session=None):
+        RoadMap._get_collection().update_one({"roadmapId": roadmap_id}, {"$setOnInsert": roadmap_son}, upsert=True, session=session)
+        LearningPath._get_collection().update_one({"roadmapId": roadmap_id}, {"$setOnInsert": learning_path_son}, upsert=True, session=session)
+
+    client = get_connection()
+    if _supports_transactions(client):
+        try:
+            with client.start_session() as session:
+                session.with_transaction(write)
+        except OperationFailure as e:
+            # Code 20: "Transaction numbers are only allowed on a replica set member or mongos"
+            if e.code != 20:
+                raise
+            global _transactions_supported
+            _transactions_supported = False
+            write()
+    else:
+        write()
+
+    for doc in (roadmap, learning_path):
+        doc._created = False
+        doc._clear_changed_fields()
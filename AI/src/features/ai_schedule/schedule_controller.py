@@ -1,59 +1,214 @@
-from src.utils.load_documents import load_document
-from src.utils.vector_store import load_vector_store, create_vector_store
+# langchain, chromadb and sentence_transformers are imported on first use
+# (or during warm-up) so that importing the app stays fast
 from dotenv import dotenv_values
-from src.utils.custom_emb import create_embeddings
-from src.utils.initialize_llms import initialize_llm
-from src.utils.create_agent import create_agent
 from src.utils.learning_path import create_learning_path, create_roadmap
-from langchain.memory import ConversationBufferMemory
-import sys
 import os
+import threading
 from src.constant import ScheduleType
 import json
 import re
 from src.database.RoadMap_Schema import RoadMap
-from src.database.Learning_Path import LearningPath
-from src.utils.get_domain import get_domain
-from src.utils.generate_course_title import generate_course_title
-from src.utils.find_course_image import find_course_image
+from src.database.Learning_Path import LearningPath, Day
+from src.database.persistence import save_generated_schedule
+from src.database.outbox import get_schedule_outbox, SCHEDULE_WRITE_MODE
+from src.utils.content_store import store_day_content, store_days_content, hydrate_days
+from src.utils.roadmap_template import CORPUS_PATH, get_content_version, get_roadmap_template, save_roadmap_template, save_template_day, personalize_template
 from datetime import datetime
 import uuid
+import pymongo
+from src.utils.deadline import Deadline, DeadlineExceeded, run_with_deadline, GENERATION_DEADLINE_SECONDS, LLM_TIMEOUT_SECONDS
+from src.config.readiness import load_engine
 
 
 config = dotenv_values(".env")
+
+# Generate only the first PREFETCH_WINDOW days in /generate_schedule and the rest on demand
+# (the backend loads pending days through /learning_path/{id}/days/{day}); "false" generates every day upfront
+LAZY_DAY_GENERATION = str(config.get("LAZY_DAY_GENERATION", "true")).lower() in ("1", "true", "yes")
+# Number of days generated ahead of the learner's current day (LAZY_DAY_GENERATION)
+PREFETCH_WINDOW = int(config.get("PREFETCH_WINDOW", 3))
+# How long a day request waits for another thread that is already generating that day
+DAY_WAIT_SECONDS = float(config.get("DAY_WAIT_SECONDS", 30))
+DAY_RETRY_AFTER_SECONDS = int(config.get("DAY_RETRY_AFTER_SECONDS", 5))
+# Start of what an agent returns when it hits max_execution_time / max_iterations
+AGENT_STOPPED_PREFIX = "Agent stopped due to"
+# Minimum time given to the Mongo saves so that partial results are still persisted
+MONGO_SAVE_FLOOR_SECONDS = float(config.get("MONGO_SAVE_FLOOR_SECONDS", 5))
+
+# (roadmapId, day) pairs currently being generated in this process
+_materializing = set()
+_materializing_lock = threading.Lock()
+# Notified whenever days leave _materializing
+_materializing_done = threading.Condition(_materializing_lock)
+
+# Chroma collection shared by every request of this process
+_vector_store = None
+_vector_store_pid = None
+_vector_store_lock = threading.Lock()
+
+
+def _strip_code_fence(text: str) -> str:
+    if text.startswith("```"):
+        text = re.sub(r"^```[a-zA-Z]*\n?", "", text)
+        text = re.sub(r"```$", "", text)
+    return text
+
+
+def _load_documents():
+    from src.utils.load_documents import load_document
+
+    documents = []
+    for root, dirs, files in os.walk(CORPUS_PATH):
+        for file in files:
+            if file.endswith(".json"):
+                path = os.path.join(root, file)
+                parts = path.split(os.sep)
+
+                if len(parts) >= 5:
+                    domain = parts[3].strip().lower()  # 'computer vision'
+                    level = parts[4].strip().lower()  # 'advance'
+                    file_type = os.path.splitext(file)[0].strip()  # 'Theory'
+                else:
+                    continue
+
+                # Load tài liệu với metadata
+                docs = load_document(path, level=level, domain=domain)
+                if docs:
+                    # Thêm file_type vào metadata
+                    for doc in docs:
+                        doc.metadata["file_type"] = file_type
+                    documents.extend(docs)
+                    print(
+                        f"Loaded {len(docs)} chunks from {path} (domain={domain}, level={level}, file_type={file_type})")
+    return documents
+
+
+def _create_vector_store():
+    from src.utils.custom_emb import get_embeddings
+    from src.utils.vector_store import load_vector_store, create_vector_store
+
+    embeddings = get_embeddings()
+    if os.path.exists(config['VECTORDB_PATH']):
+        return load_vector_store(db_path=config['VECTORDB_PATH'], embeddings=embeddings)
+
+    documents = _load_documents()
+    if not documents:
+        raise ValueError("No documents loaded")
+    return create_vector_store(documents, embeddings)
+
+
+def get_vector_store():
+    """Open the vector store once per process; the embeddings model may come from the preloading master."""
+    global _vector_store, _vector_store_pid
+    with _vector_store_lock:
+        # A Chroma client (SQLite handles, threads) must not be reused across fork
+        if _vector_store is None or _vector_store_pid != os.getpid():
+            _vector_store = load_engine("vector_store", _create_vector_store)
+            _vector_store_pid = os.getpid()
+        return _vector_store
+
+
+def _build_agent(domain: str, level: str, deadline: Deadline = None):
+    from langchain.memory import ConversationBufferMemory
+    from src.utils.initialize_llms import initialize_llm
+    from src.utils.create_agent import create_agent
+
+    vector_store = get_vector_store()
+
+    # --- LLM, Agent ---
+    if deadline:
+        timeout = deadline.timeout(LLM_TIMEOUT_SECONDS)
+        llm = initialize_llm(timeout=timeout, max_retries=deadline.retries(timeout))
+    else:
+        llm = initialize_llm()
+    memory = ConversationBufferMemory(memory_key="chat_history", input_key="input")
+    return create_agent(domain, level, llm, vector_store, memory)
+
+
+def _build_skeleton(skills: dict, ready_days: dict) -> list:
+    """One entry per subskill; days without generated content are left pending."""
+    skeleton = []
+    for skill, subskills in skills.items():
+        for subskill in subskills:
+            day = len(skeleton) + 1
+            content = ready_days.get(subskill)
+            if content:
+                skeleton.append({**content, "day": day, "skill": skill, "subskill": subskill, "status": "ready"})
+            else:
+                skeleton.append({
+                    "day": day,
+                    "skill": skill,
+                    "subskill": subskill,
+                    "youtube_links": None,
+                    "theory": None,
+                    "question_review": [],
+                    "status": "pending",
+                })
+    return skeleton
+
+
+def _get_learning_path(roadmap_id: str):
+    learning_path = LearningPath.objects(roadmapId=roadmap_id).first()
+    # A schedule that is still waiting in this pod's outbox is written now (other pods only see it once flushed)
+    if learning_path is None and SCHEDULE_WRITE_MODE == "outbox" and get_schedule_outbox().flush(roadmap_id):
+        learning_path = LearningPath.objects(roadmapId=roadmap_id).first()
+    return learning_path
+
+
+def _user_knowledge(roadmap_id: str, level: str) -> str:
+    """Level as the learner gave it (what GenSchedule prompts with), the learning path only keeps the corpus folder level."""
+    roadmap = RoadMap.objects(roadmapId=roadmap_id).only("level").first()
+    if roadmap is not None and roadmap.level:
+        return roadmap.level.lower()
+    return {"medium": "intermediate", "advance": "advanced"}.get(level, level)
+
+
+def _persist_schedule(roadmap: RoadMap, schedule: LearningPath, deadline: Deadline) -> None:
+    if SCHEDULE_WRITE_MODE == "outbox":
+        try:
+            # Durable on local disk, the background writer flushes it to MongoDB
+            get_schedule_outbox().enqueue(roadmap, schedule)
+            print(f"📮 Schedule queued in outbox, roadmapId: {roadmap.roadmapId}")
+            return
+        except Exception as e:
+            print(f"⚠️ Outbox unavailable, saving to MongoDB directly: {e}")
+
+    # RoadMap and LearningPath are written together in one transaction when available
+    with pymongo.timeout(deadline.timeout(floor=MONGO_SAVE_FLOOR_SECONDS)):
+        save_generated_schedule(roadmap, schedule)
+    print(f"✅ RoadMap saved successfully with ID: {roadmap.id}, roadmapId: {roadmap.roadmapId}")
+
+
+def _run_agent(deadline: Deadline, stage: str, fn, agent, *args, **kwargs) -> str:
+    if deadline is not None:
+        # The agent stops its ReAct loop by itself once the budget is spent
+        agent.max_execution_time = max(deadline.remaining(), 1.0)
+    output = run_with_deadline(deadline, stage, fn, agent, *args, **kwargs)
+    # early_stopping_method="force" returns a stop message instead of raising
+    if deadline is not None and (deadline.expired() or str(output).startswith(AGENT_STOPPED_PREFIX)):
+        raise DeadlineExceeded(stage)
+    return output
+
+
+def _generate_day(agent, entry: dict, level: str, deadline: Deadline = None) -> dict:
+    schedule_of_day = _run_agent(
+        deadline, f"day {entry['day']}", create_learning_path,
+        agent, skill=entry["skill"], subskill=entry["subskill"], level=level, day=entry["day"]
+    )
+    schedule_of_day = json.loads(_strip_code_fence(schedule_of_day))
+    schedule_of_day.update({"day": entry["day"], "skill": entry["skill"], "subskill": entry["subskill"], "status": "ready"})
+    return schedule_of_day
+
+
 def GenSchedule(req: ScheduleType):
+    from src.utils.get_domain import get_domain, match_domain
+    from src.utils.generate_course_title import generate_course_title
+    from src.utils.find_course_image import find_course_image
+
     print(req)
+    deadline = Deadline(req.deadline_seconds or GENERATION_DEADLINE_SECONDS)
+    timed_out = False
     try:
-        base_path = "data/questions/AI_Engineer"
-        documents= []
-        
-        for root, dirs, files in os.walk(base_path):
-            for file in files:
-                if file.endswith(".json"):
-                    path = os.path.join(root, file)
-                    parts = path.split(os.sep)
-        
-                    if len(parts) >= 5:
-                        domain = parts[3].strip().lower()  # 'computer vision'
-                        level = parts[4].strip().lower()  # 'advance'
-                        file_type = os.path.splitext(file)[0].strip()  # 'Theory'
-                    else:
-                        continue
-        
-                    # Load tài liệu với metadata
-                    docs = load_document(path, level=level, domain=domain)
-                    if docs:
-                        # Thêm file_type vào metadata
-                        for doc in docs:
-                            doc.metadata["file_type"] = file_type
-                        documents.extend(docs)
-                        print(
-                            f"Loaded {len(docs)} chunks from {path} (domain={domain}, level={level}, file_type={file_type})")
-        
-        if not documents:
-            print("No documents loaded.")
-            return {"error": "No documents loaded"}
-
         # Map user level to folder level names
         level_mapping = {
             "beginner": "beginner",
@@ -65,67 +220,116 @@ def GenSchedule(req: ScheduleType):
         user_knowledge = req.level.lower()
         user_level_for_filter = level_mapping.get(user_knowledge, user_knowledge)
         print(f"User level: {user_knowledge} -> Filter level: {user_level_for_filter}")
-        
+
         learning_goal = req.goal
         # Generate beautiful course title
-        course_title = generate_course_title(learning_goal)
+        try:
+            course_title = run_with_deadline(
+                deadline, "generate_course_title", generate_course_title,
+                learning_goal, timeout=deadline.timeout(LLM_TIMEOUT_SECONDS),
+                max_retries=deadline.retries(deadline.timeout(LLM_TIMEOUT_SECONDS))
+            )
+        except DeadlineExceeded as e:
+            print(f"⚠️ {e}, using the raw goal as course title")
+            course_title = learning_goal.strip()
+            timed_out = True
         print(f"Original goal: {learning_goal}")
         print(f"Generated course title: {course_title}")
-        
-        domain = get_domain(learning_goal)
-        print("Domain:", domain)
-
-
-        embeddings = create_embeddings()
-        if os.path.exists(config['VECTORDB_PATH']):
-            vector_store = load_vector_store(db_path=config['VECTORDB_PATH'], embeddings=embeddings)
-        else:
-            vector_store = create_vector_store(documents, embeddings)
 
+        try:
+            domain = run_with_deadline(
+                deadline, "get_domain", get_domain,
+                learning_goal, timeout=deadline.timeout(LLM_TIMEOUT_SECONDS),
+                max_retries=deadline.retries(deadline.timeout(LLM_TIMEOUT_SECONDS))
+            )
+        except DeadlineExceeded as e:
+            print(f"⚠️ {e}, matching the domain locally")
+            domain = match_domain(learning_goal.lower())
+            timed_out = True
+        print("Domain:", domain)
 
-        # --- LLM, Agent ---
-        llm = initialize_llm()
-        memory = ConversationBufferMemory(memory_key="chat_history", input_key="input")
-        agent = create_agent(domain, user_level_for_filter, llm, vector_store, memory)
-
-        # --- Create learning path ---
         # Ensure domain is in English for tool calls
         if not domain:
             domain = "computer vision"  # Default fallback
             print(f"Warning: Domain extraction failed, using default: {domain}")
-        
-        roadmap = create_roadmap(agent, learning_goal, user_knowledge, domain)
-
-        if roadmap.startswith("```"):
-            roadmap = re.sub(r"^```[a-zA-Z]*\n?", "", roadmap)
-            roadmap = re.sub(r"```$", "", roadmap)
-        roadmap= json.loads(roadmap)
-        learning_path = []
-        day = 1
-        for key, skill in roadmap["skills"].items():
-            for subskill in skill:
-                schedule_of_day= create_learning_path(agent, skill= key, subskill=subskill, level=user_knowledge, day=day)
-                if schedule_of_day.startswith("```"):
-                    schedule_of_day = re.sub(r"^```[a-zA-Z]*\n?", "", schedule_of_day)
-                    schedule_of_day = re.sub(r"```$", "", schedule_of_day)
-                schedule_of_day = json.loads(schedule_of_day)
-                learning_path.append(schedule_of_day)
-                if day ==3:
+
+        # Roadmaps only depend on the corpus slice, so reuse a shared template when possible
+        content_version = get_content_version(domain, user_level_for_filter)
+        template = get_roadmap_template(domain, user_level_for_filter, content_version) if content_version else None
+
+        agent = None
+        if template:
+            print(f"♻️ Using roadmap template (domain={domain}, level={user_level_for_filter}, version={content_version})")
+            skills, ready_days = personalize_template(template)
+            roadmap = {"skills": skills}
+            learning_path = _build_skeleton(skills, ready_days)
+        else:
+            agent = _build_agent(domain, user_level_for_filter, deadline)
+
+            # --- Create learning path ---
+            try:
+                roadmap = _run_agent(deadline, "create_roadmap", create_roadmap, agent, learning_goal, user_knowledge, domain)
+            except DeadlineExceeded as e:
+                print(f"⚠️ {e}")
+                return {"error": str(e), "success": False, "status": "timeout"}
+            roadmap = json.loads(_strip_code_fence(roadmap))
+            learning_path = _build_skeleton(roadmap["skills"], {})
+
+        # The first PREFETCH_WINDOW days are generated now, the rest on demand (every day without LAZY_DAY_GENERATION)
+        eager_days = [entry["day"] for entry in (learning_path[:PREFETCH_WINDOW] if LAZY_DAY_GENERATION else learning_path)]
+        for entry in [learning_path[day - 1] for day in eager_days]:
+            if entry["status"] != "pending":
+                continue
+            if deadline.expired():
+                print(f"⚠️ Deadline exceeded before day {entry['day']}, returning partial learning path")
+                timed_out = True
+                break
+            try:
+                if agent is None:
+                    agent = _build_agent(domain, user_level_for_filter, deadline)
+                learning_path[entry["day"] - 1] = _generate_day(agent, entry, user_knowledge, deadline)
+            except DeadlineExceeded as e:
+                # Remaining days stay pending and are generated on demand
+                print(f"⚠️ {e}, returning partial learning path")
+                timed_out = True
+                break
+            except Exception as e:
+                print(f"⚠️ Error generating day {entry['day']}, leaving it pending: {e}")
+                if deadline.expired():
+                    timed_out = True
                     break
-                day += 1
-            break
+                continue
+            if template and content_version:
+                save_template_day(domain, user_level_for_filter, content_version, learning_path[entry["day"] - 1])
+
+        if content_version and not template:
+            save_roadmap_template(
+                domain, user_level_for_filter, content_version, roadmap["skills"],
+                [entry for entry in learning_path if entry["status"] == "ready"]
+            )
 
 
+        # A day of the upfront window that is still pending makes the result partial
+        partial = timed_out or any(learning_path[day - 1]["status"] == "pending" for day in eager_days)
+
         # Generate roadmapId
         roadmap_id = str(uuid.uuid4())
-        
+
         # Calculate totalDays
         total_days = len(learning_path)
-        
 
-        image_url = find_course_image(course_title, learning_goal)
+
+        try:
+            image_url = run_with_deadline(
+                deadline, "find_course_image", find_course_image,
+                course_title, learning_goal, timeout=deadline.timeout(10)
+            )
+        except DeadlineExceeded as e:
+            print(f"⚠️ {e}, skipping course image")
+            image_url = None
+            timed_out = True
         print(f"Course image URL: {image_url}")
-        
+
         roadmap = RoadMap(
             goal=course_title,  # Use generated course title instead of raw input
             level=req.level,
@@ -137,19 +341,18 @@ def GenSchedule(req: ScheduleType):
             createdAt=datetime.now(),
             imageUrl=image_url  # Add course cover image URL
         )
-        try:
-            roadmap.save()
-            print(f"✅ RoadMap saved successfully with ID: {roadmap.id}, roadmapId: {roadmap_id}")
-        except Exception as e:
-            print(f"❌ Error saving RoadMap: {e}")
-            import traceback
-            traceback.print_exc()
-            raise
-        
+
+        # In reference mode the ready days go to the shared Content collection in one write and keep a contentId
+        ready = [entry for entry in learning_path if entry["status"] == "ready"]
+        stored_days = iter(store_days_content(domain, user_level_for_filter, content_version, ready))
+        stored_path = [next(stored_days) if entry["status"] == "ready" else entry for entry in learning_path]
+
         schedule = LearningPath(
-            schedule=learning_path,
+            schedule=stored_path,
             userId=req.userId,
             roadmapId=roadmap_id,
+            domain=domain,
+            level=user_level_for_filter,
             createdAt=datetime.now(),
             currentDay=1,
             completedDays=[],
@@ -158,7 +361,7 @@ def GenSchedule(req: ScheduleType):
             lastAccessed=datetime.now()
         )
         try:
-            schedule.save()
+            _persist_schedule(roadmap, schedule, deadline)
             print(f" LearningPath saved successfully")
             print(f"   - MongoDB ID: {schedule.id}")
             print(f"   - roadmapId: {roadmap_id}")
@@ -166,7 +369,7 @@ def GenSchedule(req: ScheduleType):
             print(f"   - totalDays: {total_days}")
             print(f"   - Collection: Learning_Path")
         except Exception as e:
-            print(f" Error saving LearningPath: {e}")
+            print(f"❌ Error saving RoadMap/LearningPath: {e}")
             import traceback
             traceback.print_exc()
             raise
@@ -182,9 +385,164 @@ def GenSchedule(req: ScheduleType):
             "totalDays": total_days,
             "courseTitle": course_title,  # Add generated course title
             "imageUrl": image_url,  # Add course cover image URL
-            "message": "Learning path generated successfully"
+            # "partial" when a day of the upfront window is still pending (deadline or error), it is generated on demand
+            "status": "partial" if partial else "complete",
+            "generatedDays": sum(1 for entry in learning_path if entry["status"] == "ready"),
+            "message": "Learning path partially generated before the deadline" if timed_out else
+                       "Learning path generated, some days are generated on first access" if partial else "Learning path generated successfully"
         }
 
+    except Exception as e:
+        print(f" Unexpected error: {e}")
+        import traceback
+        traceback.print_exc()
+        return {"error": str(e), "success": False, "status": "timeout" if deadline.expired() else "error"}
+
+
+def MaterializeDays(roadmap_id: str, days: list, deadline: Deadline = None) -> list:
+    """
+    Generate the content of pending days of a learning path.
+
+    Content is taken from the roadmap template when another learner already
+    generated it, otherwise the agent is built once and run for each day.
+    Returns the day numbers that were materialized by this call, which may
+    be fewer than requested when the deadline passes.
+    """
+    deadline = deadline or Deadline()
+    learning_path = _get_learning_path(roadmap_id)
+    if learning_path is None:
+        raise ValueError(f"Learning path not found for roadmapId {roadmap_id}")
+
+    pending = []
+    with _materializing_lock:
+        for day in sorted(set(days)):
+            if not 1 <= day <= len(learning_path.schedule):
+                continue
+            if learning_path.schedule[day - 1].status != "pending" or (roadmap_id, day) in _materializing:
+                continue
+            _materializing.add((roadmap_id, day))
+            pending.append(day)
+
+    if not pending:
+        return []
+
+    try:
+        domain = learning_path.domain
+        level = learning_path.level
+        user_knowledge = _user_knowledge(roadmap_id, level)
+        content_version = get_content_version(domain, level)
+        template = get_roadmap_template(domain, level, content_version) if content_version else None
+        _, ready_days = personalize_template(template) if template else ({}, {})
+
+        agent = None
+        materialized = []
+        for day in pending:
+            if deadline.expired():
+                print(f"⚠️ Deadline exceeded, {roadmap_id} day {day} stays pending")
+                break
+            entry = learning_path.schedule[day - 1]
+            entry = {"day": day, "skill": entry.skill, "subskill": entry.subskill}
+            content = ready_days.get(entry["subskill"])
+            if content:
+                schedule_of_day = {**content, **entry, "status": "ready"}
+            else:
+                if agent is None:
+                    agent = _build_agent(domain, level, deadline)
+                try:
+                    schedule_of_day = _generate_day(agent, entry, user_knowledge, deadline)
+                except DeadlineExceeded as e:
+                    print(f"⚠️ {e}, {roadmap_id} day {day} stays pending")
+                    break
+                if content_version:
+                    save_template_day(domain, level, content_version, schedule_of_day)
+
+            schedule_of_day = store_day_content(domain, level, content_version, schedule_of_day)
+
+            # Only overwrite the day if nobody else filled it in the meantime
+            updated = LearningPath.objects(**{
+                "roadmapId": roadmap_id,
+                f"schedule__{day - 1}__status": "pending",
+            }).update_one(**{f"set__schedule__{day - 1}": Day(**{
+                key: value for key, value in schedule_of_day.items() if key in Day._fields
+            })})
+            if updated:
+                materialized.append(day)
+                print(f"✅ Materialized day {day} of roadmapId {roadmap_id}")
+        return materialized
+    finally:
+        with _materializing_lock:
+            for day in pending:
+                _materializing.discard((roadmap_id, day))
+            _materializing_done.notify_all()
+
+
+def PrefetchDays(roadmap_id: str, from_day: int = None) -> list:
+    """Materialize pending days inside the prefetch window after ``from_day`` (defaults to currentDay)."""
+    try:
+        if from_day is None:
+            learning_path = _get_learning_path(roadmap_id)
+            if learning_path is None:
+                return []
+            from_day = learning_path.currentDay or 1
+        return MaterializeDays(roadmap_id, list(range(from_day, from_day + PREFETCH_WINDOW)))
+    except Exception as e:
+        print(f"⚠️ Error prefetching days for roadmapId {roadmap_id}: {e}")
+        import traceback
+        traceback.print_exc()
+        return []
+
+
+def GetLearningPathDay(roadmap_id: str, day: int):
+    """Return one day of a learning path, generating it first if it is still pending."""
+    try:
+        learning_path = _get_learning_path(roadmap_id)
+        if learning_path is None:
+            return {"error": "Learning path not found", "success": False}
+        if not 1 <= day <= len(learning_path.schedule):
+            return {"error": f"Day {day} is out of range (1-{len(learning_path.schedule)})", "success": False}
+
+        if learning_path.schedule[day - 1].status == "pending":
+            MaterializeDays(roadmap_id, [day])
+            # Another thread may already be generating it, wait for that one instead
+            with _materializing_done:
+                _materializing_done.wait_for(lambda: (roadmap_id, day) not in _materializing, timeout=DAY_WAIT_SECONDS)
+            learning_path.reload()
+            if learning_path.schedule[day - 1].status == "pending":
+                return {
+                    "error": f"Day {day} is still being generated, retry shortly",
+                    "success": False,
+                    "status": "pending",
+                    "retryAfter": DAY_RETRY_AFTER_SECONDS,
+                }
+
+        return {
+            "success": True,
+            "roadmapId": roadmap_id,
+            "totalDays": learning_path.totalDays,
+            "day": hydrate_days([json.loads(learning_path.schedule[day - 1].to_json())])[0],
+        }
+    except Exception as e:
+        print(f" Unexpected error: {e}")
+        import traceback
+        traceback.print_exc()
+        return {"error": str(e), "success": False}
+
+
+def GetLearningPathDays(roadmap_id: str, start: int = 1, end: int = None):
+    """Return a range of days with their content hydrated in one batch (pending days stay empty)."""
+    try:
+        learning_path = _get_learning_path(roadmap_id)
+        if learning_path is None:
+            return {"error": "Learning path not found", "success": False}
+
+        end = min(end or len(learning_path.schedule), len(learning_path.schedule))
+        days = [json.loads(day.to_json()) for day in learning_path.schedule[max(start, 1) - 1:end]]
+        return {
+            "success": True,
+            "roadmapId": roadmap_id,
+            "totalDays": learning_path.totalDays,
+            "days": hydrate_days(days),
+        }
     except Exception as e:
         print(f" Unexpected error: {e}")
         import traceback
@@ -0,0 +1,64 @@
+from typing import List, Optional, Tuple
+from src.features.face_recognition.face_recognition_service import FACE_ERROR_NO_FACE
+
+
+class BurstVerification:
+    """
+    Running decision over the frames of one /verify-burst request.
+
+    Frames are added in capture order with their verify_face result. The
+    burst is accepted once min_matches frames matched and the mean distance
+    of the frames with a face is within tolerance, and rejected after
+    max_no_face_frames consecutive frames without a face; the remaining
+    frames are then not decoded or embedded at all.
+    """
+
+    def __init__(self, tolerance: float, min_matches: int, max_no_face_frames: int):
+        self.tolerance = tolerance
+        self.min_matches = min_matches
+        self.max_no_face_frames = max_no_face_frames
+        self.distances: List[float] = []
+        self.matched_frames = 0
+        self.frames_processed = 0
+        self.no_face_streak = 0
+        self.match: Optional[bool] = None
+        self.error: Optional[str] = None
+
+    @property
+    def decided(self) -> bool:
+        return self.match is not None
+
+    @property
+    def mean_distance(self) -> Optional[float]:
+        return sum(self.distances) / len(self.distances) if self.distances else None
+
+    def add(self, result: Tuple[bool, bool, Optional[float], Optional[str]]) -> None:
+        success, match, distance, error = result
+        self.frames_processed += 1
+        if not success:
+            self.error = error
+            self.no_face_streak = self.no_face_streak + 1 if error == FACE_ERROR_NO_FACE else 0
+            if self.no_face_streak >= self.max_no_face_frames:
+                self.match = False
+                self.error = f"No face detected in {self.no_face_streak} consecutive frames"
+            return
+
+        self.no_face_streak = 0
+        self.error = None
+        self.distances.append(distance)
+        if match:
+            self.matched_frames += 1
+        if self.matched_frames >= self.min_matches and self.mean_distance <= self.tolerance:
+            self.match = True
+
+    def result(self) -> dict:
+        """Fields of a VerifyBurstResponse; a burst that ran out of frames does not match."""
+        return {
+            "success": bool(self.distances),
+            "match": bool(self.match),
+            "distance": self.mean_distance,
+            "frames_processed": self.frames_processed,
+            "frames_with_face": len(self.distances),
+            "matched_frames": self.matched_frames,
+            "error": None if self.match else self.error,
+        }
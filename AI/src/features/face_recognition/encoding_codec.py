@@ -0,0 +1,70 @@
+import base64
+import binascii
+import struct
+from typing import List, Union
+import numpy as np
+
+# base64 of: magic "FE", version, dtype code, dim, 2 padding bytes, float32 L2 norm, then the raw little endian vector.
+# The 12 byte header keeps float32 payloads aligned for np.frombuffer.
+ENCODING_MAGIC = b"FE"
+ENCODING_VERSION = 1
+_HEADER = struct.Struct("<2sBBHxxf")
+_DTYPE_CODES = {"f16": 1, "f32": 2}
+_DTYPES = {1: np.dtype("<f2"), 2: np.dtype("<f4")}
+
+# Values of the encoding_format request field; "json" keeps the plain list of floats
+ENCODING_FORMATS = ("json",) + tuple(_DTYPE_CODES)
+
+
+def pack_encoding(embedding, encoding_format: str = "f16") -> str:
+    """Compact base64 form of an embedding (encoding_format "f16" or "f32")."""
+    vector = np.asarray(embedding, dtype=np.float32).ravel()
+    code = _DTYPE_CODES[encoding_format]
+    header = _HEADER.pack(ENCODING_MAGIC, ENCODING_VERSION, code, vector.shape[0], float(np.linalg.norm(vector)))
+    return base64.b64encode(header + vector.astype(_DTYPES[code]).tobytes()).decode("ascii")
+
+
+def unpack_encoding(value: str) -> np.ndarray:
+    """
+    Vector of a pack_encoding string, as a read-only view of the decoded bytes
+    (np.frombuffer, no per element parsing). The header norm is checked so a
+    damaged or truncated encoding is rejected instead of matching nobody.
+    """
+    try:
+        raw = base64.b64decode(value, validate=True)
+    except (binascii.Error, ValueError) as e:
+        raise ValueError(f"Encoding is not valid base64: {e}")
+    if len(raw) < _HEADER.size:
+        raise ValueError("Encoding is too short")
+    magic, version, code, dim, norm = _HEADER.unpack_from(raw)
+    if magic != ENCODING_MAGIC:
+        raise ValueError("Encoding is not a compact face encoding")
+    if version != ENCODING_VERSION:
+        raise ValueError(f"Unsupported encoding version {version}")
+    dtype = _DTYPES.get(code)
+    if dtype is None:
+        raise ValueError(f"Unsupported encoding dtype {code}")
+    if len(raw) != _HEADER.size + dim * dtype.itemsize:
+        raise ValueError("Encoding length does not match its header")
+
+    vector = np.frombuffer(raw, dtype=dtype, count=dim, offset=_HEADER.size)
+    if not np.isclose(np.linalg.norm(vector.astype(np.float32)), norm, rtol=1e-2):
+        raise ValueError("Encoding does not match its norm")
+    return vector
+
+
+def parse_encoding(value: Union[str, List[float], np.ndarray]) -> np.ndarray:
+    """Stored encoding sent by a client, either a list of floats or a pack_encoding string."""
+    if isinstance(value, str):
+        return unpack_encoding(value)
+    vector = np.asarray(value, dtype=np.float32)
+    if vector.ndim != 1 or vector.size == 0:
+        raise ValueError("Encoding must be a non-empty list of numbers")
+    return vector
+
+
+def format_encoding(embedding: np.ndarray, encoding_format: str = "json") -> Union[str, List[float]]:
+    """Encoding as returned to clients: a list of floats, or compact base64 when asked for."""
+    if encoding_format == "json":
+        return embedding.tolist()
+    return pack_encoding(embedding, encoding_format)
@@ -0,0 +1,263 @@
+import fcntl
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from dotenv import dotenv_values
+
+config = dotenv_values(".env")
+
+FACE_GALLERY_PATH = config.get("FACE_GALLERY_PATH", "")
+FACE_GALLERY_INITIAL_CAPACITY = int(config.get("FACE_GALLERY_INITIAL_CAPACITY", 1024))
+# ArcFace embeddings; 128-d face_recognition (dlib) encodings use another metric and are rejected
+FACE_GALLERY_DIM = int(config.get("FACE_GALLERY_DIM", 512))
+FACE_GALLERY_METRIC = "cosine"
+
+FACE_GALLERY_ENABLED = os.path.isabs(FACE_GALLERY_PATH)
+if not FACE_GALLERY_ENABLED:
+    # A relative path lands in the container's working directory and is lost on restart
+    print(f"⚠️ FACE_GALLERY_PATH must be an absolute path on a persistent volume (got {FACE_GALLERY_PATH!r}), the face gallery is disabled")
+
+
+class FaceGallery:
+    """
+    Enrolled face embeddings keyed by user id.
+
+    Embeddings are L2-normalized rows of one float32 matrix memory-mapped
+    from <path>/embeddings*.f32, so identification is a single matmul and
+    the pages are shared by every worker of the node. <path>/index.json
+    maps rows to user ids; it is replaced atomically after the rows are
+    written and reloaded by other processes when it changes. Writers take
+    an flock on <path>/gallery.lock.
+
+    Rows are never rewritten for another user while an index may still
+    point at them: removing a user leaves a tombstone (null in the index),
+    and once tombstones outnumber the live rows the live rows are copied
+    into a new matrix file, so processes still on the old index keep
+    reading the old file.
+    """
+
+    def __init__(
+        self,
+        path: str = FACE_GALLERY_PATH,
+        initial_capacity: int = FACE_GALLERY_INITIAL_CAPACITY,
+        dim: int = FACE_GALLERY_DIM,
+        metric: str = FACE_GALLERY_METRIC,
+    ):
+        if not os.path.isabs(path):
+            raise ValueError(f"FACE_GALLERY_PATH must be an absolute path, got {path!r}")
+        self.path = path
+        self.initial_capacity = max(1, initial_capacity)
+        self.dim = dim
+        self.metric = metric
+        os.makedirs(path, exist_ok=True)
+        self._index_path = os.path.join(path, "index.json")
+        self._lock_path = os.path.join(path, "gallery.lock")
+        self._lock = threading.RLock()
+        self._users: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._dead = np.zeros(0, dtype=np.intp)
+        self._generation = 0
+        self._matrix_name = "embeddings.f32"
+        self._capacity = 0
+        self._matrix: Optional[np.memmap] = None
+        self._index_mtime = None
+
+    # --- storage ---
+
+    def _set_users(self, users: List[Optional[str]]) -> None:
+        self._users = users
+        self._rows = {user_id: row for row, user_id in enumerate(users) if user_id is not None}
+        self._dead = np.array([row for row, user_id in enumerate(users) if user_id is None], dtype=np.intp)
+
+    def _map(self, name: str, capacity: int) -> np.memmap:
+        """Map <path>/name with capacity rows, growing the file (new rows read as zeros) when it is shorter."""
+        matrix_path = os.path.join(self.path, name)
+        with open(matrix_path, "ab") as f:
+            if f.tell() < capacity * self.dim * 4:
+                f.truncate(capacity * self.dim * 4)
+        return np.memmap(matrix_path, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+
+    def _refresh(self) -> None:
+        """Reload the index (and remap the matrix) when another process changed it."""
+        try:
+            mtime = os.stat(self._index_path).st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime == self._index_mtime:
+            return
+        with open(self._index_path, encoding="utf-8") as f:
+            index = json.load(f)
+        dim, metric = index["dim"], index.get("metric", FACE_GALLERY_METRIC)
+        if dim != self.dim or metric != self.metric:
+            raise ValueError(f"The gallery in {self.path} stores {dim}-d {metric} embeddings, expected {self.dim}-d {self.metric}")
+        self._set_users(index["users"])
+        self._generation = index.get("generation", 0)
+        matrix_name = index.get("matrix", "embeddings.f32")
+        if index["capacity"] != self._capacity or matrix_name != self._matrix_name or self._matrix is None:
+            self._capacity = index["capacity"]
+            self._matrix_name = matrix_name
+            self._matrix = self._map(matrix_name, self._capacity)
+        self._index_mtime = mtime
+
+    def _write_index(self) -> None:
+        self._matrix.flush()
+        tmp_path = self._index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "dim": self.dim,
+                    "metric": self.metric,
+                    "capacity": self._capacity,
+                    "generation": self._generation,
+                    "matrix": self._matrix_name,
+                    "users": self._users,
+                },
+                f,
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._index_path)
+        self._index_mtime = os.stat(self._index_path).st_mtime_ns
+
+    def _ensure_capacity(self, rows: int) -> None:
+        if self._matrix is not None and rows <= self._capacity:
+            return
+        capacity = max(self.initial_capacity, self._capacity)
+        while capacity < rows:
+            capacity *= 2
+        if self._matrix is not None:
+            self._matrix.flush()
+            self._matrix = None
+        # Growing the file keeps existing rows in place
+        self._matrix = self._map(self._matrix_name, capacity)
+        self._capacity = capacity
+
+    def _compact(self) -> None:
+        """Copy the live rows into a new matrix file and point the index at it."""
+        live = [row for row, user_id in enumerate(self._users) if user_id is not None]
+        capacity = self.initial_capacity
+        while capacity < len(live):
+            capacity *= 2
+        previous = self._matrix_name
+        self._generation += 1
+        name = f"embeddings.{self._generation}.f32"
+        matrix = self._map(name, capacity)
+        matrix[:len(live)] = self._matrix[live]
+        self._matrix.flush()
+        self._matrix = matrix
+        self._matrix_name = name
+        self._capacity = capacity
+        self._set_users([self._users[row] for row in live])
+        self._write_index()
+        # Mappings of processes still on the previous file stay valid, older files are unused
+        for entry in os.listdir(self.path):
+            if entry.startswith("embeddings") and entry.endswith(".f32") and entry not in (name, previous):
+                os.remove(os.path.join(self.path, entry))
+
+    @contextmanager
+    def _writing(self):
+        with self._lock, open(self._lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                self._refresh()
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _normalize(embedding) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        if not np.isfinite(norm) or norm == 0:
+            raise ValueError("Encoding must be a non-zero vector")
+        return vector / norm
+
+    def _vector(self, embedding, metric: str) -> np.ndarray:
+        """Normalized embedding, rejected unless it has the gallery's dimension and metric."""
+        if metric != self.metric:
+            raise ValueError(f"The gallery stores {self.metric} embeddings, got a {metric} encoding")
+        vector = self._normalize(embedding)
+        if vector.shape[0] != self.dim:
+            raise ValueError(f"Encoding has {vector.shape[0]} dimensions, the gallery stores {self.dim}")
+        return vector
+
+    # --- operations ---
+
+    def enroll(self, user_id: str, embedding, metric: str = FACE_GALLERY_METRIC) -> None:
+        """Add or replace the embedding of user_id."""
+        vector = self._vector(embedding, metric)
+        with self._writing():
+            row = self._rows.get(user_id)
+            if row is None:
+                if len(self._users) >= self._capacity and len(self._rows) < len(self._users):
+                    self._compact()
+                row = len(self._users)
+                self._ensure_capacity(row + 1)
+                self._set_users(self._users + [user_id])
+            self._matrix[row] = vector
+            self._write_index()
+
+    def remove(self, user_id: str) -> bool:
+        with self._writing():
+            row = self._rows.get(user_id)
+            if row is None:
+                return False
+            users = list(self._users)
+            users[row] = None
+            self._set_users(users)
+            if len(self._dead) > len(self._rows):
+                self._compact()
+            else:
+                self._write_index()
+            return True
+
+    def get(self, user_id: str) -> Optional[np.ndarray]:
+        """Normalized embedding of user_id (a view on the memmap), or None."""
+        with self._lock:
+            self._refresh()
+            row = self._rows.get(user_id)
+            return None if row is None else self._matrix[row]
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._rows)
+
+    def verify(self, user_id: str, embedding, metric: str = FACE_GALLERY_METRIC) -> Optional[float]:
+        """Cosine distance between embedding and the enrolled user, None if the user is not enrolled."""
+        vector = self._vector(embedding, metric)
+        with self._lock:
+            stored = self.get(user_id)
+            if stored is None:
+                return None
+            return float(1.0 - np.dot(stored, vector))
+
+    def identify(self, embedding, top_k: int = 5, metric: str = FACE_GALLERY_METRIC) -> List[Tuple[str, float]]:
+        """The top_k enrolled users closest to embedding, as (user_id, cosine distance)."""
+        vector = self._vector(embedding, metric)
+        with self._lock:
+            self._refresh()
+            if not self._rows:
+                return []
+            similarities = self._matrix[:len(self._users)] @ vector
+            similarities[self._dead] = -np.inf
+            k = min(max(1, top_k), len(self._rows))
+            best = np.argpartition(-similarities, k - 1)[:k]
+            best = best[np.argsort(-similarities[best])]
+            return [(self._users[row], float(1.0 - similarities[row])) for row in best]
+
+
+_gallery: Optional[FaceGallery] = None
+_gallery_lock = threading.Lock()
+
+
+def get_face_gallery() -> FaceGallery:
+    """The node's gallery; ValueError when FACE_GALLERY_PATH is not an absolute path."""
+    global _gallery
+    with _gallery_lock:
+        if _gallery is None:
+            _gallery = FaceGallery()
+        return _gallery
@@ -0,0 +1,90 @@
+import threading
+from typing import Optional
+import cv2
+import numpy as np
+from dotenv import dotenv_values
+
+config = dotenv_values(".env")
+
+# Check each detected face before it is embedded, unusable frames are rejected with a reason code
+FACE_QUALITY_GATE = str(config.get("FACE_QUALITY_GATE", "true")).lower() in ("1", "true", "yes")
+FACE_QUALITY_MIN_DET_SCORE = float(config.get("FACE_QUALITY_MIN_DET_SCORE", 0.6))
+# Shorter box side, in pixels of the decoded image
+FACE_QUALITY_MIN_FACE_SIZE = int(config.get("FACE_QUALITY_MIN_FACE_SIZE", 40))
+# Variance of the Laplacian of the face resized to 112x112 grayscale
+FACE_QUALITY_MIN_SHARPNESS = float(config.get("FACE_QUALITY_MIN_SHARPNESS", 25))
+# Mean gray level of the face
+FACE_QUALITY_MIN_BRIGHTNESS = float(config.get("FACE_QUALITY_MIN_BRIGHTNESS", 35))
+FACE_QUALITY_MAX_BRIGHTNESS = float(config.get("FACE_QUALITY_MAX_BRIGHTNESS", 230))
+# Nose offset from the eye midpoint over the eye distance (yaw), and from the
+# eye-mouth midpoint over the eye-mouth distance (pitch); both are ~0 for a frontal face
+FACE_QUALITY_MAX_YAW = float(config.get("FACE_QUALITY_MAX_YAW", 0.45))
+FACE_QUALITY_MAX_PITCH = float(config.get("FACE_QUALITY_MAX_PITCH", 0.25))
+
+# Reason code -> hint sent back to the client
+QUALITY_REASONS = {
+    "low_detection_score": "the face is not clearly visible",
+    "face_too_small": "move closer to the camera",
+    "extreme_pose": "look straight at the camera",
+    "too_dark": "the face is too dark, add light",
+    "too_bright": "the face is overexposed",
+    "blurry": "the image is blurry, hold the camera still",
+}
+
+_stats = {"checked": 0, "rejected": {reason: 0 for reason in QUALITY_REASONS}}
+_stats_lock = threading.Lock()
+
+
+def _pose(kps: np.ndarray):
+    """(yaw, pitch) proxies from the 5 SCRFD landmarks: eyes, nose, mouth corners."""
+    left_eye, right_eye, nose, left_mouth, right_mouth = np.asarray(kps, dtype=np.float32)[:5]
+    eyes = (left_eye + right_eye) / 2
+    mouth = (left_mouth + right_mouth) / 2
+    eye_distance = np.linalg.norm(right_eye - left_eye)
+    eye_mouth = mouth[1] - eyes[1]
+    if eye_distance <= 0 or eye_mouth <= 0:
+        return np.inf, np.inf
+    return abs(nose[0] - eyes[0]) / eye_distance, abs((nose[1] - eyes[1]) / eye_mouth - 0.5)
+
+
+def assess_face_quality(image: np.ndarray, face) -> Optional[str]:
+    """Reason code the face should not be embedded for, or None; the cheapest checks run first."""
+    if face.det_score is not None and float(face.det_score) < FACE_QUALITY_MIN_DET_SCORE:
+        return "low_detection_score"
+
+    h, w = image.shape[:2]
+    x1, y1 = max(0, int(face.bbox[0])), max(0, int(face.bbox[1]))
+    x2, y2 = min(w, int(face.bbox[2])), min(h, int(face.bbox[3]))
+    if min(x2 - x1, y2 - y1) < FACE_QUALITY_MIN_FACE_SIZE:
+        return "face_too_small"
+
+    if face.kps is not None:
+        yaw, pitch = _pose(face.kps)
+        if yaw > FACE_QUALITY_MAX_YAW or pitch > FACE_QUALITY_MAX_PITCH:
+            return "extreme_pose"
+
+    gray = cv2.cvtColor(cv2.resize(image[y1:y2, x1:x2], (112, 112), interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY)
+    brightness = float(gray.mean())
+    if brightness < FACE_QUALITY_MIN_BRIGHTNESS:
+        return "too_dark"
+    if brightness > FACE_QUALITY_MAX_BRIGHTNESS:
+        return "too_bright"
+    if float(cv2.Laplacian(gray, cv2.CV_32F).var()) < FACE_QUALITY_MIN_SHARPNESS:
+        return "blurry"
+    return None
+
+
+def quality_error(reason: str) -> str:
+    return f"Face quality too low [{reason}]: {QUALITY_REASONS.get(reason, reason)}"
+
+
+def record_quality(reason: Optional[str]) -> None:
+    with _stats_lock:
+        _stats["checked"] += 1
+        if reason:
+            _stats["rejected"][reason] = _stats["rejected"].get(reason, 0) + 1
+
+
+def quality_stats() -> dict:
+    with _stats_lock:
+        return {"enabled": FACE_QUALITY_GATE, "checked": _stats["checked"], "rejected": dict(_stats["rejected"])}
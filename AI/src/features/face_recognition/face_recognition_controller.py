@@ -1,17 +1,158 @@
-from fastapi import APIRouter, HTTPException
+import asyncio
+import json
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Request, WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
 from src.constant.FaceRecognitionType import (
     EncodeFaceRequest,
     EncodeFaceResponse,
     VerifyFaceRequest,
     VerifyFaceResponse,
     DetectFaceRequest,
-    DetectFaceResponse
+    DetectFaceResponse,
+    EncodeFaceBatchRequest,
+    EncodeFaceBatchResponse,
+    VerifyFaceBatchRequest,
+    VerifyFaceBatchResponse,
+    DetectFaceBatchRequest,
+    DetectFaceBatchResponse,
+    GalleryEnrollRequest,
+    GalleryEnrollResponse,
+    VerifyUserFaceRequest,
+    IdentifyFaceRequest,
+    IdentifyMatch,
+    IdentifyFaceResponse,
+    VerifyBurstRequest,
+    VerifyBurstResponse,
+    ProctorSetup,
+    ProctorFrame
 )
-from src.features.face_recognition.face_recognition_service import FaceRecognitionService
+from src.features.face_recognition.burst_verification import BurstVerification
+from src.features.face_recognition.encoding_codec import ENCODING_FORMATS, parse_encoding
+from src.features.face_recognition.face_gallery import FACE_GALLERY_ENABLED, get_face_gallery
+from src.features.face_recognition.face_quality import quality_stats
+from src.features.face_recognition.proctoring import ProctoringSession, proctoring_stats, FACE_PROCTOR_MAX_IMAGE_SIDE
+from src.features.face_recognition.face_recognition_service import (
+    FaceRecognitionService,
+    FaceEmbedding,
+    FacePipeline,
+    FACE_BATCH_MAX_ITEMS,
+    FACE_BURST_MAX_FRAMES,
+    FACE_MICRO_BATCHING,
+    FACE_MICRO_BATCH_SIZE,
+    FACE_MICRO_BATCH_WAIT_MS,
+    FACE_WORKER_THREADS,
+    FACE_MAX_QUEUED,
+    FACE_RETRY_AFTER_SECONDS,
+)
+from src.utils.micro_batcher import MicroBatcher
+from src.utils.worker_pool import BoundedWorkerPool
 
 router = APIRouter()
 
-@router.post("/encode", response_model=EncodeFaceResponse)
+# Inference, decoding and gallery IO run here instead of on the event loop
+face_pool = BoundedWorkerPool(FACE_WORKER_THREADS, FACE_MAX_QUEUED, name="face")
+
+# ArcFace crops of concurrent single image requests, embedded as one batch;
+# each request detects its own face on the pool first (FacePipeline.prepare)
+recognition_batcher = MicroBatcher(
+    FacePipeline.embed_crops,
+    max_batch_size=FACE_MICRO_BATCH_SIZE,
+    max_wait_ms=FACE_MICRO_BATCH_WAIT_MS,
+    name="face recognition",
+    runner=face_pool.run,
+    max_in_flight=FACE_WORKER_THREADS,
+)
+
+async def face_slot():
+    """Admit the request into the face pool or answer 503 right away when it is saturated."""
+    if not face_pool.try_acquire():
+        raise HTTPException(
+            status_code=503,
+            detail="Face recognition is at capacity, retry shortly",
+            headers={"Retry-After": str(FACE_RETRY_AFTER_SECONDS)},
+        )
+    try:
+        yield
+    finally:
+        face_pool.release()
+
+# OpenAPI body of the upload endpoints, which read the request themselves to avoid copies
+IMAGE_UPLOAD_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/octet-stream": {"schema": {"type": "string", "format": "binary"}},
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {"image": {"type": "string", "format": "binary"}},
+                    "required": ["image"],
+                }
+            },
+        },
+    }
+}
+
+def check_batch_size(count: int) -> None:
+    if count == 0:
+        raise HTTPException(status_code=400, detail="Batch is empty")
+    if count > FACE_BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Batch of {count} items exceeds the limit of {FACE_BATCH_MAX_ITEMS}")
+
+async def read_image_upload(request: Request) -> Tuple[bytes, Dict[str, str]]:
+    """
+    Image bytes and the other parameters of an upload request.
+
+    multipart/form-data: the image is the `image` file field, parameters are
+    the other form fields. application/octet-stream: the body is the image,
+    parameters come from the query string.
+    """
+    if request.headers.get("content-type", "").startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("image")
+        if upload is None or isinstance(upload, str):
+            raise HTTPException(status_code=400, detail="Missing 'image' file field")
+        data = await upload.read()
+        fields = {key: value for key, value in form.items() if isinstance(value, str)}
+    else:
+        data = await request.body()
+        fields = dict(request.query_params)
+    if not data:
+        raise HTTPException(status_code=400, detail="Empty image")
+    return data, fields
+
+def gallery_reference(user_id: str) -> Optional[np.ndarray]:
+    """Copy of an enrolled embedding for a long-lived session; the gallery row is a memmap view that enroll/remove rewrite."""
+    row = get_face_gallery().get(user_id)
+    return None if row is None else np.array(row, copy=True)
+
+async def embed_batched(image: np.ndarray) -> FaceEmbedding:
+    """FacePipeline.embed with the detection on the pool and the ArcFace call shared with concurrent requests."""
+    prepared = await face_pool.run(FacePipeline.prepare, image)
+    if isinstance(prepared, FaceEmbedding):
+        return prepared
+    return await recognition_batcher.submit(prepared)
+
+async def embed_image(image: np.ndarray) -> FaceEmbedding:
+    """FacePipeline.embed on the pool, through the micro-batcher when it is enabled."""
+    if FACE_MICRO_BATCHING:
+        return await embed_batched(image)
+    return await face_pool.run(FacePipeline.embed, image)
+
+async def encode_image(image: np.ndarray, encoding_format: str = "json") -> Tuple[bool, Optional[Union[str, List[float]]], Optional[str]]:
+    if FACE_MICRO_BATCHING:
+        return FaceRecognitionService.encode_result(await embed_batched(image), encoding_format)
+    return await face_pool.run(FaceRecognitionService.encode_face_image, image, encoding_format)
+
+async def verify_image(image: np.ndarray, stored_encoding: Union[str, List[float]], tolerance: float) -> Tuple[bool, bool, Optional[float], Optional[str]]:
+    if FACE_MICRO_BATCHING:
+        outcome = await embed_batched(image)
+        return FaceRecognitionService.verify_result(outcome, stored_encoding, tolerance)
+    return await face_pool.run(FaceRecognitionService.verify_face_image, image, stored_encoding, tolerance)
+
+@router.post("/encode", response_model=EncodeFaceResponse, dependencies=[Depends(face_slot)])
 async def encode_face(request: EncodeFaceRequest):
     """
     Encode face from image
@@ -19,7 +160,11 @@ async def encode_face(request: EncodeFaceRequest):
     Returns face encoding vector (128 dimensions) that can be stored and used for verification
     """
     try:
-        success, encoding, error = FaceRecognitionService.encode_face(request.image_base64)
+        try:
+            image, _ = await face_pool.run(FaceRecognitionService.decode_base64_image, request.image_base64)
+        except ValueError as e:
+            return EncodeFaceResponse(success=False, encoding=None, error=str(e))
+        success, encoding, error = await encode_image(image, request.encoding_format)
         
         if success:
             return EncodeFaceResponse(
@@ -36,7 +181,7 @@ async def encode_face(request: EncodeFaceRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
-@router.post("/verify", response_model=VerifyFaceResponse)
+@router.post("/verify", response_model=VerifyFaceResponse, dependencies=[Depends(face_slot)])
 async def verify_face(request: VerifyFaceRequest):
     """
     Verify face image against stored encoding
@@ -44,8 +189,12 @@ async def verify_face(request: VerifyFaceRequest):
     Returns match result with distance metric
     """
     try:
-        success, match, distance, error = FaceRecognitionService.verify_face(
-            request.image_base64,
+        try:
+            image, _ = await face_pool.run(FaceRecognitionService.decode_base64_image, request.image_base64)
+        except ValueError as e:
+            return VerifyFaceResponse(success=False, match=False, distance=None, error=str(e))
+        success, match, distance, error = await verify_image(
+            image,
             request.encoding,
             request.tolerance
         )
@@ -67,7 +216,39 @@ async def verify_face(request: VerifyFaceRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
-@router.post("/detect", response_model=DetectFaceResponse)
+@router.post("/verify-burst", response_model=VerifyBurstResponse, dependencies=[Depends(face_slot)])
+async def verify_burst(request: VerifyBurstRequest):
+    """
+    Verify a short burst of webcam frames against a stored encoding
+
+    Frames are checked in order and the rest are skipped as soon as the
+    burst is accepted (min_matches matching frames) or rejected
+    (max_no_face_frames consecutive frames without a face).
+    """
+    if not request.frames_base64:
+        raise HTTPException(status_code=400, detail="Burst is empty")
+    if len(request.frames_base64) > FACE_BURST_MAX_FRAMES:
+        raise HTTPException(status_code=413, detail=f"Burst of {len(request.frames_base64)} frames exceeds the limit of {FACE_BURST_MAX_FRAMES}")
+    try:
+        burst = BurstVerification(
+            request.tolerance,
+            min(request.min_matches, len(request.frames_base64)),
+            request.max_no_face_frames
+        )
+        for frame_base64 in request.frames_base64:
+            try:
+                image, _ = await face_pool.run(FaceRecognitionService.decode_base64_image, frame_base64)
+            except ValueError as e:
+                burst.add((False, False, None, str(e)))
+            else:
+                burst.add(await verify_image(image, request.encoding, request.tolerance))
+            if burst.decided:
+                break
+        return VerifyBurstResponse(**burst.result())
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@router.post("/detect", response_model=DetectFaceResponse, dependencies=[Depends(face_slot)])
 async def detect_faces(request: DetectFaceRequest):
     """
     Detect faces in image and return bounding boxes
@@ -75,7 +256,7 @@ async def detect_faces(request: DetectFaceRequest):
     Returns list of face bounding boxes with coordinates
     """
     try:
-        success, faces, error = FaceRecognitionService.detect_faces(request.image_base64)
+        success, faces, error = await face_pool.run(FaceRecognitionService.detect_faces, request.image_base64)
         
         if success:
             return DetectFaceResponse(
@@ -94,3 +275,312 @@ async def detect_faces(request: DetectFaceRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+@router.post("/encode-file", response_model=EncodeFaceResponse, openapi_extra=IMAGE_UPLOAD_BODY, dependencies=[Depends(face_slot)])
+async def encode_face_file(request: Request):
+    """
+    /encode for a raw image (multipart `image` field or application/octet-stream body); `encoding_format` is a form field or query parameter
+    """
+    data, fields = await read_image_upload(request)
+    encoding_format = fields.get("encoding_format", "json")
+    if encoding_format not in ENCODING_FORMATS:
+        raise HTTPException(status_code=400, detail=f"'encoding_format' must be one of {', '.join(ENCODING_FORMATS)}")
+    try:
+        try:
+            image, _ = await face_pool.run(FaceRecognitionService.decode_image_bytes, data)
+        except ValueError as e:
+            return EncodeFaceResponse(success=False, encoding=None, error=str(e))
+        success, encoding, error = await encode_image(image, encoding_format)
+        return EncodeFaceResponse(success=success, encoding=encoding if success else None, error=error)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@router.post("/verify-file", response_model=VerifyFaceResponse, openapi_extra=IMAGE_UPLOAD_BODY, dependencies=[Depends(face_slot)])
+async def verify_face_file(request: Request):
+    """
+    /verify for a raw image; `encoding` (JSON array or compact encoding) and `tolerance` are form fields or query parameters
+    """
+    data, fields = await read_image_upload(request)
+    try:
+        encoding = fields["encoding"].strip()
+        if encoding.startswith("["):
+            encoding = json.loads(encoding)
+        tolerance = float(fields.get("tolerance", 0.6))
+    except (KeyError, ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="'encoding' (JSON array or compact encoding) is required and 'tolerance' must be a number")
+    try:
+        try:
+            image, _ = await face_pool.run(FaceRecognitionService.decode_image_bytes, data)
+        except ValueError as e:
+            return VerifyFaceResponse(success=False, match=False, distance=None, error=str(e))
+        success, match, distance, error = await verify_image(image, encoding, tolerance)
+        return VerifyFaceResponse(success=success, match=match if success else False, distance=distance if success else None, error=error)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@router.post("/detect-file", response_model=DetectFaceResponse, openapi_extra=IMAGE_UPLOAD_BODY, dependencies=[Depends(face_slot)])
+async def detect_faces_file(request: Request):
+    """
+    /detect for a raw image (multipart `image` field or application/octet-stream body)
+    """
+    data, _ = await read_image_upload(request)
+    try:
+        success, faces, error = await face_pool.run(FaceRecognitionService.detect_faces_bytes, data)
+        return DetectFaceResponse(success=success, faces=faces if success else [], face_count=len(faces) if success else 0, error=error)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@router.post("/encode-batch", response_model=EncodeFaceBatchResponse, dependencies=[Depends(face_slot)])
+async def encode_face_batch(request: EncodeFaceBatchRequest):
+    """
+    Encode one face per image for many images (e.g. enrolling a whole class)
+
+    All face crops go through the recognition model in batched calls; errors are reported per image
+    """
+    check_batch_size(len(request.images_base64))
+    try:
+        results = await face_pool.run(FaceRecognitionService.encode_faces_batch, request.images_base64, request.encoding_format)
+        return EncodeFaceBatchResponse(
+            success=True,
+            results=[
+                EncodeFaceResponse(success=success, encoding=encoding if success else None, error=error)
+                for success, encoding, error in results
+            ],
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@router.post("/verify-batch", response_model=VerifyFaceBatchResponse, dependencies=[Depends(face_slot)])
+async def verify_face_batch(request: VerifyFaceBatchRequest):
+    """
+    Verify many images, each against its own stored encoding
+    """
+    check_batch_size(len(request.items))
+    try:
+        results = await face_pool.run(
+            FaceRecognitionService.verify_faces_batch,
+            [(item.image_base64, item.encoding, item.tolerance) for item in request.items]
+        )
+        return VerifyFaceBatchResponse(
+            success=True,
+            results=[
+                VerifyFaceResponse(success=success, match=match if success else False, distance=distance if success else None, error=error)
+                for success, match, distance, error in results
+            ],
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@router.post("/detect-batch", response_model=DetectFaceBatchResponse, dependencies=[Depends(face_slot)])
+async def detect_faces_batch(request: DetectFaceBatchRequest):
+    """
+    Detect faces in many images
+    """
+    check_batch_size(len(request.images_base64))
+    try:
+        results = await face_pool.run(FaceRecognitionService.detect_faces_batch, request.images_base64)
+        return DetectFaceBatchResponse(
+            success=True,
+            results=[
+                DetectFaceResponse(success=success, faces=faces if success else [], face_count=len(faces) if success else 0, error=error)
+                for success, faces, error in results
+            ],
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@router.post("/gallery/enroll", response_model=GalleryEnrollResponse, dependencies=[Depends(face_slot)])
+async def enroll_face(request: GalleryEnrollRequest):
+    """
+    Enroll (or re-enroll) a user's face in the server-side gallery
+
+    Takes an image, or an encoding previously returned by /encode
+    """
+    try:
+        if request.image_base64:
+            try:
+                image, _ = await face_pool.run(FaceRecognitionService.decode_base64_image, request.image_base64)
+            except ValueError as e:
+                return GalleryEnrollResponse(success=False, user_id=request.user_id, error=str(e))
+            outcome = await embed_image(image)
+            if outcome.error:
+                return GalleryEnrollResponse(success=False, user_id=request.user_id, error=outcome.error)
+            encoding, metric = outcome.embedding, outcome.metric
+        elif request.encoding:
+            # Client encodings carry no metric; the dimension check rejects dlib encodings
+            encoding, metric = request.encoding, "cosine"
+        else:
+            raise HTTPException(status_code=400, detail="image_base64 or encoding is required")
+
+        try:
+            gallery = get_face_gallery()
+            await face_pool.run(gallery.enroll, request.user_id, parse_encoding(encoding), metric)
+        except ValueError as e:
+            return GalleryEnrollResponse(success=False, user_id=request.user_id, error=str(e))
+        return GalleryEnrollResponse(success=True, user_id=request.user_id, gallery_size=len(gallery))
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@router.delete("/gallery/{user_id}", response_model=GalleryEnrollResponse, dependencies=[Depends(face_slot)])
+async def remove_face(user_id: str):
+    """
+    Remove a user from the gallery
+    """
+    try:
+        gallery = get_face_gallery()
+    except ValueError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    removed = await face_pool.run(gallery.remove, user_id)
+    if not removed:
+        raise HTTPException(status_code=404, detail=f"User {user_id} is not enrolled")
+    return GalleryEnrollResponse(success=True, user_id=user_id, gallery_size=len(gallery))
+
+@router.post("/verify-user", response_model=VerifyFaceResponse, dependencies=[Depends(face_slot)])
+async def verify_user_face(request: VerifyUserFaceRequest):
+    """
+    Verify face image against the enrolled face of user_id (no encoding sent over the wire)
+    """
+    try:
+        try:
+            image, _ = await face_pool.run(FaceRecognitionService.decode_base64_image, request.image_base64)
+        except ValueError as e:
+            return VerifyFaceResponse(success=False, error=str(e))
+        outcome = await embed_image(image)
+        if outcome.error:
+            return VerifyFaceResponse(success=False, error=outcome.error)
+        try:
+            distance = await face_pool.run(get_face_gallery().verify, request.user_id, outcome.embedding, outcome.metric)
+        except ValueError as e:
+            return VerifyFaceResponse(success=False, error=str(e))
+        if distance is None:
+            return VerifyFaceResponse(success=False, error=f"User {request.user_id} is not enrolled")
+        return VerifyFaceResponse(success=True, match=distance <= request.tolerance, distance=distance)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@router.post("/identify", response_model=IdentifyFaceResponse, dependencies=[Depends(face_slot)])
+async def identify_face(request: IdentifyFaceRequest):
+    """
+    Find the enrolled users closest to the face in the image (1:N search)
+    """
+    try:
+        try:
+            image, _ = await face_pool.run(FaceRecognitionService.decode_base64_image, request.image_base64)
+        except ValueError as e:
+            return IdentifyFaceResponse(success=False, error=str(e))
+        outcome = await embed_image(image)
+        if outcome.error:
+            return IdentifyFaceResponse(success=False, error=outcome.error)
+        try:
+            candidates = await face_pool.run(get_face_gallery().identify, outcome.embedding, request.top_k, outcome.metric)
+        except ValueError as e:
+            return IdentifyFaceResponse(success=False, error=str(e))
+        return IdentifyFaceResponse(
+            success=True,
+            matches=[
+                IdentifyMatch(user_id=user_id, distance=distance, match=distance <= request.tolerance)
+                for user_id, distance in candidates
+            ],
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+def message_error(error: Exception) -> str:
+    """One line description of a bad websocket message, pydantic errors without their docs links."""
+    if isinstance(error, ValidationError):
+        return "; ".join(f"{'.'.join(map(str, e['loc'])) or 'message'}: {e['msg']}" for e in error.errors())
+    return str(error)
+
+async def reject_setup(websocket: WebSocket, error: str, code: int = 1008) -> None:
+    """Tell the client why its setup was refused, then close (close reasons are capped at 123 bytes)."""
+    await websocket.send_json({"error": error})
+    await websocket.close(code=code, reason="Invalid proctoring setup")
+
+@router.websocket("/proctor")
+async def proctor(websocket: WebSocket):
+    """
+    Proctoring stream: detect-then-track over a sequence of webcam frames
+
+    The first message is JSON with the reference face, either
+    {"user_id": ...} (gallery) or {"encoding": ...} (list or compact), plus "tolerance";
+    {} only tracks. An invalid setup is answered with {"error": ...} and the
+    socket is closed (1008). Every following message is a frame, as binary image
+    bytes or JSON {"image_base64": ...}, and gets one JSON result back;
+    a frame that cannot be read gets {"frame": null, "error": ...} and the
+    session goes on. Frames arriving while the face pool is saturated are
+    answered with {"error": "busy"} and skipped.
+    """
+    await websocket.accept()
+    session = None
+    try:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+        if message.get("text") is None:
+            await reject_setup(websocket, "The setup message must be JSON text", code=1003)
+            return
+        try:
+            setup = ProctorSetup.model_validate_json(message["text"])
+        except ValidationError as e:
+            await reject_setup(websocket, f"Invalid setup: {message_error(e)}")
+            return
+
+        reference = None
+        if setup.user_id:
+            try:
+                reference = await face_pool.run(gallery_reference, setup.user_id)
+            except ValueError as e:
+                await reject_setup(websocket, str(e), code=1011)
+                return
+            if reference is None:
+                await reject_setup(websocket, f"User {setup.user_id} is not enrolled")
+                return
+        elif setup.encoding:
+            try:
+                reference = parse_encoding(setup.encoding)
+            except ValueError as e:
+                await reject_setup(websocket, f"Invalid encoding: {e}")
+                return
+        session = ProctoringSession(reference, setup.tolerance)
+        await websocket.send_json({"ready": True})
+
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            if not face_pool.try_acquire():
+                await websocket.send_json({"frame": None, "error": "busy", "retry_after": FACE_RETRY_AFTER_SECONDS})
+                continue
+            try:
+                try:
+                    if message.get("bytes") is not None:
+                        image, scale = await face_pool.run(FaceRecognitionService.decode_image_bytes, message["bytes"], FACE_PROCTOR_MAX_IMAGE_SIDE)
+                    else:
+                        frame = ProctorFrame.model_validate_json(message.get("text") or "")
+                        image, scale = await face_pool.run(FaceRecognitionService.decode_base64_image, frame.image_base64, FACE_PROCTOR_MAX_IMAGE_SIDE)
+                except ValueError as e:
+                    # Includes ValidationError: the frame is skipped, the session stays open
+                    await websocket.send_json({"frame": None, "error": message_error(e)})
+                    continue
+                await websocket.send_json(await face_pool.run(session.process, image, scale))
+            finally:
+                face_pool.release()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        if session is not None:
+            session.close()
+
+@router.get("/stats")
+async def face_stats():
+    """
+    Worker pool queue depth, micro-batching, gallery, proctoring and quality gate counters
+    """
+    return {
+        "pool": face_pool.stats(),
+        "micro_batching": recognition_batcher.stats() if FACE_MICRO_BATCHING else None,
+        "gallery_size": len(get_face_gallery()) if FACE_GALLERY_ENABLED else None,
+        "proctoring": proctoring_stats(),
+        "quality": quality_stats(),
+    }
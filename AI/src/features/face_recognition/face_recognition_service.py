@@ -3,7 +3,47 @@ import base64
 from io import BytesIO
 from PIL import Image
 import cv2
-from typing import List, Tuple, Optional
+from typing import List, NamedTuple, Tuple, Optional, Union
+import os
+import threading
+import time
+from src.config.readiness import mark_loaded, mark_failed
+from src.config.inference_sidecar import INFERENCE_SIDECAR_SOCKET
+from src.features.face_recognition.encoding_codec import format_encoding, parse_encoding
+from src.features.face_recognition.face_quality import FACE_QUALITY_GATE, quality_error, record_quality
+from dotenv import dotenv_values
+
+config = dotenv_values(".env")
+
+# Longest side uploads are decoded to: detection only sees FACE_DET_SIZE, the rest keeps detail for the aligned crops
+FACE_MAX_IMAGE_SIDE = int(config.get("FACE_MAX_IMAGE_SIDE", 1280))
+# Uploads with more pixels than this (read from the header) are rejected before decoding
+FACE_MAX_IMAGE_PIXELS = int(config.get("FACE_MAX_IMAGE_PIXELS", 40_000_000))
+# Largest SCRFD input side, smaller images are detected at their own size
+FACE_DET_SIZE = int(config.get("FACE_DET_SIZE", 640))
+# Most images accepted by one batch request
+FACE_BATCH_MAX_ITEMS = int(config.get("FACE_BATCH_MAX_ITEMS", 64))
+# Most frames accepted by one /verify-burst request
+FACE_BURST_MAX_FRAMES = int(config.get("FACE_BURST_MAX_FRAMES", 10))
+# Face crops sent to the recognition model in one ONNX call
+FACE_REC_BATCH_SIZE = int(config.get("FACE_REC_BATCH_SIZE", 32))
+# Concurrent /encode and /verify requests share recognition batches
+FACE_MICRO_BATCHING = str(config.get("FACE_MICRO_BATCHING", "true")).lower() in ("1", "true", "yes")
+FACE_MICRO_BATCH_SIZE = int(config.get("FACE_MICRO_BATCH_SIZE", 16))
+FACE_MICRO_BATCH_WAIT_MS = float(config.get("FACE_MICRO_BATCH_WAIT_MS", 2))
+# Threads running face work; requests beyond threads + FACE_MAX_QUEUED get a 503
+FACE_WORKER_THREADS = int(config.get("FACE_WORKER_THREADS", os.cpu_count() or 1))
+FACE_MAX_QUEUED = int(config.get("FACE_MAX_QUEUED", 2 * FACE_WORKER_THREADS))
+FACE_RETRY_AFTER_SECONDS = int(config.get("FACE_RETRY_AFTER_SECONDS", 1))
+# One InsightFace instance per worker thread instead of one shared by all of them
+FACE_ENGINE_PER_WORKER = str(config.get("FACE_ENGINE_PER_WORKER", "false")).lower() in ("1", "true", "yes")
+# Model pack downloaded by insightface, and optional replacements (e.g. int8 models from benchmarks/quantize_face_models.py)
+FACE_MODEL_PACK = config.get("FACE_MODEL_PACK", "buffalo_l")
+FACE_DET_MODEL_PATH = config.get("FACE_DET_MODEL_PATH")
+FACE_REC_MODEL_PATH = config.get("FACE_REC_MODEL_PATH")
+
+# JPEGs are scaled down by the DCT while decoding, other formats are decoded then resized
+_REDUCED_DECODE_FLAGS = ((8, cv2.IMREAD_REDUCED_COLOR_8), (4, cv2.IMREAD_REDUCED_COLOR_4), (2, cv2.IMREAD_REDUCED_COLOR_2))
 
 # Optional imports - lazy loading to avoid GLIBCXX issues
 INSIGHTFACE_AVAILABLE = False
@@ -47,51 +87,361 @@ def _import_face_recognition():
         FACE_RECOGNITION_AVAILABLE = False
         return False
 
+# InsightFace models each engine runs; the full buffalo_l pack also has 2D/3D landmarks and gender/age
+FACE_ENGINE_MODULES = {
+    "detection": ["detection"],
+    "recognition": ["detection", "recognition"],
+}
+
+# File of each model inside the buffalo_l pack
+PACK_MODEL_FILES = {
+    "detection": "det_10g.onnx",
+    "recognition": "w600k_r50.onnx",
+}
+
+class FaceEngine:
+    """
+    The part of insightface's FaceAnalysis used here (models, det_model, get).
+
+    FaceAnalysis cannot pass SessionOptions to its models, so the sessions
+    are created here with the per-model settings of onnx_session.
+    """
+
+    def __init__(self, models: dict):
+        self.models = models
+        self.det_model = models['detection']
+
+    def get(self, image: np.ndarray) -> List:
+        return analyze_faces(self, image)
+
+def pack_model_path(task: str) -> str:
+    """Model of the insightface pack, downloaded on first use."""
+    from insightface.utils.storage import ensure_available
+    return os.path.join(ensure_available('models', FACE_MODEL_PACK, root='~/.insightface'), PACK_MODEL_FILES[task])
+
+def face_model_path(task: str) -> str:
+    override = {"detection": FACE_DET_MODEL_PATH, "recognition": FACE_REC_MODEL_PATH}[task]
+    return override or pack_model_path(task)
+
+def load_face_analysis(engine: str = "recognition", model_paths: Optional[dict] = None) -> FaceEngine:
+    """Build and prepare an InsightFace engine with only the models `engine` needs; model_paths overrides files per task."""
+    from insightface.model_zoo.scrfd import SCRFD
+    from insightface.model_zoo.arcface_onnx import ArcFaceONNX
+    from src.features.face_recognition.onnx_session import create_session
+
+    models = {}
+    for task in FACE_ENGINE_MODULES[engine]:
+        path = (model_paths or {}).get(task) or face_model_path(task)
+        model_class = SCRFD if task == "detection" else ArcFaceONNX
+        models[task] = model_class(model_file=path, session=create_session(task, path))
+    # What prepare() sets, without its set_providers() call that rebuilds the session
+    models['detection'].input_size = (FACE_DET_SIZE, FACE_DET_SIZE)
+    models['detection'].det_thresh = 0.5
+    return FaceEngine(models)
+
+def adaptive_det_size(shape: Tuple[int, ...]) -> Tuple[int, int]:
+    """SCRFD input (width, height) following the image aspect ratio, at most FACE_DET_SIZE and a multiple of 32."""
+    height, width = shape[:2]
+    scale = min(1.0, FACE_DET_SIZE / max(height, width))
+    return (max(32, int(np.ceil(width * scale / 32)) * 32), max(32, int(np.ceil(height * scale / 32)) * 32))
+
+def _has_dynamic_input(det_model) -> bool:
+    return not isinstance(det_model.session.get_inputs()[0].shape[2], int)
+
+def analyze_faces(detector, image: np.ndarray, det_size: Optional[Tuple[int, int]] = None) -> List:
+    """FaceAnalysis.get with the detection input size chosen per image."""
+    if not hasattr(detector, 'det_model'):
+        # SidecarFaceAnalysis, which runs this function in the sidecar
+        return detector.get(image, det_size)
+    if det_size is not None and not _has_dynamic_input(detector.det_model):
+        det_size = None
+
+    from insightface.app.common import Face
+    bboxes, kpss = detector.det_model.detect(image, input_size=det_size, max_num=0, metric='default')
+    faces = []
+    for i in range(bboxes.shape[0]):
+        face = Face(bbox=bboxes[i, 0:4], kps=kpss[i] if kpss is not None else None, det_score=bboxes[i, 4])
+        for taskname, model in detector.models.items():
+            if taskname == 'detection':
+                continue
+            model.get(image, face)
+        faces.append(face)
+    return faces
+
+def detect_for_recognition(detector, image: np.ndarray, quality_gate: bool = False, dynamic: Optional[bool] = None) -> List:
+    """
+    SCRFD faces of one image, not embedded yet. With quality_gate (and a
+    recognition model to embed with), faces failing face_quality get a
+    quality_reason.
+    """
+    from insightface.app.common import Face
+    if dynamic is None:
+        dynamic = _has_dynamic_input(detector.det_model)
+    det_size = adaptive_det_size(image.shape) if dynamic else None
+    bboxes, kpss = detector.det_model.detect(image, input_size=det_size, max_num=0, metric='default')
+    faces = [
+        Face(bbox=bboxes[i, 0:4], kps=kpss[i] if kpss is not None else None, det_score=bboxes[i, 4])
+        for i in range(bboxes.shape[0])
+    ]
+    if quality_gate and 'recognition' in detector.models:
+        from src.features.face_recognition.face_quality import assess_face_quality
+        for face in faces:
+            face.quality_reason = assess_face_quality(image, face)
+    return faces
+
+def align_face(rec_model, image: np.ndarray, face) -> np.ndarray:
+    """ArcFace input crop of a detected face, aligned on its landmarks."""
+    from insightface.utils import face_align
+    return face_align.norm_crop(image, landmark=face.kps, image_size=rec_model.input_size[0])
+
+def embed_aligned_faces(rec_model, crops: List[np.ndarray]) -> List[np.ndarray]:
+    """Embeddings of align_face crops, in batches of FACE_REC_BATCH_SIZE."""
+    embeddings = []
+    for start in range(0, len(crops), FACE_REC_BATCH_SIZE):
+        embeddings.extend(feat.flatten() for feat in rec_model.get_feat(crops[start:start + FACE_REC_BATCH_SIZE]))
+    return embeddings
+
+def analyze_faces_batch(detector, images: List[np.ndarray], quality_gate: bool = False) -> List[List]:
+    """
+    Faces of each image, like analyze_faces, with the recognition model run on
+    all face crops together in batches of FACE_REC_BATCH_SIZE.
+
+    With quality_gate, faces failing face_quality get a quality_reason and
+    are not embedded. An image whose detection fails is left without faces.
+    """
+    if not hasattr(detector, 'det_model'):
+        return detector.get_batch(images, quality_gate)
+
+    dynamic = _has_dynamic_input(detector.det_model)
+    faces_per_image = []
+    for image in images:
+        try:
+            # Detection inputs differ in size, so it stays one image per call
+            faces_per_image.append(detect_for_recognition(detector, image, quality_gate, dynamic))
+        except Exception as e:
+            print(f"Error in SCRFD detection: {e}")
+            faces_per_image.append([])
+
+    rec_model = detector.models.get('recognition')
+    if rec_model is None:
+        return faces_per_image
+    pending = [
+        (image, face) for image, faces in zip(images, faces_per_image) for face in faces
+        if face.kps is not None and not face.get('quality_reason')
+    ]
+    crops = [align_face(rec_model, image, face) for image, face in pending]
+    for (_, face), embedding in zip(pending, embed_aligned_faces(rec_model, crops)):
+        face.embedding = embedding
+    return faces_per_image
+
+def embed_detected_face(detector, image: np.ndarray, face) -> Optional[np.ndarray]:
+    """Embedding of a face from an earlier detection (aligned on its landmarks), without detecting again."""
+    rec_model = getattr(detector, 'models', {}).get('recognition')
+    if rec_model is None or face.kps is None:
+        return None
+    return rec_model.get(image, face)
+
+FACE_ERROR_NO_FACE = "No face detected in the image"
+FACE_ERROR_MULTIPLE_FACES = "Multiple faces detected. Please provide an image with only one face"
+FACE_ERROR_UNAVAILABLE = "Face detection not available. Please install required dependencies."
+
+class FaceEmbedding(NamedTuple):
+    """Embedding of the only face of an image, or why there is none."""
+    embedding: Optional[np.ndarray]
+    error: Optional[str]
+    # "cosine" for InsightFace embeddings, "euclidean" for face_recognition (dlib) encodings
+    metric: str = "cosine"
+
+def face_distances(embedding, stored_encodings, metric: str = "cosine") -> np.ndarray:
+    """
+    Distances from one embedding to each row of stored_encodings, in one pass
+    (lower is better). Cosine distance is 1 - cosine similarity, euclidean
+    is what face_recognition.face_distance computes.
+    """
+    embedding = np.asarray(embedding, dtype=np.float32).ravel()
+    stored = np.atleast_2d(np.asarray(stored_encodings, dtype=np.float32))
+    if stored.shape[1] != embedding.shape[0]:
+        raise ValueError(f"Encoding has {stored.shape[1]} values, expected {embedding.shape[0]}")
+    if metric == "euclidean":
+        return np.linalg.norm(stored - embedding, axis=1)
+    return 1.0 - (stored @ embedding) / (np.linalg.norm(stored, axis=1) * np.linalg.norm(embedding))
+
+def detection_only(detector):
+    """Detection engine sharing the detector model of an already loaded engine."""
+    return FaceEngine({'detection': detector.det_model})
+
+class FacePipeline:
+    """
+    Single face embedding per image: detect once, embed from that same pass.
+
+    SCRFD boxes and landmarks feed the ArcFace crops directly, so nothing is
+    detected twice. Faces failing the quality gate are rejected with a reason
+    code before any embedding work. The face_recognition library only runs,
+    on one RGB copy of the image, when InsightFace is unavailable or finds
+    no face. prepare and embed_crops split embed in two, so concurrent
+    requests detect in parallel and only share the ArcFace batch.
+    """
+
+    @staticmethod
+    def embed(image: np.ndarray) -> FaceEmbedding:
+        return FacePipeline.embed_batch([image])[0]
+
+    @staticmethod
+    def embed_batch(images: List[np.ndarray]) -> List[FaceEmbedding]:
+        """embed for many images, with one batched recognition pass over all faces."""
+        results: List[Optional[FaceEmbedding]] = [None] * len(images)
+        detector = FaceRecognitionService.get_scrfd_detector("recognition")
+        if detector is not False and images:
+            try:
+                faces_per_image = analyze_faces_batch(detector, images, FACE_QUALITY_GATE)
+            except Exception as e:
+                print(f"Error in SCRFD recognition: {e}")
+                # Image by image, so only the images that fail lose SCRFD
+                faces_per_image = [FacePipeline._analyze_one(detector, image) for image in images] if len(images) > 1 else [[]]
+            for i, faces in enumerate(faces_per_image):
+                results[i] = FacePipeline._face_outcome(faces)
+                if results[i] is None and len(faces) == 1 and getattr(faces[0], 'embedding', None) is not None:
+                    results[i] = FaceEmbedding(faces[0].embedding, None)
+
+        for i, image in enumerate(images):
+            if results[i] is None:
+                results[i] = FacePipeline._embed_face_recognition(image, scrfd_ran=detector is not False)
+        return results
+
+    @staticmethod
+    def prepare(image: np.ndarray) -> Union[FaceEmbedding, np.ndarray]:
+        """
+        Detection half of embed, for requests that share recognition batches.
+
+        Returns the aligned crop of the only face, to pass to embed_crops, or
+        the final FaceEmbedding when no ArcFace call is needed (no face,
+        several faces, quality gate) or the engine runs in the sidecar.
+        """
+        detector = FaceRecognitionService.get_scrfd_detector("recognition")
+        rec_model = getattr(detector, 'models', {}).get('recognition') if detector else None
+        if rec_model is None:
+            return FacePipeline.embed(image)
+        try:
+            faces = detect_for_recognition(detector, image, FACE_QUALITY_GATE)
+        except Exception as e:
+            print(f"Error in SCRFD detection: {e}")
+            faces = []
+        outcome = FacePipeline._face_outcome(faces)
+        if outcome is not None:
+            return outcome
+        if len(faces) == 1 and faces[0].kps is not None:
+            return align_face(rec_model, image, faces[0])
+        return FacePipeline._embed_face_recognition(image, scrfd_ran=True)
+
+    @staticmethod
+    def embed_crops(crops: List[np.ndarray]) -> List[FaceEmbedding]:
+        """Recognition half of embed: one batched ArcFace pass over crops from prepare."""
+        rec_model = FaceRecognitionService.get_scrfd_detector("recognition").models['recognition']
+        try:
+            return [FaceEmbedding(embedding, None) for embedding in embed_aligned_faces(rec_model, crops)]
+        except Exception as e:
+            if len(crops) == 1:
+                return [FaceEmbedding(None, f"Unexpected error: {str(e)}")]
+            print(f"Error in batched face recognition: {e}")
+            return [FacePipeline.embed_crops([crop])[0] for crop in crops]
+
+    @staticmethod
+    def _analyze_one(detector, image: np.ndarray) -> List:
+        try:
+            return analyze_faces_batch(detector, [image], FACE_QUALITY_GATE)[0]
+        except Exception as e:
+            print(f"Error in SCRFD recognition: {e}")
+            return []
+
+    @staticmethod
+    def _face_outcome(faces: List) -> Optional[FaceEmbedding]:
+        """The FaceEmbedding the detection alone decides (several faces, quality gate), else None."""
+        if len(faces) > 1:
+            return FaceEmbedding(None, FACE_ERROR_MULTIPLE_FACES)
+        if len(faces) == 1 and FACE_QUALITY_GATE:
+            reason = faces[0].get('quality_reason')
+            record_quality(reason)
+            if reason:
+                return FaceEmbedding(None, quality_error(reason))
+        return None
+
+    @staticmethod
+    def _embed_face_recognition(image: np.ndarray, scrfd_ran: bool) -> FaceEmbedding:
+        if not (_import_face_recognition() and face_recognition):
+            return FaceEmbedding(None, FACE_ERROR_NO_FACE if scrfd_ran else FACE_ERROR_UNAVAILABLE)
+        try:
+            rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+            face_locations = face_recognition.face_locations(rgb_image)
+            if len(face_locations) == 0:
+                return FaceEmbedding(None, FACE_ERROR_NO_FACE)
+            if len(face_locations) > 1:
+                return FaceEmbedding(None, FACE_ERROR_MULTIPLE_FACES)
+            face_encodings = face_recognition.face_encodings(rgb_image, face_locations)
+        except Exception as e:
+            return FaceEmbedding(None, f"Unexpected error: {str(e)}")
+        if len(face_encodings) == 0:
+            return FaceEmbedding(None, "Failed to encode face")
+        return FaceEmbedding(face_encodings[0], None, "euclidean")
+
 class FaceRecognitionService:
-    _scrfd_detector = None
+    # engine name ("detection" / "recognition") -> FaceAnalysis, or False when unavailable
+    _scrfd_detectors = {}
+    # Per thread engines when FACE_ENGINE_PER_WORKER is set
+    _thread_detectors = threading.local()
+    # Serializes model loading, so concurrent first requests do not load the same engine twice
+    _scrfd_lock = threading.Lock()
     
     @classmethod
-    def get_scrfd_detector(cls):
-        if cls._scrfd_detector is None:
+    def get_scrfd_detector(cls, engine: str = "recognition"):
+        detectors = cls._scrfd_detectors
+        if FACE_ENGINE_PER_WORKER and not INFERENCE_SIDECAR_SOCKET:
+            detectors = cls._thread_detectors.__dict__.setdefault("detectors", {})
+        if engine in detectors:
+            return detectors[engine]
+        with cls._scrfd_lock:
+            # Another thread may have loaded it while this one waited
+            if engine in detectors:
+                return detectors[engine]
+            if INFERENCE_SIDECAR_SOCKET:
+                # Models are loaded once in the sidecar and shared by every worker
+                from src.config.inference_sidecar import SidecarFaceAnalysis
+                detectors[engine] = SidecarFaceAnalysis(engine)
+                mark_loaded(f"face_{engine}")
+                return detectors[engine]
+
             # Try to import InsightFace only when needed
             if not _import_insightface():
-                cls._scrfd_detector = False
+                detectors[engine] = False
                 return False
-            
+
             try:
-                from insightface.app import FaceAnalysis
-                cls._scrfd_detector = FaceAnalysis(
-                    providers=['CPUExecutionProvider'], 
-                    name='buffalo_l'  
-                )
-                cls._scrfd_detector.prepare(ctx_id=-1, det_size=(640, 640))
+                started = time.perf_counter()
+                loaded = detectors.get("recognition")
+                if engine == "detection" and loaded:
+                    detector = detection_only(loaded)
+                else:
+                    detector = load_face_analysis(engine)
+                mark_loaded(f"face_{engine}", time.perf_counter() - started)
             except Exception as e:
-                print(f"Warning: Failed to initialize SCRFD detector: {e}")
+                mark_failed(f"face_{engine}", str(e))
+                print(f"Warning: Failed to initialize SCRFD {engine} engine: {e}")
                 print("Falling back to face_recognition library")
-                cls._scrfd_detector = False  # Mark as failed
-        return cls._scrfd_detector
-    
+                detector = False  # Mark as failed
+            # Published only once complete, readers outside the lock never see a half-built engine
+            detectors[engine] = detector
+            return detector
+
     @staticmethod
-    def detect_faces_scrfd(image: np.ndarray) -> Tuple[List, bool]:
-        
-        detector = FaceRecognitionService.get_scrfd_detector()
+    def detect_faces_scrfd(image: np.ndarray, engine: str = "recognition") -> Tuple[List, bool]:
+        """Detect faces in a BGR image (as returned by decode_base64_image)."""
+        detector = FaceRecognitionService.get_scrfd_detector(engine)
         
         if detector is False:
 
             return ([], False)
         
         try:
-            if len(image.shape) == 3:
-        
-                bgr_image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
-            else:
-                bgr_image = image
-            
-            if bgr_image.dtype != np.uint8:
-                bgr_image = (bgr_image * 255).astype(np.uint8) if bgr_image.max() <= 1.0 else bgr_image.astype(np.uint8)
-            
-            faces = detector.get(bgr_image)
-            
+            faces = analyze_faces(detector, image, adaptive_det_size(image.shape))
             return (faces, True)
         except Exception as e:
             print(f"Error in SCRFD detection: {e}")
@@ -135,13 +485,32 @@ class FaceRecognitionService:
             faces_list: List of dicts with keys: x1, y1, x2, y2, confidence
         """
         try:
-            image = FaceRecognitionService.decode_base64_image(image_base64)
-            faces, scrfd_available = FaceRecognitionService.detect_faces_scrfd(image)
+            image, scale = FaceRecognitionService.decode_base64_image(image_base64)
+        except ValueError as e:
+            return (False, [], str(e))
+        return FaceRecognitionService.detect_faces_image(image, scale)
+
+    @staticmethod
+    def detect_faces_bytes(data: bytes) -> Tuple[bool, List[dict], Optional[str]]:
+        """detect_faces for raw image bytes (multipart / octet-stream uploads)."""
+        try:
+            image, scale = FaceRecognitionService.decode_image_bytes(data)
+        except ValueError as e:
+            return (False, [], str(e))
+        return FaceRecognitionService.detect_faces_image(image, scale)
+
+    @staticmethod
+    def detect_faces_image(image: np.ndarray, scale: float = 1.0) -> Tuple[bool, List[dict], Optional[str]]:
+        """detect_faces for a decoded BGR image; scale maps boxes back to the uploaded image."""
+        try:
+            # Only boxes are returned, so the recognition model is not run
+            faces, scrfd_available = FaceRecognitionService.detect_faces_scrfd(image, "detection")
             
             if scrfd_available and len(faces) > 0:
                 face_boxes = []
                 for face in faces:
-                    bbox = face.bbox
+                    # Back to the coordinates of the uploaded image
+                    bbox = face.bbox * scale
                     face_boxes.append({
                         'x1': float(bbox[0]),
                         'y1': float(bbox[1]),
@@ -154,7 +523,7 @@ class FaceRecognitionService:
             else:
                 # Fallback to face_recognition if SCRFD not available
                 if _import_face_recognition() and face_recognition:
-                    face_locations = face_recognition.face_locations(image)
+                    face_locations = face_recognition.face_locations(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
                     
                     if len(face_locations) == 0:
                         return (True, [], None)
@@ -162,10 +531,10 @@ class FaceRecognitionService:
                     face_boxes = []
                     for (top, right, bottom, left) in face_locations:
                         face_boxes.append({
-                            'x1': float(left),
-                            'y1': float(top),
-                            'x2': float(right),
-                            'y2': float(bottom),
+                            'x1': float(left * scale),
+                            'y1': float(top * scale),
+                            'x2': float(right * scale),
+                            'y2': float(bottom * scale),
                             'confidence': None
                         })
                     
@@ -179,218 +548,170 @@ class FaceRecognitionService:
             return (False, [], f"Unexpected error: {str(e)}")
     
     @staticmethod
-    def decode_base64_image(image_base64: str) -> np.ndarray:
+    def decode_image_bytes(data: bytes, max_side: int = FACE_MAX_IMAGE_SIDE) -> Tuple[np.ndarray, float]:
+        """
+        Decode an encoded image straight to BGR with its longest side at most max_side.
+
+        Returns the image and the factor that maps its coordinates back to the
+        uploaded image. EXIF orientation is ignored, as it was with PIL, so
+        boxes stay in the frame of the stored pixels.
+        """
+        try:
+            try:
+                # Reads the header only
+                width, height = Image.open(BytesIO(data)).size
+            except Image.DecompressionBombError as e:
+                raise ValueError(f"Image is too large: {e}")
+            except Exception:
+                # Nothing is decoded without known dimensions
+                raise ValueError("Unsupported or corrupt image")
+            if FACE_MAX_IMAGE_PIXELS and width * height > FACE_MAX_IMAGE_PIXELS:
+                raise ValueError(f"Image is too large: {width}x{height} pixels, at most {FACE_MAX_IMAGE_PIXELS} are accepted")
+
+            flags = cv2.IMREAD_COLOR
+            if max_side:
+                for factor, reduced in _REDUCED_DECODE_FLAGS:
+                    if max(width, height) / factor >= max_side:
+                        flags = reduced
+                        break
+            image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), flags | cv2.IMREAD_IGNORE_ORIENTATION)
+            if image is None:
+                # Formats OpenCV cannot read (e.g. GIF)
+                image = cv2.cvtColor(np.asarray(Image.open(BytesIO(data)).convert('RGB')), cv2.COLOR_RGB2BGR)
+
+            longest = max(image.shape[:2])
+            if max_side and longest > max_side:
+                ratio = max_side / longest
+                image = cv2.resize(image, (round(image.shape[1] * ratio), round(image.shape[0] * ratio)), interpolation=cv2.INTER_AREA)
+
+            return image, width / image.shape[1]
+        except Exception as e:
+            raise ValueError(f"Failed to decode image: {str(e)}")
+
+    @staticmethod
+    def decode_base64_image(image_base64: str, max_side: int = FACE_MAX_IMAGE_SIDE) -> Tuple[np.ndarray, float]:
+        """Decode a (data URL) base64 image to BGR, see decode_image_bytes."""
         try:
             if ',' in image_base64:
                 image_base64 = image_base64.split(',')[1]
         
             image_data = base64.b64decode(image_base64)
-            image = Image.open(BytesIO(image_data))
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
-            
-            image_array = np.array(image)
-            
-            return image_array
         except Exception as e:
             raise ValueError(f"Failed to decode image: {str(e)}")
+        return FaceRecognitionService.decode_image_bytes(image_data, max_side)
     
     @staticmethod
     def encode_face(image_base64: str) -> Tuple[bool, Optional[List[float]], Optional[str]]:
-        
         try:
-            image = FaceRecognitionService.decode_base64_image(image_base64)
-
-            faces, scrfd_available = FaceRecognitionService.detect_faces_scrfd(image)
-            
-            if scrfd_available and len(faces) > 0:
-                if len(faces) > 1:
-                    return (False, None, "Multiple faces detected. Please provide an image with only one face")
-                
-                face = faces[0]
-                
-             
-                bbox = face.bbox
-                
-                x1, y1, x2, y2 = int(bbox[0]), int(bbox[1]), int(bbox[2]), int(bbox[3])
-                
-                h, w = image.shape[:2]
-                x1 = max(0, x1)
-                y1 = max(0, y1)
-                x2 = min(w, x2)
-                y2 = min(h, y2)
-                
-                # Use InsightFace's built-in face recognition embedding
-                if hasattr(face, 'embedding'):
-                    # Use InsightFace embedding directly (512 dimensions for buffalo_l)
-                    embedding = face.embedding
-                    encoding = embedding.tolist()
-                    return (True, encoding, None)
-                else:
-                    # Fallback: re-detect to get embedding
-                    detector = FaceRecognitionService.get_scrfd_detector()
-                    if detector:
-                        # Convert to BGR for InsightFace
-                        if len(image.shape) == 3:
-                            bgr_image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
-                        else:
-                            bgr_image = image
-                        if bgr_image.dtype != np.uint8:
-                            bgr_image = (bgr_image * 255).astype(np.uint8) if bgr_image.max() <= 1.0 else bgr_image.astype(np.uint8)
-                        
-                        faces_with_embedding = detector.get(bgr_image)
-                        if len(faces_with_embedding) > 0 and hasattr(faces_with_embedding[0], 'embedding'):
-                            embedding = faces_with_embedding[0].embedding
-                            encoding = embedding.tolist()
-                            return (True, encoding, None)
-                
-                # If InsightFace embedding not available, try face_recognition as fallback
-                if _import_face_recognition() and face_recognition:
-                    face_location = (y1, x2, y2, x1)
-                    face_encodings = face_recognition.face_encodings(image, [face_location])
-                    if len(face_encodings) > 0:
-                        encoding = face_encodings[0].tolist()
-                        return (True, encoding, None)
-                
-                return (False, None, "Failed to encode face after detection")
-            
-            else:
-                # SCRFD not available, try face_recognition fallback
-                if _import_face_recognition() and face_recognition:
-                    face_locations = face_recognition.face_locations(image)
-                    
-                    if len(face_locations) == 0:
-                        return (False, None, "No face detected in the image")
-                    
-                    if len(face_locations) > 1:
-                        return (False, None, "Multiple faces detected. Please provide an image with only one face")
+            image, _ = FaceRecognitionService.decode_base64_image(image_base64)
+        except ValueError as e:
+            return (False, None, str(e))
+        return FaceRecognitionService.encode_face_image(image)
 
-                    face_encodings = face_recognition.face_encodings(image, face_locations)                
-                    if len(face_encodings) == 0:
-                        return (False, None, "Failed to encode face")
-                    encoding = face_encodings[0].tolist()
-                    
-                    return (True, encoding, None)
-                else:
-                    return (False, None, "Face detection not available. Please install required dependencies.")
-            
+    @staticmethod
+    def encode_face_bytes(data: bytes) -> Tuple[bool, Optional[List[float]], Optional[str]]:
+        try:
+            image, _ = FaceRecognitionService.decode_image_bytes(data)
         except ValueError as e:
             return (False, None, str(e))
-        except Exception as e:
-            return (False, None, f"Unexpected error: {str(e)}")
-    
+        return FaceRecognitionService.encode_face_image(image)
+
     @staticmethod
-    def verify_face(image_base64: str, stored_encoding: List[float], tolerance: float = 0.6) -> Tuple[bool, bool, Optional[float], Optional[str]]:
-        
+    def encode_face_image(image: np.ndarray, encoding_format: str = "json") -> Tuple[bool, Optional[Union[str, List[float]]], Optional[str]]:
+        return FaceRecognitionService.encode_result(FacePipeline.embed(image), encoding_format)
+
+    @staticmethod
+    def verify_face(image_base64: str, stored_encoding: Union[str, List[float]], tolerance: float = 0.6) -> Tuple[bool, bool, Optional[float], Optional[str]]:
         try:
-            image = FaceRecognitionService.decode_base64_image(image_base64)
-            faces, scrfd_available = FaceRecognitionService.detect_faces_scrfd(image)
-            
-            if scrfd_available and len(faces) > 0:
-                # Use SCRFD detection
-                if len(faces) > 1:
-                    return (False, False, None, "Multiple faces detected. Please provide an image with only one face")
-                
-                face = faces[0]
-                
-                bbox = face.bbox
-                
-                x1, y1, x2, y2 = int(bbox[0]), int(bbox[1]), int(bbox[2]), int(bbox[3])
-                
-                h, w = image.shape[:2]
-                x1 = max(0, x1)
-                y1 = max(0, y1)
-                x2 = min(w, x2)
-                y2 = min(h, y2)
-              
-                # Use InsightFace's built-in face recognition embedding
-                if hasattr(face, 'embedding'):
-                    # Use InsightFace embedding directly
-                    embedding = face.embedding
-                    stored_encoding_array = np.array(stored_encoding)
-                    
-                    # Calculate cosine distance (InsightFace uses cosine similarity)
-                    # Normalize embeddings
-                    embedding_norm = embedding / np.linalg.norm(embedding)
-                    stored_norm = stored_encoding_array / np.linalg.norm(stored_encoding_array)
-                    
-                    # Cosine similarity (higher is better)
-                    cosine_sim = np.dot(embedding_norm, stored_norm)
-                    # Convert to distance (lower is better, similar to face_recognition)
-                    face_distance = 1.0 - cosine_sim
-                    
-                    # InsightFace typically uses threshold around 0.6 for cosine similarity
-                    # So distance threshold would be around 0.4
-                    # Adjust tolerance for cosine distance
-                    cosine_tolerance = 1.0 - (1.0 - tolerance)  # Convert face_recognition tolerance to cosine
-                    match = face_distance <= cosine_tolerance
-                    
-                    return (True, match, float(face_distance), None)
-                else:
-                    # Fallback: try to get embedding from detector
-                    detector = FaceRecognitionService.get_scrfd_detector()
-                    if detector:
-                        # Convert to BGR for InsightFace
-                        if len(image.shape) == 3:
-                            bgr_image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
-                        else:
-                            bgr_image = image
-                        if bgr_image.dtype != np.uint8:
-                            bgr_image = (bgr_image * 255).astype(np.uint8) if bgr_image.max() <= 1.0 else bgr_image.astype(np.uint8)
-                        
-                        faces_with_embedding = detector.get(bgr_image)
-                        if len(faces_with_embedding) > 0 and hasattr(faces_with_embedding[0], 'embedding'):
-                            embedding = faces_with_embedding[0].embedding
-                            stored_encoding_array = np.array(stored_encoding)
-                            
-                            embedding_norm = embedding / np.linalg.norm(embedding)
-                            stored_norm = stored_encoding_array / np.linalg.norm(stored_encoding_array)
-                            cosine_sim = np.dot(embedding_norm, stored_norm)
-                            face_distance = 1.0 - cosine_sim
-                            cosine_tolerance = 1.0 - (1.0 - tolerance)
-                            match = face_distance <= cosine_tolerance
-                            
-                            return (True, match, float(face_distance), None)
-                
-                # If InsightFace embedding not available, try face_recognition as fallback
-                if _import_face_recognition() and face_recognition:
-                    face_location = (y1, x2, y2, x1)
-                    face_encodings = face_recognition.face_encodings(image, [face_location])
-                    if len(face_encodings) == 0:
-                        return (False, False, None, "Failed to encode face from image")
-                    
-                    stored_encoding_array = np.array(stored_encoding)
-                    face_distance = face_recognition.face_distance([stored_encoding_array], face_encodings[0])[0]
-                    match = face_distance <= tolerance
-                    return (True, match, float(face_distance), None)
-                
-                return (False, False, None, "Failed to encode face from image")
-            
-            else:
-                # SCRFD not available, try face_recognition fallback
-                if _import_face_recognition() and face_recognition:
-                    face_locations = face_recognition.face_locations(image)
-                    
-                    if len(face_locations) == 0:
-                        return (False, False, None, "No face detected in the image")
-                    
-                    if len(face_locations) > 1:
-                        return (False, False, None, "Multiple faces detected. Please provide an image with only one face")
-                    
-                    face_encodings = face_recognition.face_encodings(image, face_locations)
-                    
-                    if len(face_encodings) == 0:
-                        return (False, False, None, "Failed to encode face from image")
-                    
-                    stored_encoding_array = np.array(stored_encoding)
-                    face_distance = face_recognition.face_distance([stored_encoding_array], face_encodings[0])[0]
-                    match = face_distance <= tolerance
-                    return (True, match, float(face_distance), None)
-                else:
-                    return (False, False, None, "Face detection not available. Please install required dependencies.")
-            
+            image, _ = FaceRecognitionService.decode_base64_image(image_base64)
         except ValueError as e:
             return (False, False, None, str(e))
-        except Exception as e:
-            return (False, False, None, f"Unexpected error: {str(e)}")
+        return FaceRecognitionService.verify_face_image(image, stored_encoding, tolerance)
+
+    @staticmethod
+    def verify_face_bytes(data: bytes, stored_encoding: Union[str, List[float]], tolerance: float = 0.6) -> Tuple[bool, bool, Optional[float], Optional[str]]:
+        try:
+            image, _ = FaceRecognitionService.decode_image_bytes(data)
+        except ValueError as e:
+            return (False, False, None, str(e))
+        return FaceRecognitionService.verify_face_image(image, stored_encoding, tolerance)
+
+    @staticmethod
+    def verify_face_image(image: np.ndarray, stored_encoding: Union[str, List[float]], tolerance: float = 0.6) -> Tuple[bool, bool, Optional[float], Optional[str]]:
+        return FaceRecognitionService.verify_result(FacePipeline.embed(image), stored_encoding, tolerance)
+
+    @staticmethod
+    def _decode_batch(images_base64: List[str]) -> Tuple[List[Optional[np.ndarray]], List[Optional[str]]]:
+        images, errors = [], []
+        for image_base64 in images_base64:
+            try:
+                image, _ = FaceRecognitionService.decode_base64_image(image_base64)
+                images.append(image)
+                errors.append(None)
+            except ValueError as e:
+                images.append(None)
+                errors.append(str(e))
+        return images, errors
+
+    @staticmethod
+    def embed_single_faces(images: List[Optional[np.ndarray]]) -> List[Optional[FaceEmbedding]]:
+        """FacePipeline.embed_batch over the decoded images; None stays None for images that failed to decode."""
+        valid = [i for i, image in enumerate(images) if image is not None]
+        outcomes: List[Optional[FaceEmbedding]] = [None] * len(images)
+        for i, outcome in zip(valid, FacePipeline.embed_batch([images[i] for i in valid])):
+            outcomes[i] = outcome
+        return outcomes
+
+    @staticmethod
+    def encode_faces_batch(images_base64: List[str], encoding_format: str = "json") -> List[Tuple[bool, Optional[Union[str, List[float]]], Optional[str]]]:
+        """encode_face for many images, with one batched recognition pass over all faces."""
+        images, errors = FaceRecognitionService._decode_batch(images_base64)
+        outcomes = FaceRecognitionService.embed_single_faces(images)
+
+        results = []
+        for error, outcome in zip(errors, outcomes):
+            if outcome is None:
+                results.append((False, None, error))
+            else:
+                results.append(FaceRecognitionService.encode_result(outcome, encoding_format))
+        return results
 
+    @staticmethod
+    def encode_result(outcome: FaceEmbedding, encoding_format: str = "json") -> Tuple[bool, Optional[Union[str, List[float]]], Optional[str]]:
+        """encode_face result from a FacePipeline embedding, as a list of floats or a compact encoding (encoding_codec)."""
+        if outcome.error:
+            return (False, None, outcome.error)
+        return (True, format_encoding(outcome.embedding, encoding_format), None)
+
+    @staticmethod
+    def verify_faces_batch(items: List[Tuple[str, Union[str, List[float]], float]]) -> List[Tuple[bool, bool, Optional[float], Optional[str]]]:
+        """verify_face for many (image_base64, stored_encoding, tolerance) items."""
+        images, errors = FaceRecognitionService._decode_batch([image_base64 for image_base64, _, _ in items])
+        outcomes = FaceRecognitionService.embed_single_faces(images)
+
+        results = []
+        for (_, stored_encoding, tolerance), error, outcome in zip(items, errors, outcomes):
+            if outcome is None:
+                results.append((False, False, None, error))
+            else:
+                results.append(FaceRecognitionService.verify_result(outcome, stored_encoding, tolerance))
+        return results
+
+    @staticmethod
+    def verify_result(outcome: FaceEmbedding, stored_encoding: Union[str, List[float]], tolerance: float) -> Tuple[bool, bool, Optional[float], Optional[str]]:
+        """verify_face result from a FacePipeline embedding."""
+        if outcome.error:
+            return (False, False, None, outcome.error)
+        try:
+            face_distance = float(face_distances(outcome.embedding, parse_encoding(stored_encoding), outcome.metric)[0])
+        except ValueError as e:
+            return (False, False, None, f"Invalid encoding: {str(e)}")
+        return (True, face_distance <= tolerance, face_distance, None)
+
+    @staticmethod
+    def detect_faces_batch(images_base64: List[str]) -> List[Tuple[bool, List[dict], Optional[str]]]:
+        """detect_faces for many images; detection-only, so there is no recognition pass to batch."""
+        results = []
+        for image_base64 in images_base64:
+            results.append(FaceRecognitionService.detect_faces(image_base64))
+        return results
@@ -0,0 +1,54 @@
+import os
+from typing import Optional
+from dotenv import dotenv_values
+
+config = dotenv_values(".env")
+
+GRAPH_OPTIMIZATION_LEVELS = {
+    "disable": "ORT_DISABLE_ALL",
+    "basic": "ORT_ENABLE_BASIC",
+    "extended": "ORT_ENABLE_EXTENDED",
+    "all": "ORT_ENABLE_ALL",
+}
+
+
+def _setting(task: str, name: str, default=None) -> Optional[str]:
+    """FACE_ORT_<TASK>_<NAME> (per model), then FACE_ORT_<NAME> (all models)."""
+    value = config.get(f"FACE_ORT_{task.upper()}_{name}")
+    if value is None:
+        value = config.get(f"FACE_ORT_{name}", default)
+    return value
+
+
+def _flag(value) -> bool:
+    return str(value).lower() in ("1", "true", "yes")
+
+
+def default_intra_op_threads() -> int:
+    """Cores per concurrently running face worker thread, so the pool does not oversubscribe the CPU."""
+    from src.features.face_recognition.face_recognition_service import FACE_WORKER_THREADS
+
+    return max(1, (os.cpu_count() or 1) // max(1, FACE_WORKER_THREADS))
+
+
+def session_options(task: str):
+    """onnxruntime SessionOptions for one face model ("detection" or "recognition")."""
+    import onnxruntime
+
+    options = onnxruntime.SessionOptions()
+    options.intra_op_num_threads = int(_setting(task, "INTRA_OP_THREADS", default_intra_op_threads()))
+    options.inter_op_num_threads = int(_setting(task, "INTER_OP_THREADS", 1))
+    options.execution_mode = onnxruntime.ExecutionMode.ORT_SEQUENTIAL
+    level = GRAPH_OPTIMIZATION_LEVELS[str(_setting(task, "GRAPH_OPTIMIZATION", "all")).lower()]
+    options.graph_optimization_level = getattr(onnxruntime.GraphOptimizationLevel, level)
+    options.enable_cpu_mem_arena = _flag(_setting(task, "CPU_MEM_ARENA", "true"))
+    options.enable_mem_pattern = _flag(_setting(task, "MEM_PATTERN", "true"))
+    # Idle intra-op threads busy-wait for work by default, which shows up as CPU use between requests
+    options.add_session_config_entry("session.intra_op.allow_spinning", "1" if _flag(_setting(task, "ALLOW_SPINNING", "false")) else "0")
+    return options
+
+
+def create_session(task: str, model_path: str):
+    import onnxruntime
+
+    return onnxruntime.InferenceSession(model_path, sess_options=session_options(task), providers=["CPUExecutionProvider"])
@@ -0,0 +1,190 @@
+import threading
+import time
+from typing import Optional
+import cv2
+import numpy as np
+from dotenv import dotenv_values
+from src.features.face_recognition.face_recognition_service import (
+    FaceRecognitionService,
+    FacePipeline,
+    embed_detected_face,
+    face_distances,
+    FACE_ERROR_NO_FACE,
+    FACE_ERROR_MULTIPLE_FACES,
+)
+from src.features.face_recognition.face_quality import FACE_QUALITY_GATE, assess_face_quality, quality_error, record_quality
+
+config = dotenv_values(".env")
+
+# Longest side proctoring frames are decoded to, webcam frames rarely need more
+FACE_PROCTOR_MAX_IMAGE_SIDE = int(config.get("FACE_PROCTOR_MAX_IMAGE_SIDE", 640))
+# Full SCRFD detection every N frames, the tracker follows the face in between
+FACE_PROCTOR_DETECT_EVERY = int(config.get("FACE_PROCTOR_DETECT_EVERY", 10))
+# OpenCV tracker ("kcf", "csrt", "mil"); MIL is used when the build lacks the requested one
+FACE_PROCTOR_TRACKER = config.get("FACE_PROCTOR_TRACKER", "kcf").lower()
+# A detection overlapping the tracked box less than this is a new track
+FACE_PROCTOR_TRACK_IOU = float(config.get("FACE_PROCTOR_TRACK_IOU", 0.3))
+# Recognition runs again when the detection score drops below this...
+FACE_PROCTOR_MIN_DET_SCORE = float(config.get("FACE_PROCTOR_MIN_DET_SCORE", 0.6))
+# ...when the last distance was this close to the tolerance...
+FACE_PROCTOR_DISTANCE_MARGIN = float(config.get("FACE_PROCTOR_DISTANCE_MARGIN", 0.05))
+# ...or when the identity was last checked this long ago (0 disables)
+FACE_PROCTOR_REVERIFY_SECONDS = float(config.get("FACE_PROCTOR_REVERIFY_SECONDS", 30))
+
+# Counters over all sessions of the process, reported by /face-recognition/stats
+_stats = {"active_sessions": 0, "sessions": 0, "frames": 0, "detections": 0, "tracked_frames": 0, "recognitions": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(**increments) -> None:
+    with _stats_lock:
+        for name, value in increments.items():
+            _stats[name] += value
+
+
+def proctoring_stats() -> dict:
+    with _stats_lock:
+        return dict(_stats)
+
+
+def create_tracker(kind: str = FACE_PROCTOR_TRACKER):
+    """OpenCV single object tracker, from cv2 or cv2.legacy depending on the build; None when there is none."""
+    for name in (f"Tracker{kind.upper()}_create", "TrackerMIL_create"):
+        for module in (cv2, getattr(cv2, "legacy", None)):
+            factory = getattr(module, name, None) if module is not None else None
+            if factory is not None:
+                return factory()
+    return None
+
+
+def box_iou(a: np.ndarray, b: np.ndarray) -> float:
+    """IoU of two (x1, y1, x2, y2) boxes."""
+    width = min(a[2], b[2]) - max(a[0], b[0])
+    height = min(a[3], b[3]) - max(a[1], b[1])
+    if width <= 0 or height <= 0:
+        return 0.0
+    intersection = width * height
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - intersection
+    return float(intersection / union) if union > 0 else 0.0
+
+
+class ProctoringSession:
+    """
+    Face state of one proctoring WebSocket.
+
+    SCRFD runs on the first frame, every FACE_PROCTOR_DETECT_EVERY frames
+    and whenever the tracker loses the face; the frames in between only
+    update an OpenCV tracker. Recognition runs on a detection frame when the
+    track is new, the detection score is low, the last distance was close
+    to the tolerance or the identity has not been checked for
+    FACE_PROCTOR_REVERIFY_SECONDS. Frames are processed one at a time.
+    """
+
+    def __init__(self, reference: Optional[np.ndarray] = None, tolerance: float = 0.6):
+        self.reference = reference
+        self.tolerance = tolerance
+        self.frame_index = 0
+        self.tracker = None
+        self.box: Optional[np.ndarray] = None
+        self.frames_since_detection = 0
+        self.match: Optional[bool] = None
+        self.distance: Optional[float] = None
+        self.verified_at: Optional[float] = None
+        _count(active_sessions=1, sessions=1)
+
+    def close(self) -> None:
+        _count(active_sessions=-1)
+
+    def _track(self, image: np.ndarray) -> bool:
+        if self.tracker is None or self.frames_since_detection >= FACE_PROCTOR_DETECT_EVERY:
+            return False
+        ok, (x, y, w, h) = self.tracker.update(image)
+        if not ok:
+            return False
+        self.box = np.array([x, y, x + w, y + h], dtype=np.float32)
+        self.frames_since_detection += 1
+        return True
+
+    def _start_track(self, image: np.ndarray, box: np.ndarray) -> None:
+        self.box = box
+        self.frames_since_detection = 0
+        self.tracker = create_tracker()
+        if self.tracker is not None:
+            x1, y1, x2, y2 = (int(v) for v in box[:4])
+            self.tracker.init(image, (x1, y1, max(1, x2 - x1), max(1, y2 - y1)))
+
+    def _lose_track(self) -> None:
+        # Whoever appears next is recognized again
+        self.tracker = None
+        self.box = None
+        self.match = None
+        self.distance = None
+
+    def _needs_recognition(self, new_track: bool, det_score: float) -> bool:
+        if self.reference is None:
+            return False
+        if new_track or self.distance is None or det_score < FACE_PROCTOR_MIN_DET_SCORE:
+            return True
+        if abs(self.distance - self.tolerance) < FACE_PROCTOR_DISTANCE_MARGIN:
+            return True
+        return bool(FACE_PROCTOR_REVERIFY_SECONDS) and time.monotonic() - self.verified_at >= FACE_PROCTOR_REVERIFY_SECONDS
+
+    def _recognize(self, image: np.ndarray, face) -> Optional[str]:
+        if FACE_QUALITY_GATE:
+            reason = assess_face_quality(image, face)
+            record_quality(reason)
+            if reason:
+                # Tried again on the next detection frame; the same track keeps its last result meanwhile
+                return quality_error(reason)
+        detector = FaceRecognitionService.get_scrfd_detector("recognition")
+        embedding = embed_detected_face(detector, image, face) if detector else None
+        metric = "cosine"
+        if embedding is None:
+            # Sidecar engines (and models without landmarks) go through the full pipeline
+            outcome = FacePipeline.embed(image)
+            if outcome.error:
+                return outcome.error
+            embedding, metric = outcome.embedding, outcome.metric
+        self.distance = float(face_distances(embedding, self.reference, metric)[0])
+        self.match = self.distance <= self.tolerance
+        self.verified_at = time.monotonic()
+        _count(recognitions=1)
+        return None
+
+    def process(self, image: np.ndarray, scale: float = 1.0) -> dict:
+        """Result of one decoded BGR frame; scale maps the box back to the uploaded frame."""
+        self.frame_index += 1
+        _count(frames=1)
+        result = {"frame": self.frame_index, "source": "track", "faces": 1, "box": None, "recognized": False, "error": None}
+
+        if self._track(image):
+            _count(tracked_frames=1)
+        else:
+            result["source"] = "detect"
+            faces, available = FaceRecognitionService.detect_faces_scrfd(image, "detection")
+            _count(detections=1)
+            result["faces"] = len(faces)
+            if not available:
+                self._lose_track()
+                result["error"] = "Face detection not available"
+            elif len(faces) != 1:
+                self._lose_track()
+                result["error"] = FACE_ERROR_NO_FACE if not faces else FACE_ERROR_MULTIPLE_FACES
+            else:
+                face = faces[0]
+                new_track = self.box is None or box_iou(self.box, face.bbox) < FACE_PROCTOR_TRACK_IOU
+                if new_track:
+                    # Possibly someone else: no match is reported until recognition succeeds on this track
+                    self.match = None
+                    self.distance = None
+                self._start_track(image, np.asarray(face.bbox, dtype=np.float32))
+                if self._needs_recognition(new_track, float(face.det_score)):
+                    result["error"] = self._recognize(image, face)
+                    result["recognized"] = result["error"] is None
+
+        if self.box is not None:
+            box = self.box * scale
+            result["box"] = {"x1": float(box[0]), "y1": float(box[1]), "x2": float(box[2]), "y2": float(box[3])}
+        result["match"] = self.match
+        result["distance"] = self.distance
+        return result
@@ -0,0 +1,131 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+from dotenv import dotenv_values
+from src.database.Content import Content
+from src.database.Learning_Path import Question
+
+config = dotenv_values(".env")
+
+# "embedded" keeps full day content in Learning_Path and writes nothing else,
+# "reference" stores it once in Content, days only keep contentId and are hydrated through the API
+LEARNING_PATH_CONTENT_MODE = config.get("LEARNING_PATH_CONTENT_MODE", "embedded").lower()
+CONTENT_CACHE_SIZE = int(config.get("CONTENT_CACHE_SIZE", 2048))
+
+CONTENT_FIELDS = ("youtube_links", "theory", "question_review")
+
+# contentId -> content fields, content is immutable for a given id
+_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def make_content_id(domain: str, level: str, subskill: str, version: Optional[str]) -> str:
+    key = "|".join([(domain or "").lower(), (level or "").lower(), (subskill or "").strip().lower(), version or "unversioned"])
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def _content_of(doc: Content) -> Dict[str, Any]:
+    return {
+        "youtube_links": doc.youtube_links,
+        "theory": doc.theory,
+        "question_review": [q.to_mongo().to_dict() for q in doc.question_review],
+    }
+
+
+def _remember(content_id: str, content: Dict[str, Any]) -> None:
+    with _lock:
+        _cache[content_id] = content
+        _cache.move_to_end(content_id)
+        while len(_cache) > CONTENT_CACHE_SIZE:
+            _cache.popitem(last=False)
+
+
+def _content_document(domain: str, level: str, version: Optional[str], content_id: str, day: Dict[str, Any]) -> Dict[str, Any]:
+    """Raw Content document of a generated day, for $setOnInsert."""
+    son = Content(
+        contentId=content_id,
+        domain=domain,
+        level=level,
+        skill=day.get("skill"),
+        subskill=day.get("subskill"),
+        version=version or "unversioned",
+        youtube_links=day.get("youtube_links"),
+        theory=day.get("theory"),
+        question_review=[
+            Question(**{key: value for key, value in question.items() if key in Question._fields})
+            for question in day.get("question_review") or []
+        ],
+    ).to_mongo().to_dict()
+    son.pop("_id", None)
+    return son
+
+
+def store_days_content(domain: str, level: str, version: Optional[str], days: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Save the content of generated days once and return the day entries to keep in Learning_Path.
+
+    Only LEARNING_PATH_CONTENT_MODE "reference" writes to the Content
+    collection: all days are upserted in one bulk_write (first writer wins)
+    and the stored content is read back in one query, so the entries carry
+    the winner's contentId. In "embedded" mode the content stays inline and
+    nothing is written.
+    """
+    if LEARNING_PATH_CONTENT_MODE != "reference" or not days:
+        return [dict(day) for day in days]
+
+    from pymongo import UpdateOne
+    from pymongo.errors import BulkWriteError
+
+    content_ids = [make_content_id(domain, level, day.get("subskill"), version) for day in days]
+    try:
+        upserts = {
+            content_id: UpdateOne({"contentId": content_id}, {"$setOnInsert": _content_document(domain, level, version, content_id, day)}, upsert=True)
+            for content_id, day in zip(content_ids, days)
+        }
+        try:
+            Content._get_collection().bulk_write(list(upserts.values()), ordered=False)
+        except BulkWriteError as e:
+            # Duplicate keys are concurrent first inserts of the same ids, which exist now
+            if any(error.get("code") != 11000 for error in e.details.get("writeErrors", [])):
+                raise
+        stored = {
+            doc.contentId: _content_of(doc)
+            for doc in Content.objects(contentId__in=list(upserts)).only("contentId", *CONTENT_FIELDS)
+        }
+    except Exception as e:
+        # Keep the content inline rather than losing it
+        print(f"⚠️ Error saving day content: {e}")
+        return [{**day, "contentId": None} for day in days]
+
+    entries = []
+    for content_id, day in zip(content_ids, days):
+        if content_id not in stored:
+            entries.append({**day, "contentId": None})
+            continue
+        _remember(content_id, stored[content_id])
+        entries.append({key: value for key, value in day.items() if key not in CONTENT_FIELDS} | {"contentId": content_id})
+    return entries
+
+
+def store_day_content(domain: str, level: str, version: Optional[str], day: Dict[str, Any]) -> Dict[str, Any]:
+    """store_days_content for one day."""
+    return store_days_content(domain, level, version, [day])[0]
+
+
+def hydrate_days(days: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Fill the content of referenced days, with one query for all ids missing from the cache."""
+    wanted = {day["contentId"] for day in days if day.get("contentId") and not day.get("theory")}
+    with _lock:
+        missing = [content_id for content_id in wanted if content_id not in _cache]
+
+    if missing:
+        for doc in Content.objects(contentId__in=missing).only("contentId", *CONTENT_FIELDS):
+            _remember(doc.contentId, _content_of(doc))
+
+    hydrated = []
+    with _lock:
+        for day in days:
+            content = _cache.get(day.get("contentId")) if day.get("contentId") in wanted else None
+            hydrated.append({**day, **content} if content else dict(day))
+    return hydrated
@@ -0,0 +1,203 @@
+import json
+import re
+from typing import Any, Dict, List, Optional, Set, Tuple
+from dotenv import dotenv_values
+from langchain.docstore.document import Document
+from rapidfuzz import fuzz
+
+config = dotenv_values(".env")
+
+# Approximate token budget of one tool observation (~4 characters per token)
+TOOL_TOKEN_CAP = int(config.get("TOOL_TOKEN_CAP", 600))
+CHARS_PER_TOKEN = 4
+
+# Fields the day JSON is built from, per corpus file type
+FIELDS_BY_FILE_TYPE = {
+    "Theory": ("subskill", "theory"),
+    "Youtube_links_subskills": ("subskill", "youtube_link"),
+    "Question": ("id", "subskill_name", "question_text", "options", "correct_answer", "level"),
+}
+SUBSKILL_KEYS = ("subskill", "subskill_name")
+# Fields a record must have to be shown to the agent, a question without its options or answer is useless
+REQUIRED_FIELDS_BY_FILE_TYPE = {
+    "Theory": ("subskill", "theory"),
+    "Youtube_links_subskills": ("subskill", "youtube_link"),
+    "Question": ("id", "question_text", "options", "correct_answer"),
+}
+# Fields that may be cut by the chunk boundary and still be used (they get truncated to the token cap anyway)
+LONG_TEXT_FIELDS = {"theory"}
+# File types whose records are identified by id rather than by subskill
+ID_KEYED_FILE_TYPES = {"Question"}
+
+_decoder = json.JSONDecoder()
+# "key": "value" pairs, the value may be cut off by the chunk boundary
+_string_pair = re.compile(r'"(\w+)"\s*:\s*"((?:[^"\\]|\\.)*)("?)')
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", " ", (text or "").lower()).strip()
+
+
+def _parse_fragment(fragment: str) -> Tuple[Optional[Dict[str, Any]], Set[str]]:
+    """
+    Recover the string fields of a record cut in half by the text splitter.
+
+    Also returns the fields whose value was cut off by the chunk boundary.
+    A cut id cannot be trusted to name the record, so it is dropped.
+    """
+    record = {}
+    truncated = set()
+    for key, value, closing_quote in _string_pair.findall(fragment):
+        try:
+            record[key] = json.loads(f'"{value}"')
+        except ValueError:
+            record[key] = value
+        if not closing_quote:
+            truncated.add(key)
+    if "id" in truncated:
+        record.pop("id")
+        truncated.discard("id")
+    return record or None, truncated
+
+
+def _extract_records(text: str) -> List[Tuple[Dict[str, Any], Set[str]]]:
+    """Decode every complete JSON object of a chunk, and the partial ones at its edges, with their cut fields."""
+    records = []
+    position = 0
+    leftover = []
+    while True:
+        start = text.find("{", position)
+        if start == -1:
+            leftover.append(text[position:])
+            break
+        try:
+            value, end = _decoder.raw_decode(text, start)
+        except ValueError:
+            leftover.append(text[position:start + 1])
+            position = start + 1
+            continue
+        leftover.append(text[position:start])
+        if isinstance(value, dict):
+            records.append((value, set()))
+        position = end
+
+    for fragment in leftover:
+        record, truncated = _parse_fragment(fragment)
+        # Tails without an id or subskill cannot be attributed to a record
+        if record and any(record.get(k) for k in ("id",) + SUBSKILL_KEYS):
+            records.append((record, truncated))
+    return records
+
+
+def _record_key(record: Dict[str, Any], file_type: str) -> Optional[str]:
+    """Identity used to merge copies and fragments of a record; None when it cannot be known."""
+    if record.get("id"):
+        return f"id:{str(record['id']).strip()}"
+    if file_type in ID_KEYED_FILE_TYPES:
+        # Several questions share a subskill, a fragment without its id belongs to any of them
+        return None
+    subskill = next((record[k] for k in SUBSKILL_KEYS if record.get(k)), None)
+    if subskill:
+        return f"subskill:{_normalize(subskill)}"
+    return None if file_type in FIELDS_BY_FILE_TYPE else json.dumps(record, sort_keys=True)
+
+
+def _merge(record: Dict[str, Any], truncated: Set[str], other: Dict[str, Any], other_truncated: Set[str]) -> None:
+    """Fill record with the fields of another copy, preferring complete values, then longer ones."""
+    for key, value in other.items():
+        if key not in record:
+            better = True
+        elif (key in truncated) != (key in other_truncated):
+            better = key in truncated
+        else:
+            better = len(json.dumps(value, ensure_ascii=False)) > len(json.dumps(record[key], ensure_ascii=False))
+        if better:
+            record[key] = value
+            if key in other_truncated:
+                truncated.add(key)
+            else:
+                truncated.discard(key)
+
+
+def _is_complete(record: Dict[str, Any], truncated: Set[str], file_type: str) -> bool:
+    """Required fields are present, and not cut off unless they are long texts the observation shortens anyway."""
+    return all(
+        record.get(k) not in (None, "", []) and (k not in truncated or k in LONG_TEXT_FIELDS)
+        for k in REQUIRED_FIELDS_BY_FILE_TYPE.get(file_type, ())
+    )
+
+
+def _matches_subskill(record: Dict[str, Any], query: str) -> bool:
+    subskill = _normalize(next((record[k] for k in SUBSKILL_KEYS if record.get(k)), ""))
+    if not subskill or not query:
+        return False
+    return subskill == query or query in subskill or subskill in query or fuzz.ratio(subskill, query) >= 85
+
+
+def _truncate(record: Dict[str, Any], max_chars: int) -> Dict[str, Any]:
+    """Shorten the longest string field so the record fits in max_chars."""
+    record = dict(record)
+    longest = max((k for k, v in record.items() if isinstance(v, str)), key=lambda k: len(record[k]), default=None)
+    if longest is None:
+        return record
+    overflow = len(json.dumps(record, ensure_ascii=False, separators=(",", ":"))) - max_chars
+    if overflow > 0:
+        record[longest] = record[longest][:max(0, len(record[longest]) - overflow - 3)] + "..."
+    return record
+
+
+def compact_documents(documents: List[Document], file_type: str, query: str = "", token_cap: int = TOOL_TOKEN_CAP) -> str:
+    """
+    Turn retrieved chunks into a short observation for the agent.
+
+    Keeps only the fields the day JSON needs, merges the copies and
+    fragments of a record spread over chunks (by id, or by subskill for
+    theory and links), drops records still missing required fields and
+    records of other subskills, and stops once the observation reaches
+    token_cap.
+    """
+    fields = FIELDS_BY_FILE_TYPE.get(file_type)
+    records: Dict[str, Dict[str, Any]] = {}
+    truncated: Dict[str, Set[str]] = {}
+    raw_chunks = []
+    for doc in documents or []:
+        extracted = _extract_records(doc.page_content)
+        if not extracted:
+            raw_chunks.append(" ".join(doc.page_content.split()))
+        for record, cut in extracted:
+            if fields:
+                record = {k: record[k] for k in fields if record.get(k) not in (None, "", [])}
+                if not record:
+                    continue
+            key = _record_key(record, file_type)
+            if key is None:
+                continue
+            # Copies duplicated by the chunk overlap and fragments of one record are merged
+            if key not in records:
+                records[key], truncated[key] = {}, set()
+            _merge(records[key], truncated[key], record, cut & record.keys())
+
+    selected = [record for key, record in records.items() if _is_complete(record, truncated[key], file_type)]
+    normalized_query = _normalize(query)
+    if fields and normalized_query:
+        matching = [r for r in selected if _matches_subskill(r, normalized_query)]
+        if matching:
+            selected = matching
+
+    max_chars = token_cap * CHARS_PER_TOKEN
+    lines = []
+    used = 0
+    for item in [json.dumps(r, ensure_ascii=False, separators=(",", ":")) for r in selected] + raw_chunks:
+        if used + len(item) > max_chars:
+            if not lines:
+                if item in raw_chunks:
+                    lines.append(item[:max_chars])
+                else:
+                    lines.append(json.dumps(_truncate(selected[0], max_chars), ensure_ascii=False, separators=(",", ":")))
+            break
+        lines.append(item)
+        used += len(item) + 1
+
+    if not lines:
+        return "No relevant documents found."
+    return "\n".join(lines)
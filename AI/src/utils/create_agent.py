@@ -3,34 +3,48 @@ from langchain.agents import AgentType, initialize_agent, Tool
 from langchain.memory import ConversationBufferMemory
 from typing import List, Union, Dict, Any
 from langchain_community.vectorstores import Chroma
-from langchain_community.utilities import WikipediaAPIWrapper
 from src.utils.vector_store import get_similar_docs
+from src.utils.context_compaction import compact_documents
+from src.utils.wikipedia_cache import get_cached_wikipedia
 import sys
+from dotenv import dotenv_values
 
+config = dotenv_values(".env")
 
-def create_agent(domain:str ,level: str,llm: Any, vector_store: Chroma, memory: ConversationBufferMemory) -> Any:
+AGENT_MAX_ITERATIONS = int(config.get("AGENT_MAX_ITERATIONS", 10))
+
+
+def create_agent(domain:str ,level: str,llm: Any, vector_store: Chroma, memory: ConversationBufferMemory,
+                 max_iterations: int = AGENT_MAX_ITERATIONS, max_execution_time: float = None) -> Any:
 
     try:
-        wiki = WikipediaAPIWrapper()
+        wiki = get_cached_wikipedia()
         
         # Wrapper function to ensure retrieval_roadmap always uses English domain
         def retrieval_roadmap_wrapper(query: str):
             # Force use of English domain, ignore query if it's not English
-            return get_similar_docs(domain, vector_store, level, file_type="Skills_Subskills_Roadmap", domain=domain)
+            docs = get_similar_docs(domain, vector_store, level, file_type="Skills_Subskills_Roadmap", domain=domain)
+            return compact_documents(docs, "Skills_Subskills_Roadmap")
+
+        # Retrieved chunks are compacted before they reach the agent scratchpad
+        def retrieval(file_type: str):
+            return lambda q: compact_documents(
+                get_similar_docs(q, vector_store, level, file_type=file_type, domain=domain), file_type, q
+            )
 
         tools = [
             Tool.from_function(
-                func=lambda q: get_similar_docs(q, vector_store, level, file_type="Youtube_links_subskills", domain=domain),
+                func=retrieval("Youtube_links_subskills"),
                 name="retrieval_youtube_links",
                 description="Useful for get youtube link of subskill."
             ),
             Tool.from_function(
-                func=lambda q: get_similar_docs(q, vector_store, level, file_type="Theory", domain=domain),
+                func=retrieval("Theory"),
                 name="retrieval_theory",
                 description="Useful for get theory of subskill."
             ),
             Tool.from_function(
-                func=lambda q: get_similar_docs(q, vector_store, level, file_type="Question", domain=domain),
+                func=retrieval("Question"),
                 name="retrieval_question",
                 description="Useful for get question of subskill."
             ),
@@ -52,7 +66,11 @@ def create_agent(domain:str ,level: str,llm: Any, vector_store: Chroma, memory:
             agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
             memory=memory,
             verbose=True,
-            handle_parsing_errors=True
+            handle_parsing_errors=True,
+            # A stuck ReAct loop must not hold the worker forever
+            max_iterations=max_iterations,
+            max_execution_time=max_execution_time,
+            early_stopping_method="force"
         )
         return agent
     except Exception as e:
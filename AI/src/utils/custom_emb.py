@@ -1,4 +1,4 @@
-from sentence_transformers import SentenceTransformer
+import threading
 from dotenv import dotenv_values
 import sys
 
@@ -6,6 +6,8 @@ config = dotenv_values(".env")
 
 class CustomEmbeddings:
     def __init__(self, model_name: str):
+        # Imported here so torch is only loaded by the process that runs the model
+        from sentence_transformers import SentenceTransformer
         self.model = SentenceTransformer(model_name)
 
     def embed_documents(self, texts):
@@ -22,3 +24,29 @@ def create_embeddings(model_name: str = config["EMBEDDING_MODEL_NAME"]) -> Custo
     except Exception as e:
         print(f"Error creating embeddings: {e}")
         sys.exit(1)
+
+
+_embeddings = None
+_embeddings_lock = threading.Lock()
+
+
+def get_embeddings():
+    """
+    Embeddings model shared by the whole process.
+
+    Loaded in the gunicorn master when preloading, so forked workers share
+    its pages; with INFERENCE_SIDECAR_SOCKET set the model lives in the
+    sidecar process instead and this returns a client for it.
+    """
+    global _embeddings
+    from src.config.readiness import load_engine
+    from src.config.inference_sidecar import INFERENCE_SIDECAR_SOCKET
+
+    with _embeddings_lock:
+        if _embeddings is None:
+            if INFERENCE_SIDECAR_SOCKET:
+                from src.config.inference_sidecar import SidecarEmbeddings
+                _embeddings = load_engine("embeddings", SidecarEmbeddings)
+            else:
+                _embeddings = load_engine("embeddings", create_embeddings)
+        return _embeddings
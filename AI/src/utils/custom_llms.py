@@ -0,0 +1,79 @@
+import asyncio
+from typing import Any, List, Optional
+from langchain.llms.base import LLM
+from pydantic import Field
+from dotenv import dotenv_values
+from src.utils.http_clients import get_http_client, get_async_http_client
+from src.utils.local_llm import get_local_engine, LOCAL_LLM_MAX_TOKENS
+
+config = dotenv_values(".env")
+
+GEMINI_MODEL = config.get("GEMINI_MODEL", "gemini-pro")
+
+
+class GeminiLLM(LLM):
+    api_key: str = Field(..., description="Google API key")
+    model: str = Field(GEMINI_MODEL, description="Gemini model name")
+    timeout: Optional[float] = Field(None, description="HTTP timeout in seconds, None = client default")
+
+    @property
+    def _url(self) -> str:
+        return f"https://generativelanguage.googleapis.com/v1/models/{self.model}:generateContent"
+
+    def _request(self, prompt: str) -> dict:
+        request = {
+            "headers": {
+                "Content-Type": "application/json",
+                "x-goog-api-key": self.api_key
+            },
+            "json": {
+                "contents": [
+                    {
+                        "parts": [{"text": prompt}]
+                    }
+                ]
+            },
+        }
+        if self.timeout is not None:
+            request["timeout"] = self.timeout
+        return request
+
+    @staticmethod
+    def _parse(response) -> str:
+        if response.status_code != 200:
+            raise Exception(f"Gemini API error: {response.status_code}, {response.text}")
+        try:
+            result = response.json()
+            return result["candidates"][0]["content"]["parts"][0]["text"]
+        except Exception as e:
+            raise Exception(f"Error parsing Gemini response: {e}")
+
+    def _call(self, prompt: str, stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any) -> str:
+        response = get_http_client().post(self._url, **self._request(prompt))
+        return self._parse(response)
+
+    async def _acall(self, prompt: str, stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any) -> str:
+        response = await get_async_http_client().post(self._url, **self._request(prompt))
+        return self._parse(response)
+
+    @property
+    def _llm_type(self) -> str:
+        return "gemini"
+
+
+class LocalLlamaLLM(LLM):
+    """LangChain adapter over the process wide llama.cpp engine."""
+    model_path: str = Field(..., description="Path of the GGUF model")
+    max_tokens: int = Field(LOCAL_LLM_MAX_TOKENS, description="Maximum generated tokens")
+    timeout: Optional[float] = Field(None, description="Maximum wait for queue + generation in seconds")
+
+    def _call(self, prompt: str, stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any) -> str:
+        return get_local_engine(self.model_path).generate(prompt, stop, timeout=self.timeout, max_tokens=self.max_tokens)
+
+    async def _acall(self, prompt: str, stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any) -> str:
+        future = get_local_engine(self.model_path).submit(prompt, stop, self.max_tokens)
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout)
+
+    @property
+    def _llm_type(self) -> str:
+        return "llama-cpp-shared"
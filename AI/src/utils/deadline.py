@@ -0,0 +1,99 @@
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Optional
+from dotenv import dotenv_values
+
+config = dotenv_values(".env")
+
+# Total budget of one /generate_schedule request (the backend gives up after 120s)
+GENERATION_DEADLINE_SECONDS = float(config.get("GENERATION_DEADLINE_SECONDS", 110))
+# Upper bound of a single LLM HTTP call
+LLM_TIMEOUT_SECONDS = float(config.get("LLM_TIMEOUT_SECONDS", 30))
+# Retries of an LLM call on 429 / 5xx, reduced to what still fits in a request deadline
+LLM_MAX_RETRIES = int(config.get("LLM_MAX_RETRIES", 2))
+
+
+class DeadlineExceeded(TimeoutError):
+    def __init__(self, stage: str):
+        super().__init__(f"Deadline exceeded during {stage}")
+        self.stage = stage
+
+
+class Deadline:
+    """Absolute point in time after which a request stops starting new work."""
+
+    def __init__(self, seconds: float = GENERATION_DEADLINE_SECONDS):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def check(self, stage: str) -> None:
+        if self.expired():
+            raise DeadlineExceeded(stage)
+
+    def timeout(self, cap: Optional[float] = None, floor: float = 0.0) -> float:
+        """Timeout for one blocking call: the remaining budget, optionally capped, never below floor."""
+        remaining = self.remaining()
+        if cap is not None:
+            remaining = min(remaining, cap)
+        return max(remaining, floor)
+
+    def retries(self, attempt_seconds: float, max_retries: int = LLM_MAX_RETRIES) -> int:
+        """Retries of a call whose attempts take up to attempt_seconds that all fit in the remaining budget."""
+        if attempt_seconds <= 0:
+            return 0
+        return max(0, min(max_retries, int(self.remaining() // attempt_seconds) - 1))
+
+
+def _start_thread(fn: Callable[..., Any], *args, **kwargs) -> Future:
+    """
+    Run fn on a new daemon thread. A thread per call (instead of a shared
+    pool) means there is no queue eating into the deadline, and calls we
+    stopped waiting for do not hold up other requests while they finish.
+    """
+    future = Future()
+
+    def target():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=target, name="deadline", daemon=True).start()
+    return future
+
+
+def run_with_deadline(deadline: Optional[Deadline], stage: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run a blocking call and stop waiting for it when the deadline passes.
+
+    Python threads cannot be killed, so the call itself should also be given
+    a timeout (LLM request timeout, agent max_execution_time...) to release
+    the helper thread soon after we stop waiting. Calls that take a
+    `timeout` keyword bound themselves and run in the calling thread.
+    """
+    if deadline is None:
+        return fn(*args, **kwargs)
+
+    deadline.check(stage)
+    if "timeout" in kwargs:
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            if deadline.expired():
+                raise DeadlineExceeded(stage) from e
+            raise
+    future = _start_thread(fn, *args, **kwargs)
+    try:
+        return future.result(timeout=deadline.remaining())
+    except FutureTimeoutError:
+        future.cancel()
+        raise DeadlineExceeded(stage)
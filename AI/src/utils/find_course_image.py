@@ -6,7 +6,7 @@ from typing import Optional
 
 config = dotenv_values(".env")
 
-def find_course_image(course_title: str, topic: str = None) -> Optional[str]:
+def find_course_image(course_title: str, topic: str = None, timeout: float = 10) -> Optional[str]:
 
     try:
         unsplash_access_key = (
@@ -23,7 +23,7 @@ def find_course_image(course_title: str, topic: str = None) -> Optional[str]:
         )
         
         if unsplash_access_key:
-            return _find_image_unsplash(course_title, topic, unsplash_access_key, unsplash_secret_key)
+            return _find_image_unsplash(course_title, topic, unsplash_access_key, unsplash_secret_key, timeout=timeout)
         else:
             # Fallback: Use a placeholder service or generate a themed image URL
             return _get_fallback_image(course_title, topic)
@@ -33,7 +33,7 @@ def find_course_image(course_title: str, topic: str = None) -> Optional[str]:
         return _get_fallback_image(course_title, topic)
 
 
-def _find_image_unsplash(course_title: str, topic: str, access_key: str, secret_key: str = None) -> Optional[str]:
+def _find_image_unsplash(course_title: str, topic: str, access_key: str, secret_key: str = None, timeout: float = 10) -> Optional[str]:
     """
     Search for image using Unsplash API.
     
@@ -42,6 +42,7 @@ def _find_image_unsplash(course_title: str, topic: str, access_key: str, secret_
         topic: Additional topic context (optional)
         access_key: Unsplash Access Key (Client-ID) - required
         secret_key: Unsplash Secret Key (Client-Secret) - optional, only needed for OAuth
+        timeout: HTTP timeout in seconds
     
     Returns:
         URL of the image, or None if not found
@@ -81,7 +82,7 @@ def _find_image_unsplash(course_title: str, topic: str, access_key: str, secret_
         if secret_key:
             print(f"📝 Secret key provided (for future OAuth features)")
         
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        response = requests.get(url, headers=headers, params=params, timeout=timeout)
         
         if response.status_code == 200:
             data = response.json()
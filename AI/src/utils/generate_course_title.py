@@ -1,8 +1,10 @@
 from langchain.prompts import PromptTemplate
 from src.utils.initialize_llms import initialize_llm
 from langchain.chains import LLMChain
+from typing import Optional
+from src.utils.deadline import LLM_MAX_RETRIES
 
-def generate_course_title(user_input: str) -> str:
+def generate_course_title(user_input: str, timeout: Optional[float] = None, max_retries: int = LLM_MAX_RETRIES) -> str:
     """
     Generate a beautiful, standardized course title from user input.
     Examples:
@@ -10,7 +12,7 @@ def generate_course_title(user_input: str) -> str:
     - "cv" -> "Computer Vision" or "Thị giác máy tính"
     - "ml" -> "Machine Learning" or "Học máy"
     """
-    llm = initialize_llm()
+    llm = initialize_llm(timeout=timeout, max_retries=max_retries)
 
     prompt = PromptTemplate(
         input_variables=["user_input"],
@@ -3,15 +3,18 @@ from src.utils.initialize_llms import initialize_llm
 from langchain.chains import LLMChain
 from rapidfuzz import process
 import re
+from typing import Optional
+from src.utils.deadline import LLM_MAX_RETRIES
 
-def get_domain(text: str):
-    DOMAIN_SYNONYMS = {
-        "computer vision": ["cv", "comput vision", "comp vision", "vision"],
-        "nlp": ["natural language processing", "language ai", "text ai"],
-        "machine learning": ["ml", "machine learn", "machin learning"],
-    }
+DOMAIN_SYNONYMS = {
+    "computer vision": ["cv", "comput vision", "comp vision", "vision"],
+    "nlp": ["natural language processing", "language ai", "text ai"],
+    "machine learning": ["ml", "machine learn", "machin learning"],
+}
 
-    llm = initialize_llm()
+
+def get_domain(text: str, timeout: Optional[float] = None, max_retries: int = LLM_MAX_RETRIES):
+    llm = initialize_llm(timeout=timeout, max_retries=max_retries)
 
     prompt = PromptTemplate(
         input_variables=["user_input"],
@@ -52,6 +55,11 @@ def get_domain(text: str):
     result = re.sub(r'[^a-z0-9\s-]', '', result)
     result = result.strip()
 
+    return match_domain(result)
+
+
+def match_domain(result: str):
+    """Map a cleaned English phrase to a known domain without calling the LLM."""
     all_labels = list(DOMAIN_SYNONYMS.keys())
     for synonyms in DOMAIN_SYNONYMS.values():
         all_labels.extend(synonyms)
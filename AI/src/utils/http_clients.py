@@ -0,0 +1,59 @@
+import asyncio
+import threading
+import weakref
+import httpx
+from dotenv import dotenv_values
+
+config = dotenv_values(".env")
+
+HTTP_TIMEOUT_SECONDS = float(config.get("HTTP_TIMEOUT_SECONDS", 60))
+HTTP_CONNECT_TIMEOUT_SECONDS = float(config.get("HTTP_CONNECT_TIMEOUT_SECONDS", 5))
+HTTP_MAX_CONNECTIONS = int(config.get("HTTP_MAX_CONNECTIONS", 100))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(config.get("HTTP_MAX_KEEPALIVE_CONNECTIONS", 20))
+HTTP_KEEPALIVE_EXPIRY_SECONDS = float(config.get("HTTP_KEEPALIVE_EXPIRY_SECONDS", 30))
+
+_client = None
+_async_clients = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def _client_options() -> dict:
+    return {
+        "timeout": httpx.Timeout(HTTP_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS),
+        "limits": httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    }
+
+
+def get_http_client() -> httpx.Client:
+    """Process wide keep-alive client, so TLS connections are reused between calls and threads."""
+    global _client
+    with _lock:
+        if _client is None or _client.is_closed:
+            _client = httpx.Client(**_client_options())
+        return _client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Keep-alive async client of the running event loop (connections cannot be shared across loops)."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(**_client_options())
+            _async_clients[loop] = client
+        return client
+
+
+async def close_http_clients() -> None:
+    global _client
+    with _lock:
+        client, _client = _client, None
+        async_client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        client.close()
+    if async_client is not None:
+        await async_client.aclose()
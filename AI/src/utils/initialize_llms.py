@@ -1,10 +1,9 @@
 import sys
-from langchain.callbacks.manager import CallbackManager
-from langchain.callbacks.streaming_stdout import StreamingStdOutCallbackHandler
 from dotenv import dotenv_values
-from typing import List, Union, Dict, Any
-from langchain_community.llms import LlamaCpp
+from typing import List, Union, Dict, Any, Optional
 from langchain_groq import ChatGroq
+from src.utils.http_clients import get_http_client
+from src.utils.deadline import LLM_MAX_RETRIES
 # LangChain Core
 from langchain.chains import LLMChain
 from langchain_community.llms.google_palm import GooglePalm
@@ -12,24 +11,24 @@ from langchain_community.llms.google_palm import GooglePalm
 config = dotenv_values(".env")
 
 
-def initialize_llm(llm_type: str = "openai" , model_path: str = config['LLM_MODEL_PATH']) -> Any:
+def initialize_llm(llm_type: str = "openai" , model_path: str = config['LLM_MODEL_PATH'], timeout: Optional[float] = None, max_retries: int = LLM_MAX_RETRIES) -> Any:
+    """
+    timeout bounds every HTTP call made by the returned LLM (seconds, None = client default),
+    max_retries the retries on 429 / 5xx (see Deadline.retries).
+    """
     try:
         if llm_type == "local":
             if not model_path:
                 raise ValueError("LLM_MODEL_PATH must be set for local LLMs (LlamaCpp)")
-            callback_manager = CallbackManager([StreamingStdOutCallbackHandler()])
-            return LlamaCpp(
-                model_path=model_path,
-                n_ctx=2048,
-                verbose=False,
-                callback_manager=callback_manager,
-                n_gpu_layers=1,
-            )
+            from src.utils.custom_llms import LocalLlamaLLM
+
+            # The model is loaded once and shared, see src/utils/local_llm.py
+            return LocalLlamaLLM(model_path=model_path, timeout=timeout)
 
         elif llm_type == "openai":
             if not config.get("OPENAI_API_KEY"):
                 raise ValueError("OPENAI_API_KEY must be set for OpenAI LLM")
-            return ChatGroq( temperature=0,groq_api_key = config["OPENAI_API_KEY"], model_name = 'llama-3.3-70b-versatile')
+            return ChatGroq( temperature=0,groq_api_key = config["OPENAI_API_KEY"], model_name = 'llama-3.3-70b-versatile', request_timeout=timeout, max_retries=max_retries, http_client=get_http_client())
 
         elif llm_type == "google":
             print("ofdsfdsagdsagwerte")
@@ -46,44 +45,9 @@ def initialize_llm(llm_type: str = "openai" , model_path: str = config['LLM_MODE
             if not config.get("KAGGLE_API_KEY"):
                 raise ValueError("KAGGLE_API_KEY must be set for Gemini")
 
-            import requests
-
-            from langchain.llms.base import LLM
-
-            from pydantic import Field
-
-            from typing import Optional, List
-
-            class GeminiLLM(LLM):
-                api_key: str = Field(..., description="Google API key")
-
-                def _call(self, prompt: str, stop: Optional[List[str]] = None) -> str:
-                    url = "https://generativelanguage.googleapis.com/v1/models/gemini-pro:generateContent"
-                    headers = {
-                        "Content-Type": "application/json",
-                        "x-goog-api-key": self.api_key
-                    }
-                    body = {
-                        "contents": [
-                            {
-                                "parts": [{"text": prompt}]
-                            }
-                        ]
-                    }
-                    response = requests.post(url, headers=headers, json=body)
-                    if response.status_code != 200:
-                        raise Exception(f"Gemini API error: {response.status_code}, {response.text}")
-                    try:
-                        result = response.json()
-                        return result["candidates"][0]["content"]["parts"][0]["text"]
-                    except Exception as e:
-                        raise Exception(f"Error parsing Gemini response: {e}")
-
-                @property
-                def _llm_type(self) -> str:
-                    return "gemini"
+            from src.utils.custom_llms import GeminiLLM
 
-            return GeminiLLM(api_key=config["KAGGLE_API_KEY"])
+            return GeminiLLM(api_key=config["KAGGLE_API_KEY"], timeout=timeout)
 
         else:
             raise ValueError(f"Unsupported LLM type: {llm_type}")
@@ -2,19 +2,20 @@ from typing import List, Union, Dict, Any
 
 def create_learning_path(agent: Any, skill: str, subskill: str, level: str, day: int = 1) -> str:
     try:
-        prompt = f"""
+        # Everything up to the day specific part is identical for every day, so
+        # local models can reuse the already evaluated prompt prefix.
+        prompt = """
         You are a helpful AI assistant designed to create personalized learning paths.
-        The user wants to know what should user learn with {subskill}.
         Return JSON in the following format:
 
-        {{
-          "day": {day},
-          "skill": "{skill}",
-          "subskill": "{subskill}",
+        {
+          "day": <day number>,
+          "skill": "<skill>",
+          "subskill": "<subskill>",
           "youtube_links": "youtube_link of subskill",
           "theory": "Theory of subskill",
           "question_review": [
-            {{
+            {
               "id": "Question_ID",
               "question_text": "The question text",
               "options": [
@@ -25,9 +26,9 @@ def create_learning_path(agent: Any, skill: str, subskill: str, level: str, day:
               ],
               "correct_answer": "Correct option (Example: B)",
               "level" : "difficult level of questions"
-            }}
+            }
           ]
-        }}
+        }
 
         IMPORTANT RULES:
         To indentify required information, you follow these actions
@@ -37,13 +38,18 @@ def create_learning_path(agent: Any, skill: str, subskill: str, level: str, day:
         - You MUST NOT RETURN Observation: Invalid Format: Missing 'Action:' after 'Thought'
         """
 
-        prompt += f"""
+        prompt += """
             Action: the action to take, should be one of the tools
             Action Input: the input to the action
             Observation: the result of the action
             ...
             Final Answer: summary of the final process or a prompt for the user
         """
+
+        prompt += f"""
+        The user wants to know what should user learn with {subskill}.
+        Use "day": {day}, "skill": "{skill}", "subskill": "{subskill}".
+        """
         return agent.run(prompt.strip())
     except Exception as e:
         print(f"Error creating learning path: {e}")
@@ -0,0 +1,97 @@
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Dict, List, Optional
+from dotenv import dotenv_values
+
+config = dotenv_values(".env")
+
+LOCAL_LLM_N_CTX = int(config.get("LOCAL_LLM_N_CTX", 4096))
+LOCAL_LLM_N_THREADS = int(config.get("LOCAL_LLM_N_THREADS", os.cpu_count() or 4))
+LOCAL_LLM_N_BATCH = int(config.get("LOCAL_LLM_N_BATCH", 512))
+LOCAL_LLM_N_GPU_LAYERS = int(config.get("LOCAL_LLM_N_GPU_LAYERS", 1))
+LOCAL_LLM_MAX_TOKENS = int(config.get("LOCAL_LLM_MAX_TOKENS", 1024))
+LOCAL_LLM_TEMPERATURE = float(config.get("LOCAL_LLM_TEMPERATURE", 0))
+# RAM reserved for evaluated prompt prefixes (KV state), 0 disables the cache
+LOCAL_LLM_PROMPT_CACHE_BYTES = int(config.get("LOCAL_LLM_PROMPT_CACHE_BYTES", 2 << 30))
+
+
+class LocalLLMEngine:
+    """
+    One llama.cpp model shared by the whole process.
+
+    llama.cpp contexts are not thread safe, so requests are queued and run
+    one at a time by a single worker thread. Consecutive prompts that share
+    a prefix (agent instructions, tool descriptions) only evaluate the new
+    tokens: llama.cpp keeps the last evaluated tokens, and the RAM cache
+    restores the KV state of other recently used prefixes.
+    """
+
+    def __init__(self, model_path: str):
+        from llama_cpp import Llama, LlamaRAMCache
+
+        print(f"🦙 Loading local LLM {model_path} (n_ctx={LOCAL_LLM_N_CTX}, n_threads={LOCAL_LLM_N_THREADS}, n_batch={LOCAL_LLM_N_BATCH})")
+        self.model = Llama(
+            model_path=model_path,
+            n_ctx=LOCAL_LLM_N_CTX,
+            n_threads=LOCAL_LLM_N_THREADS,
+            n_threads_batch=LOCAL_LLM_N_THREADS,
+            n_batch=LOCAL_LLM_N_BATCH,
+            n_gpu_layers=LOCAL_LLM_N_GPU_LAYERS,
+            verbose=False,
+        )
+        if LOCAL_LLM_PROMPT_CACHE_BYTES > 0:
+            self.model.set_cache(LlamaRAMCache(capacity_bytes=LOCAL_LLM_PROMPT_CACHE_BYTES))
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="local-llm", daemon=True)
+        self._worker.start()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def _run(self) -> None:
+        while True:
+            prompt, stop, max_tokens, future = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = self.model(
+                    prompt,
+                    max_tokens=max_tokens,
+                    stop=stop or [],
+                    temperature=LOCAL_LLM_TEMPERATURE,
+                )
+                future.set_result(result["choices"][0]["text"])
+            except Exception as e:
+                future.set_exception(e)
+
+    def submit(self, prompt: str, stop: Optional[List[str]] = None, max_tokens: int = LOCAL_LLM_MAX_TOKENS) -> Future:
+        """Queue a completion; cancelling the future before it starts drops the request."""
+        future = Future()
+        self._queue.put((prompt, stop, max_tokens, future))
+        return future
+
+    def generate(self, prompt: str, stop: Optional[List[str]] = None, timeout: Optional[float] = None, max_tokens: int = LOCAL_LLM_MAX_TOKENS) -> str:
+        future = self.submit(prompt, stop, max_tokens)
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+
+_engines: Dict[str, LocalLLMEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_local_engine(model_path: str) -> LocalLLMEngine:
+    """Load the model once per process and reuse it for every call."""
+    with _engines_lock:
+        engine = _engines.get(model_path)
+        if engine is None:
+            engine = LocalLLMEngine(model_path)
+            _engines[model_path] = engine
+        return engine
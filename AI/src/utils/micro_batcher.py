@@ -0,0 +1,122 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, List, Optional
+
+
+class MicroBatcher:
+    """
+    Groups concurrent async calls into batches for a function that is cheaper
+    per item on a batch (e.g. one ONNX call for many inputs).
+
+    Up to max_in_flight batches run at once; items queued while all of them
+    are busy are taken together by the next one. When a single item is
+    waiting, the batcher waits up to max_wait_ms for others, so an idle
+    service adds at most that much latency. process_batch runs in a worker
+    thread (through runner, asyncio.to_thread by default) and must return
+    one result per item, in order; if it raises, every item of the batch
+    gets the error.
+    """
+
+    def __init__(self, process_batch: Callable[[List[Any]], List[Any]], max_batch_size: int = 16, max_wait_ms: float = 2, name: str = "batch", runner: Optional[Callable[..., Awaitable]] = None, max_in_flight: int = 1):
+        self.process_batch = process_batch
+        self.runner = runner or asyncio.to_thread
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.max_in_flight = max(1, max_in_flight)
+        self.name = name
+        self._queue: Optional[asyncio.Queue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._batch_tasks = set()
+        self._stats_lock = threading.Lock()
+        self._in_flight = 0
+        self._batches = 0
+        self._items = 0
+        self._largest = 0
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+            self._worker = loop.create_task(self._run())
+        return self._queue
+
+    async def submit(self, item: Any) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        await self._ensure_worker().put((item, future))
+        return await future
+
+    async def _collect(self) -> list:
+        batch = [await self._queue.get()]
+        while len(batch) < self.max_batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        if len(batch) == 1 and self.max_wait:
+            deadline = asyncio.get_running_loop().time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            # A free slot first, so items keep gathering while every batch is busy
+            await self._slots.acquire()
+            try:
+                batch = await self._collect()
+            except BaseException:
+                self._slots.release()
+                raise
+            task = asyncio.get_running_loop().create_task(self._process(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _process(self, batch: list) -> None:
+        try:
+            # Requests cancelled while queued (client went away) are dropped
+            batch = [(item, future) for item, future in batch if not future.done()]
+            if not batch:
+                return
+            with self._stats_lock:
+                self._in_flight += 1
+            try:
+                results = await self.runner(self.process_batch, [item for item, _ in batch])
+                if len(results) != len(batch):
+                    raise RuntimeError(f"{self.name} returned {len(results)} results for {len(batch)} items")
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            finally:
+                with self._stats_lock:
+                    self._in_flight -= 1
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+            with self._stats_lock:
+                self._batches += 1
+                self._items += len(batch)
+                self._largest = max(self._largest, len(batch))
+        finally:
+            self._slots.release()
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "batches": self._batches,
+                "items": self._items,
+                "average_batch_size": round(self._items / self._batches, 2) if self._batches else 0,
+                "largest_batch": self._largest,
+                "in_flight": self._in_flight,
+                "max_in_flight": self.max_in_flight,
+                "queued": self._queue.qsize() if self._queue is not None else 0,
+            }
@@ -0,0 +1,123 @@
+import copy
+import hashlib
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from dotenv import dotenv_values
+from src.database.Roadmap_Template import RoadmapTemplate
+
+config = dotenv_values(".env")
+
+CORPUS_PATH = config.get("CORPUS_PATH", "data/questions/AI_Engineer")
+
+# (domain, level, contentVersion) -> {"skills": ..., "days": [...]}
+_templates: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+# path -> (size, mtime_ns, sha1 of content)
+_file_digests: Dict[str, Tuple[int, int, str]] = {}
+_lock = threading.Lock()
+
+
+def _file_digest(path: str) -> str:
+    stat = os.stat(path)
+    cached = _file_digests.get(path)
+    if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+        return cached[2]
+    with open(path, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+    _file_digests[path] = (stat.st_size, stat.st_mtime_ns, digest)
+    return digest
+
+
+def get_content_version(domain: str, level: str, base_path: str = CORPUS_PATH) -> Optional[str]:
+    """
+    Fingerprint the corpus files backing one (domain, level) slice.
+
+    The version only changes when a file of that slice is added, removed or
+    edited, so templates survive redeploys of an unchanged corpus.
+    Returns None when the corpus has no folder for the slice.
+    """
+    domain = (domain or "").strip().lower()
+    level = (level or "").strip().lower()
+    manifest = []
+    for root, dirs, files in os.walk(base_path):
+        parts = os.path.relpath(root, base_path).split(os.sep)
+        if len(parts) != 2 or parts[0].strip().lower() != domain or parts[1].strip().lower() != level:
+            continue
+        for file in sorted(files):
+            if file.endswith(".json"):
+                manifest.append(f"{file}:{_file_digest(os.path.join(root, file))}")
+
+    if not manifest:
+        return None
+    return hashlib.sha1("\n".join(sorted(manifest)).encode()).hexdigest()[:16]
+
+
+def get_roadmap_template(domain: str, level: str, version: str) -> Optional[Dict[str, Any]]:
+    """Look up a template in memory first, then in MongoDB."""
+    key = (domain, level, version)
+    template = _templates.get(key)
+    if template is not None:
+        return template
+
+    try:
+        doc = RoadmapTemplate.objects(domain=domain, level=level, contentVersion=version).first()
+    except Exception as e:
+        print(f"⚠️ Error loading roadmap template: {e}")
+        return None
+    if doc is None:
+        return None
+
+    template = {"skills": dict(doc.skills), "days": list(doc.days or [])}
+    with _lock:
+        _templates[key] = template
+    return template
+
+
+def save_roadmap_template(domain: str, level: str, version: str, skills: Dict[str, List[str]], days: List[Dict[str, Any]]) -> None:
+    """Store a freshly generated roadmap and drop templates of older corpus versions."""
+    key = (domain, level, version)
+    template = {"skills": copy.deepcopy(skills), "days": copy.deepcopy(days)}
+    with _lock:
+        for stale in [k for k in _templates if k[:2] == key[:2] and k[2] != version]:
+            del _templates[stale]
+        _templates[key] = template
+
+    try:
+        RoadmapTemplate.objects(domain=domain, level=level, contentVersion=version).update_one(
+            upsert=True,
+            set__skills=template["skills"],
+            set__days=template["days"],
+            set__updatedAt=datetime.now(),
+        )
+        RoadmapTemplate.objects(domain=domain, level=level, contentVersion__ne=version).delete()
+        print(f"✅ Roadmap template saved (domain={domain}, level={level}, version={version})")
+    except Exception as e:
+        print(f"⚠️ Error saving roadmap template: {e}")
+
+
+def save_template_day(domain: str, level: str, version: str, day: Dict[str, Any]) -> None:
+    """Add one lazily generated day to an existing template, unless its subskill is already there."""
+    key = (domain, level, version)
+    day = copy.deepcopy(day)
+    with _lock:
+        template = _templates.get(key)
+        if template is not None and all(d.get("subskill") != day.get("subskill") for d in template["days"]):
+            template["days"].append(day)
+
+    try:
+        RoadmapTemplate.objects(__raw__={
+            "domain": domain,
+            "level": level,
+            "contentVersion": version,
+            "days.subskill": {"$ne": day.get("subskill")},
+        }).update_one(push__days=day, set__updatedAt=datetime.now())
+    except Exception as e:
+        print(f"⚠️ Error saving roadmap template day: {e}")
+
+
+def personalize_template(template: Dict[str, Any]) -> Tuple[Dict[str, List[str]], Dict[str, Dict[str, Any]]]:
+    """Return a per-user copy of a template's skills and its generated days keyed by subskill."""
+    skills = copy.deepcopy(template["skills"])
+    days = {day.get("subskill"): copy.deepcopy(day) for day in template["days"]}
+    return skills, days
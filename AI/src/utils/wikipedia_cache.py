@@ -0,0 +1,209 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+from dotenv import dotenv_values
+from src.utils.deadline import Deadline, DeadlineExceeded, run_with_deadline
+
+config = dotenv_values(".env")
+
+# Relative paths are resolved against the AI directory, not the working directory of the process
+WIKIPEDIA_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    config.get("WIKIPEDIA_CACHE_PATH", "wikipedia_cache.sqlite3"),
+)
+# How long a lookup waits for another worker's write lock on the cache before giving up on it
+WIKIPEDIA_CACHE_BUSY_TIMEOUT_SECONDS = float(config.get("WIKIPEDIA_CACHE_BUSY_TIMEOUT_SECONDS", 2))
+WIKIPEDIA_CACHE_TTL_SECONDS = float(config.get("WIKIPEDIA_CACHE_TTL_SECONDS", 7 * 24 * 3600))
+WIKIPEDIA_CACHE_MAX_ENTRIES = int(config.get("WIKIPEDIA_CACHE_MAX_ENTRIES", 5000))
+WIKIPEDIA_TIMEOUT_SECONDS = float(config.get("WIKIPEDIA_TIMEOUT_SECONDS", 10))
+# JSONL file of {"title": ..., "summary": ...} articles, looked up before the network
+WIKIPEDIA_SNAPSHOT_PATH = config.get("WIKIPEDIA_SNAPSHOT_PATH")
+# Never call the Wikipedia API (tests, air-gapped deployments)
+WIKIPEDIA_OFFLINE = str(config.get("WIKIPEDIA_OFFLINE", "false")).lower() in ("1", "true", "yes")
+
+NO_RESULT = "No good Wikipedia Search Result was found"
+
+
+def normalize_query(query: str) -> str:
+    return re.sub(r"\s+", " ", re.sub(r"[^\w\s]", " ", (query or "").lower())).strip()
+
+
+class CachedWikipedia:
+    """
+    Wikipedia lookup tool backed by a local snapshot and a persistent SQLite cache.
+
+    Lookups go snapshot -> cache -> Wikipedia API; API results are stored
+    with a TTL and the least recently used entries are evicted above
+    max_entries. SQLite errors (a locked or unwritable cache) only cost
+    the cache: the lookup goes to the API as if the entry were missing.
+    """
+
+    def __init__(
+        self,
+        cache_path: str = WIKIPEDIA_CACHE_PATH,
+        ttl_seconds: float = WIKIPEDIA_CACHE_TTL_SECONDS,
+        max_entries: int = WIKIPEDIA_CACHE_MAX_ENTRIES,
+        snapshot_path: Optional[str] = WIKIPEDIA_SNAPSHOT_PATH,
+        offline: bool = WIKIPEDIA_OFFLINE,
+        timeout: float = WIKIPEDIA_TIMEOUT_SECONDS,
+        busy_timeout: float = WIKIPEDIA_CACHE_BUSY_TIMEOUT_SECONDS,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.snapshot_path = snapshot_path
+        self.offline = offline
+        self.timeout = timeout
+        self._snapshot: Optional[Dict[str, str]] = None
+        self._wrapper = None
+        self._lock = threading.Lock()
+
+        self._db: Optional[sqlite3.Connection] = None
+        try:
+            directory = os.path.dirname(cache_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            db = sqlite3.connect(cache_path, timeout=busy_timeout, check_same_thread=False)
+            db.execute(f"PRAGMA busy_timeout = {int(busy_timeout * 1000)}")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS wikipedia_cache ("
+                "query TEXT PRIMARY KEY, result TEXT NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS idx_wikipedia_cache_accessed ON wikipedia_cache (accessed_at)")
+            db.commit()
+            self._db = db
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️ Wikipedia cache unavailable at {cache_path}, lookups are not cached: {e}")
+
+    def _load_snapshot(self) -> Dict[str, str]:
+        if self._snapshot is None:
+            snapshot = {}
+            if self.snapshot_path and os.path.exists(self.snapshot_path):
+                with open(self.snapshot_path, encoding="utf-8") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        article = json.loads(line)
+                        snapshot[normalize_query(article["title"])] = f"Page: {article['title']}\nSummary: {article['summary']}"
+                print(f"📚 Loaded {len(snapshot)} Wikipedia articles from {self.snapshot_path}")
+            self._snapshot = snapshot
+        return self._snapshot
+
+    def _get_cached(self, key: str) -> Optional[str]:
+        if self._db is None:
+            return None
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._db.execute(
+                    "SELECT result, created_at FROM wikipedia_cache WHERE query = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                if now - row[1] > self.ttl_seconds:
+                    self._db.execute("DELETE FROM wikipedia_cache WHERE query = ?", (key,))
+                    self._db.commit()
+                    return None
+                self._db.execute("UPDATE wikipedia_cache SET accessed_at = ? WHERE query = ?", (now, key))
+                self._db.commit()
+                return row[0]
+            except sqlite3.Error as e:
+                self._rollback()
+                print(f"⚠️ Wikipedia cache read failed for {key}: {e}")
+                return None
+
+    def _put_cached(self, key: str, result: str) -> None:
+        if self._db is None:
+            return
+        now = time.time()
+        with self._lock:
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO wikipedia_cache (query, result, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, result, now, now),
+                )
+                self._db.execute(
+                    "DELETE FROM wikipedia_cache WHERE query IN ("
+                    "SELECT query FROM wikipedia_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                self._rollback()
+                print(f"⚠️ Wikipedia cache write failed for {key}: {e}")
+
+    def _rollback(self) -> None:
+        try:
+            self._db.rollback()
+        except sqlite3.Error:
+            pass
+
+    def _fetch(self, query: str) -> str:
+        if self._wrapper is None:
+            from langchain_community.utilities import WikipediaAPIWrapper
+            self._wrapper = WikipediaAPIWrapper()
+        # The wikipedia client has no timeout of its own, so the lookup runs on a thread
+        # of its own that we stop waiting for (not on a pool shared with the agent runs)
+        return run_with_deadline(Deadline(self.timeout), "wikipedia", self._wrapper.run, query)
+
+    def run(self, query: str) -> str:
+        key = normalize_query(query)
+        if not key:
+            return NO_RESULT
+
+        article = self._load_snapshot().get(key)
+        if article:
+            return article
+
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
+
+        if self.offline:
+            return NO_RESULT
+
+        try:
+            result = self._fetch(query)
+        except DeadlineExceeded:
+            print(f"⚠️ Wikipedia lookup timed out for query: {query}")
+            return NO_RESULT
+        except Exception as e:
+            print(f"⚠️ Wikipedia lookup failed for query {query}: {e}")
+            return NO_RESULT
+
+        self._put_cached(key, result)
+        return result
+
+
+def build_wikipedia_snapshot(titles, output_path: str) -> int:
+    """Fetch article summaries once and write them as a JSONL snapshot for offline lookups."""
+    import wikipedia
+
+    written = 0
+    with open(output_path, "w", encoding="utf-8") as f:
+        for title in titles:
+            try:
+                page = wikipedia.page(title, auto_suggest=False)
+            except Exception as e:
+                print(f"⚠️ Skipping Wikipedia article {title}: {e}")
+                continue
+            f.write(json.dumps({"title": page.title, "summary": page.summary}, ensure_ascii=False) + "\n")
+            written += 1
+    return written
+
+
+_wikipedia: Optional[CachedWikipedia] = None
+_wikipedia_lock = threading.Lock()
+
+
+def get_cached_wikipedia() -> CachedWikipedia:
+    """Process wide Wikipedia tool, so all agents share one cache connection."""
+    global _wikipedia
+    with _wikipedia_lock:
+        if _wikipedia is None:
+            _wikipedia = CachedWikipedia()
+        return _wikipedia
@@ -0,0 +1,53 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+
+class BoundedWorkerPool:
+    """
+    Thread pool for CPU-bound work called from async endpoints.
+
+    Requests take a slot with try_acquire() before doing any work; once
+    workers + max_queued requests are in flight new ones are refused, so
+    callers can answer 503 at once instead of queueing without bound. run()
+    executes a function on the pool without blocking the event loop.
+    """
+
+    def __init__(self, workers: int, max_queued: int, name: str = "worker"):
+        self.workers = max(1, workers)
+        self.max_queued = max(0, max_queued)
+        self.name = name
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._rejected = 0
+        self._completed = 0
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self._in_flight >= self.workers + self.max_queued:
+                self._rejected += 1
+                return False
+            self._in_flight += 1
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._completed += 1
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "in_flight": self._in_flight,
+                "queue_depth": max(0, self._in_flight - self.workers),
+                "max_queued": self.max_queued,
+                "rejected": self._rejected,
+                "completed": self._completed,
+            }
@@ -0,0 +1,69 @@
+import pytest
+
+mongomock = pytest.importorskip("mongomock")
+mongoengine = pytest.importorskip("mongoengine")
+
+from src.database.Content import Content
+from src.utils import content_store
+from src.utils.content_store import hydrate_days, make_content_id, store_day_content, store_days_content
+
+
+@pytest.fixture
+def mongo(monkeypatch):
+    mongoengine.connect("test_content", host="mongodb://localhost", alias="default", mongo_client_class=mongomock.MongoClient)
+    monkeypatch.setattr(content_store, "_cache", content_store.OrderedDict())
+    yield
+    Content.drop_collection()
+    mongoengine.disconnect(alias="default")
+
+
+def make_day(theory, subskill="Variables", day=1):
+    return {
+        "day": day,
+        "skill": "Basics",
+        "subskill": subskill,
+        "youtube_links": f"https://youtu.be/{theory}",
+        "theory": theory,
+        "question_review": [{"id": "q1", "question_text": theory, "options": ["a", "b"], "correct_answer": "a", "level": "easy"}],
+        "status": "ready",
+    }
+
+
+def test_embedded_mode_writes_nothing(mongo, monkeypatch):
+    monkeypatch.setattr(content_store, "LEARNING_PATH_CONTENT_MODE", "embedded")
+
+    entries = store_days_content("python", "beginner", "v1", [make_day("first")])
+
+    assert entries[0]["theory"] == "first"
+    assert Content.objects.count() == 0
+
+
+def test_reference_mode_writes_all_days_at_once(mongo, monkeypatch):
+    monkeypatch.setattr(content_store, "LEARNING_PATH_CONTENT_MODE", "reference")
+    days = [make_day(f"theory {i}", subskill=f"skill {i}", day=i) for i in range(1, 6)]
+
+    entries = store_days_content("python", "beginner", "v1", days)
+
+    assert Content.objects.count() == 5
+    assert [entry["contentId"] for entry in entries] == [make_content_id("python", "beginner", f"skill {i}", "v1") for i in range(1, 6)]
+    assert all("theory" not in entry for entry in entries)
+    assert [entry["day"] for entry in entries] == [1, 2, 3, 4, 5]
+
+
+def test_first_writer_wins(mongo, monkeypatch):
+    monkeypatch.setattr(content_store, "LEARNING_PATH_CONTENT_MODE", "reference")
+    store_day_content("python", "beginner", "v1", make_day("first"))
+    content_store._cache.clear()
+
+    entry = store_day_content("python", "beginner", "v1", make_day("second"))
+
+    content_id = make_content_id("python", "beginner", "Variables", "v1")
+    assert entry["contentId"] == content_id
+    assert Content.objects.count() == 1
+    # The writer that lost caches the stored content, not its own
+    assert content_store._cache[content_id]["theory"] == "first"
+    content_store._cache.clear()
+    day = hydrate_days([entry])[0]
+    assert day["theory"] == "first"
+    assert day["question_review"][0]["question_text"] == "first"
+    assert day["subskill"] == "Variables"
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from src.features.face_recognition.face_gallery import FaceGallery
+
+DIM = 8
+
+
+def unit(i):
+    vector = np.zeros(DIM, dtype=np.float32)
+    vector[i] = 1.0
+    return vector
+
+
+@pytest.fixture
+def gallery(tmp_path):
+    return FaceGallery(str(tmp_path), initial_capacity=4, dim=DIM)
+
+
+def test_relative_path_is_rejected():
+    with pytest.raises(ValueError):
+        FaceGallery("face_gallery", dim=DIM)
+
+
+def test_identify_and_verify(gallery):
+    for i in range(3):
+        gallery.enroll(f"u{i}", unit(i))
+
+    assert gallery.identify(unit(1), top_k=1) == [("u1", pytest.approx(0.0))]
+    assert gallery.verify("u2", unit(2)) == pytest.approx(0.0)
+    assert gallery.verify("u2", unit(0)) == pytest.approx(1.0)
+    assert gallery.verify("nobody", unit(0)) is None
+
+
+def test_other_dimension_or_metric_is_rejected(gallery):
+    with pytest.raises(ValueError):
+        gallery.enroll("u0", np.ones(DIM * 2))
+    with pytest.raises(ValueError):
+        gallery.enroll("u0", unit(0), metric="euclidean")
+    assert len(gallery) == 0
+
+
+def test_remove_leaves_rows_of_other_users_in_place(gallery, tmp_path):
+    for i in range(3):
+        gallery.enroll(f"u{i}", unit(i))
+    # Another process that loaded the index before the removal
+    reader = FaceGallery(str(tmp_path), initial_capacity=4, dim=DIM)
+    row_of_u2 = np.array(reader.get("u2"))
+
+    assert gallery.remove("u0")
+
+    assert np.array_equal(reader._matrix[reader._rows["u2"]], row_of_u2)
+    assert len(gallery) == 2
+    assert "u0" not in dict(gallery.identify(unit(0), top_k=5))
+    assert len(reader) == 2
+
+
+def test_compaction_moves_live_rows_to_a_new_file(gallery, tmp_path):
+    for i in range(4):
+        gallery.enroll(f"u{i}", unit(i))
+    reader = FaceGallery(str(tmp_path), initial_capacity=4, dim=DIM)
+    assert len(reader) == 4
+    old_matrix = reader._matrix
+
+    for i in range(3):
+        gallery.remove(f"u{i}")
+
+    # Tombstones outnumber live rows: the old file is left untouched for stale readers
+    assert np.array_equal(old_matrix[0], unit(0))
+    assert gallery._matrix_name != "embeddings.f32"
+    assert gallery.identify(unit(3), top_k=5) == [("u3", pytest.approx(0.0))]
+    assert reader.identify(unit(3), top_k=5) == [("u3", pytest.approx(0.0))]
+
+    gallery.enroll("u4", unit(4))
+    assert dict(reader.identify(unit(4), top_k=5))["u4"] == pytest.approx(0.0)
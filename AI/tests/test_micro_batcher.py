@@ -0,0 +1,86 @@
+import asyncio
+import threading
+import time
+
+from src.utils.micro_batcher import MicroBatcher
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_results_follow_items():
+    batcher = MicroBatcher(lambda items: [item * 2 for item in items], max_batch_size=4, max_wait_ms=5)
+
+    async def main():
+        return await asyncio.gather(*(batcher.submit(i) for i in range(10)))
+
+    assert run(main()) == [i * 2 for i in range(10)]
+    stats = batcher.stats()
+    assert stats["items"] == 10
+    assert stats["largest_batch"] <= 4
+
+
+def test_batches_run_concurrently_up_to_max_in_flight():
+    lock = threading.Lock()
+    running = {"now": 0, "peak": 0}
+
+    def process(items):
+        with lock:
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+        time.sleep(0.05)
+        with lock:
+            running["now"] -= 1
+        return items
+
+    batcher = MicroBatcher(process, max_batch_size=1, max_wait_ms=0, max_in_flight=3)
+
+    async def main():
+        return await asyncio.gather(*(batcher.submit(i) for i in range(6)))
+
+    started = time.perf_counter()
+    assert run(main()) == list(range(6))
+    assert running["peak"] == 3
+    # Two rounds of three batches, not six in a row
+    assert time.perf_counter() - started < 0.25
+    assert batcher.stats()["in_flight"] == 0
+
+
+def test_single_batch_in_flight_by_default():
+    lock = threading.Lock()
+    running = {"now": 0, "peak": 0}
+
+    def process(items):
+        with lock:
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+        time.sleep(0.01)
+        with lock:
+            running["now"] -= 1
+        return items
+
+    batcher = MicroBatcher(process, max_batch_size=2, max_wait_ms=0)
+
+    async def main():
+        return await asyncio.gather(*(batcher.submit(i) for i in range(6)))
+
+    assert run(main()) == list(range(6))
+    assert running["peak"] == 1
+
+
+def test_errors_reach_every_item_of_the_batch():
+    def process(items):
+        raise ValueError("broken")
+
+    batcher = MicroBatcher(process, max_batch_size=4, max_wait_ms=5, max_in_flight=2)
+
+    async def main():
+        return await asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True)
+
+    results = run(main())
+    assert all(isinstance(result, ValueError) for result in results)
+
+    # The batcher keeps serving after a failed batch
+    batcher.process_batch = lambda items: items
+    assert run(batcher.submit(7)) == 7
@@ -0,0 +1,132 @@
+import pytest
+
+mongomock = pytest.importorskip("mongomock")
+mongoengine = pytest.importorskip("mongoengine")
+
+from pymongo.errors import OperationFailure
+
+from src.database import persistence
+from src.database.Learning_Path import Day, LearningPath
+from src.database.RoadMap_Schema import RoadMap
+from src.database.persistence import save_generated_schedule
+
+
+class FakeSession:
+    """Stands in for a pymongo ClientSession, mongomock has no sessions."""
+
+    def __init__(self):
+        self.transactions = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def with_transaction(self, callback):
+        self.transactions += 1
+        # The callback gets the session, mongomock writes have to run without one
+        return callback(None)
+
+
+class TransactionClient:
+    """mongomock client that supports (or rejects, like a standalone mongod) sessions."""
+
+    def __init__(self, client, error=None):
+        self._client = client
+        self.error = error
+        self.session = FakeSession()
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    def start_session(self):
+        if self.error is not None:
+            raise self.error
+        return self.session
+
+
+@pytest.fixture
+def mongo(monkeypatch):
+    mongoengine.connect("test_schedules", host="mongodb://localhost", alias="default", mongo_client_class=mongomock.MongoClient)
+    monkeypatch.setattr(persistence, "_transactions_supported", None)
+    yield mongoengine.connection.get_connection()
+    mongoengine.disconnect(alias="default")
+
+
+def make_schedule(roadmap_id="rm-1", theory="Variables"):
+    roadmap = RoadMap(goal="Python", level="beginner", userId="u1", roadmapId=roadmap_id, skills={"Basics": ["Variables"]})
+    learning_path = LearningPath(
+        userId="u1",
+        course="Python",
+        roadmapId=roadmap_id,
+        schedule=[Day(day=1, skill="Basics", subskill="Variables", theory=theory)],
+        totalDays=1,
+    )
+    return roadmap, learning_path
+
+
+def test_sequential_write_without_transactions(mongo, monkeypatch):
+    monkeypatch.setattr(persistence, "MONGO_TRANSACTIONS", "auto")
+    roadmap, learning_path = make_schedule()
+
+    save_generated_schedule(roadmap, learning_path)
+
+    # mongomock has no "hello" command, so auto detection settles on plain writes
+    assert persistence._transactions_supported is False
+    assert RoadMap.objects(roadmapId="rm-1").count() == 1
+    stored = LearningPath.objects(roadmapId="rm-1").first()
+    assert stored.id == learning_path.id
+    assert stored.schedule[0].theory == "Variables"
+
+
+def test_replay_does_not_overwrite(mongo, monkeypatch):
+    monkeypatch.setattr(persistence, "MONGO_TRANSACTIONS", "off")
+    save_generated_schedule(*make_schedule(theory="first"))
+    LearningPath.objects(roadmapId="rm-1").update_one(set__currentDay=3)
+
+    save_generated_schedule(*make_schedule(theory="second"))
+
+    assert LearningPath.objects(roadmapId="rm-1").count() == 1
+    stored = LearningPath.objects(roadmapId="rm-1").first()
+    assert stored.schedule[0].theory == "first"
+    assert stored.currentDay == 3
+
+
+def test_transaction_path(mongo, monkeypatch):
+    client = TransactionClient(mongo)
+    monkeypatch.setattr(persistence, "get_connection", lambda: client)
+    monkeypatch.setattr(persistence, "MONGO_TRANSACTIONS", "on")
+    roadmap, learning_path = make_schedule()
+
+    save_generated_schedule(roadmap, learning_path)
+
+    assert client.session.transactions == 1
+    assert RoadMap.objects(roadmapId="rm-1").count() == 1
+    assert LearningPath.objects(roadmapId="rm-1").count() == 1
+    # The saved instances behave like loaded documents afterwards
+    assert not roadmap._created and not learning_path._get_changed_fields()
+
+
+def test_transaction_rejected_falls_back_to_sequential(mongo, monkeypatch):
+    client = TransactionClient(mongo, OperationFailure("Transaction numbers are only allowed on a replica set member or mongos", code=20))
+    monkeypatch.setattr(persistence, "get_connection", lambda: client)
+    monkeypatch.setattr(persistence, "MONGO_TRANSACTIONS", "auto")
+    monkeypatch.setattr(persistence, "_transactions_supported", True)
+
+    save_generated_schedule(*make_schedule())
+
+    assert persistence._transactions_supported is False
+    assert RoadMap.objects(roadmapId="rm-1").count() == 1
+    assert LearningPath.objects(roadmapId="rm-1").count() == 1
+
+
+def test_other_transaction_errors_are_raised(mongo, monkeypatch):
+    client = TransactionClient(mongo, OperationFailure("not authorized", code=13))
+    monkeypatch.setattr(persistence, "get_connection", lambda: client)
+    monkeypatch.setattr(persistence, "MONGO_TRANSACTIONS", "on")
+
+    with pytest.raises(OperationFailure):
+        save_generated_schedule(*make_schedule())
+
+    assert RoadMap.objects(roadmapId="rm-1").count() == 0
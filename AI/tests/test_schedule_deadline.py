@@ -0,0 +1,34 @@
+import pytest
+
+pytest.importorskip("pydantic")
+pytest.importorskip("mongoengine")
+
+from src.features.ai_schedule import schedule_controller
+from src.utils.deadline import Deadline, DeadlineExceeded
+
+
+class FakeAgent:
+    max_execution_time = None
+
+
+def agent_returning(output):
+    return lambda agent, **kwargs: output
+
+
+def test_agent_stop_message_is_a_deadline():
+    with pytest.raises(DeadlineExceeded):
+        schedule_controller._run_agent(
+            Deadline(30), "day 1", agent_returning("Agent stopped due to iteration limit or time limit."), FakeAgent()
+        )
+
+
+def test_agent_output_is_returned_within_the_deadline():
+    agent = FakeAgent()
+    assert schedule_controller._run_agent(Deadline(30), "day 1", agent_returning('{"theory": "x"}'), agent) == '{"theory": "x"}'
+    assert 1.0 <= agent.max_execution_time <= 30
+
+
+def test_generate_day_raises_once_the_deadline_expired():
+    entry = {"day": 2, "skill": "Basics", "subskill": "Variables"}
+    with pytest.raises(DeadlineExceeded):
+        schedule_controller._generate_day(FakeAgent(), entry, "beginner", Deadline(0))
@@ -0,0 +1,123 @@
+import json
+import time
+
+import pytest
+
+from src.utils import wikipedia_cache
+from src.utils.wikipedia_cache import CachedWikipedia, NO_RESULT
+
+
+class FakeWrapper:
+    """Stands in for WikipediaAPIWrapper so the tests never reach the network."""
+
+    def __init__(self):
+        self.calls = []
+
+    def run(self, query):
+        self.calls.append(query)
+        return f"Page: {query}\nSummary: fetched"
+
+
+@pytest.fixture
+def make_cache(tmp_path):
+    def make(**kwargs):
+        kwargs.setdefault("cache_path", str(tmp_path / "cache.sqlite3"))
+        kwargs.setdefault("snapshot_path", None)
+        kwargs.setdefault("offline", False)
+        cache = CachedWikipedia(**kwargs)
+        cache._wrapper = FakeWrapper()
+        return cache
+    return make
+
+
+def test_snapshot_is_used_before_the_network(tmp_path, make_cache):
+    snapshot = tmp_path / "snapshot.jsonl"
+    snapshot.write_text(json.dumps({"title": "Linear Algebra", "summary": "Vectors and matrices"}) + "\n", encoding="utf-8")
+    cache = make_cache(snapshot_path=str(snapshot))
+
+    assert cache.run("linear  algebra!") == "Page: Linear Algebra\nSummary: Vectors and matrices"
+    assert cache._wrapper.calls == []
+
+
+def test_results_are_cached(make_cache):
+    cache = make_cache()
+
+    first = cache.run("Convolution")
+    assert cache.run("convolution") == first
+    assert cache._wrapper.calls == ["Convolution"]
+
+
+def test_offline_misses_return_no_result(make_cache):
+    cache = make_cache(offline=True)
+
+    assert cache.run("Convolution") == NO_RESULT
+    assert cache._wrapper.calls == []
+
+
+def test_expired_entries_are_fetched_again(make_cache, monkeypatch):
+    cache = make_cache(ttl_seconds=60)
+    now = time.time()
+    monkeypatch.setattr(wikipedia_cache.time, "time", lambda: now)
+    cache.run("Convolution")
+
+    monkeypatch.setattr(wikipedia_cache.time, "time", lambda: now + 61)
+    cache.run("Convolution")
+
+    assert cache._wrapper.calls == ["Convolution", "Convolution"]
+
+
+def test_least_recently_used_entries_are_evicted(make_cache, monkeypatch):
+    cache = make_cache(max_entries=2)
+    clock = iter(range(1_000_000, 2_000_000))
+    monkeypatch.setattr(wikipedia_cache.time, "time", lambda: float(next(clock)))
+
+    cache.run("a")
+    cache.run("b")
+    cache.run("a")  # a is now more recent than b
+    cache.run("c")  # evicts b
+
+    assert cache._get_cached("a") is not None
+    assert cache._get_cached("c") is not None
+    assert cache._get_cached("b") is None
+
+
+def test_failed_lookups_are_not_cached(make_cache):
+    cache = make_cache()
+
+    def fail(query):
+        raise ConnectionError("offline")
+
+    cache._wrapper.run = fail
+    assert cache.run("Convolution") == NO_RESULT
+    assert cache._get_cached("convolution") is None
+
+
+class BrokenConnection:
+    """sqlite3 connection whose every statement fails, like a locked database."""
+
+    def execute(self, *args):
+        raise wikipedia_cache.sqlite3.OperationalError("database is locked")
+
+    def rollback(self):
+        pass
+
+
+def test_cache_errors_fall_back_to_an_uncached_lookup(make_cache):
+    cache = make_cache()
+    cache._db = BrokenConnection()
+
+    assert cache.run("Convolution") == "Page: Convolution\nSummary: fetched"
+    assert cache.run("Convolution") == "Page: Convolution\nSummary: fetched"
+    assert cache._wrapper.calls == ["Convolution", "Convolution"]
+
+
+def test_unusable_cache_path_disables_the_cache(tmp_path, make_cache):
+    (tmp_path / "not_a_directory").write_text("", encoding="utf-8")
+    cache = make_cache(cache_path=str(tmp_path / "not_a_directory" / "cache.sqlite3"))
+
+    assert cache._db is None
+    assert cache.run("Convolution") == "Page: Convolution\nSummary: fetched"
+
+
+def test_default_path_is_absolute():
+    assert wikipedia_cache.os.path.isabs(wikipedia_cache.WIKIPEDIA_CACHE_PATH)
@@ -8,7 +8,8 @@ import {
   UseGuards, 
   Request,
   HttpCode,
-  HttpStatus
+  HttpStatus,
+  ParseIntPipe
 } from '@nestjs/common';
 import { 
   ApiTags, 
@@ -75,6 +76,25 @@ export class AiLearningPathsController {
     return this.aiLearningPathsService.getLearningPath(id, userId);
   }
 
+  @ApiOperation({ 
+    summary: 'Lấy nội dung một ngày của lộ trình',
+    description: 'Lấy nội dung một ngày; ngày chưa được tạo sẽ được AI tạo khi cần (status "pending" kèm retryAfter nếu chưa xong)'
+  })
+  @ApiParam({ name: 'id', description: 'ID của lộ trình học tập' })
+  @ApiParam({ name: 'day', description: 'Số thứ tự ngày' })
+  @ApiResponse({ status: 200, description: 'Lấy nội dung ngày thành công' })
+  @ApiResponse({ status: 404, description: 'Không tìm thấy lộ trình hoặc ngày' })
+  @ApiResponse({ status: 401, description: 'Unauthorized - Chưa đăng nhập' })
+  @Get(':id/days/:day')
+  async getLearningPathDay(
+    @Param('id') id: string,
+    @Param('day', ParseIntPipe) day: number,
+    @Request() req: any
+  ) {
+    const userId = req.user._id.toString();
+    return this.aiLearningPathsService.getLearningPathDay(id, day, userId);
+  }
+
   @ApiOperation({ 
     summary: 'Cập nhật tiến độ học tập',
     description: 'Cập nhật tiến độ học tập của một lộ trình (ngày đã hoàn thành, phần trăm hoàn thành, etc.)'
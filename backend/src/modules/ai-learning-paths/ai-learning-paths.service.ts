@@ -181,18 +181,17 @@ export class AiLearningPathsService {
         completedDays: learningPath.completedDays || [],
         progressPercentage: learningPath.progressPercentage || 0,
         skills: roadmap?.skills || {},
-        learning_path: (learningPath.schedule || []).map((day: any) => ({
-          day: day.day,
-          skill: day.skill,
-          subskill: day.subskill,
-          youtube_links: day.youtube_links,
-          theory: day.theory,
-          question_review: day.question_review || [],
-        })),
+        learning_path: await this.hydrateDays(
+          learningPath.roadmapId,
+          (learningPath.schedule || []).map((day: any) => this.formatDay(day)),
+        ),
         createdAt: learningPath.createdAt,
         lastAccessed: learningPath.lastAccessed,
       };
 
+      // Keep the days after the current one generated ahead of time
+      this.prefetchDays(learningPath.roadmapId);
+
       return result;
     } catch (error: any) {
       if (error instanceof NotFoundException) {
@@ -203,6 +202,97 @@ export class AiLearningPathsService {
     }
   }
 
+  /**
+   * Get one day of a learning path, asking the AI service to generate it when it is still pending
+   */
+  async getLearningPathDay(learningPathId: string, day: number, userId: string) {
+    this.logger.log(`Getting day ${day} of learning path ${learningPathId}`);
+    try {
+      const learningPath = await this.learningPathModel.findById(learningPathId).exec();
+
+      // Verify ownership
+      if (!learningPath || learningPath.userId !== userId) {
+        throw new NotFoundException('Learning path not found');
+      }
+
+      const stored = (learningPath.schedule || []).find((entry: any) => entry.day === day);
+      if (!stored) {
+        throw new NotFoundException(`Day ${day} not found`);
+      }
+      const formatted = this.formatDay(stored);
+      if (formatted.status !== 'pending' && formatted.theory) {
+        return formatted;
+      }
+
+      try {
+        const response = await axios.get(
+          `${this.aiServiceUrl}/learning_path/${learningPath.roadmapId}/days/${day}`,
+          { timeout: 60000 }, // the AI service waits up to DAY_WAIT_SECONDS for a day being generated
+        );
+        if (!response.data.success) {
+          throw new BadRequestException(`AI service error: ${response.data.error}`);
+        }
+        return this.formatDay(response.data.day);
+      } catch (error: any) {
+        // 503: still being generated, the client retries after retryAfter seconds
+        if (error.response?.status === 503) {
+          return { ...formatted, status: 'pending', retryAfter: error.response.data?.retryAfter || 5 };
+        }
+        throw error;
+      }
+    } catch (error: any) {
+      if (error instanceof NotFoundException || error instanceof BadRequestException) {
+        throw error;
+      }
+      this.logger.error(`Error getting learning path day: ${error.message}`, error.stack);
+      throw new BadRequestException(`Failed to get learning path day: ${error.message}`);
+    }
+  }
+
+  private formatDay(day: any) {
+    return {
+      day: day.day,
+      skill: day.skill,
+      subskill: day.subskill,
+      youtube_links: day.youtube_links,
+      theory: day.theory,
+      question_review: day.question_review || [],
+      status: day.status || 'ready',
+      contentId: day.contentId || null,
+    };
+  }
+
+  /**
+   * Fill ready days stored only as a contentId reference, with one AI service call
+   */
+  private async hydrateDays(roadmapId: string, days: any[]) {
+    const referenced = days.filter((day) => day.status !== 'pending' && !day.theory && day.contentId);
+    if (referenced.length === 0) {
+      return days;
+    }
+    try {
+      const response = await axios.get(`${this.aiServiceUrl}/learning_path/${roadmapId}/days`, {
+        params: {
+          start: Math.min(...referenced.map((day) => day.day)),
+          end: Math.max(...referenced.map((day) => day.day)),
+        },
+        timeout: 10000,
+      });
+      const content = new Map<number, any>((response.data.days || []).map((day: any) => [day.day, day]));
+      return days.map((day) => (content.has(day.day) && !day.theory ? { ...day, ...this.formatDay(content.get(day.day)) } : day));
+    } catch (error: any) {
+      // The days are still listed, their content is loaded when they are opened
+      this.logger.warn(`Could not hydrate days of roadmap ${roadmapId}: ${error.message}`);
+      return days;
+    }
+  }
+
+  private prefetchDays(roadmapId: string) {
+    axios
+      .post(`${this.aiServiceUrl}/learning_path/${roadmapId}/prefetch`, null, { timeout: 10000 })
+      .catch((error: any) => this.logger.warn(`Could not prefetch days of roadmap ${roadmapId}: ${error.message}`));
+  }
+
   /**
    * Update progress for a learning path
    */
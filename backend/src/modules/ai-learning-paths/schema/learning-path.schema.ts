@@ -40,6 +40,14 @@ export class Day {
 
   @Prop({ type: [Object] })
   question_review: Question[];
+
+  // "pending" days are generated by the AI service on demand
+  @Prop({ type: String })
+  status?: string;
+
+  // Shared content document of the day (the AI service can store only this reference)
+  @Prop({ type: String })
+  contentId?: string;
 }
 
 @Schema({ timestamps: true, collection: 'Learning_Path' })
@@ -1,6 +1,6 @@
 "use client";
 
-import React, { useEffect, useState } from 'react';
+import React, { useEffect, useRef, useState } from 'react';
 import { useParams, useRouter } from 'next/navigation';
 import {
   Typography,
@@ -30,7 +30,7 @@ import {
   QuestionCircleOutlined,
   CheckCircleFilled,
 } from '@ant-design/icons';
-import { getLearningPath } from '@/service/aiLearningPathService';
+import { getLearningPath, getLearningPathDay } from '@/service/aiLearningPathService';
 import RoadmapSkillTree from '@/components/RoadmapSkillTree';
 import VideoPlayer from '@/components/VideoPlayer';
 import styles from '@/styles/courseDetail.module.css';
@@ -51,6 +51,9 @@ interface LearningPathDay {
     correct_answer: string;
     level: string;
   }>;
+  // "pending" days are generated when they are opened
+  status?: string;
+  retryAfter?: number;
 }
 
 interface LearningPathData {
@@ -78,6 +81,9 @@ export default function AILearningPathPage() {
   const [expandedDays, setExpandedDays] = useState<string[]>([]);
   // Store user answers for questions: { questionId: selectedOption }
   const [userAnswers, setUserAnswers] = useState<Record<string, string>>({});
+  const [dayLoading, setDayLoading] = useState(false);
+  // Day the user is looking at, so a late answer for another day is not shown
+  const viewingDay = useRef<number | null>(null);
 
   useEffect(() => {
     if (id) {
@@ -94,7 +100,7 @@ export default function AILearningPathPage() {
         // Auto-select first day if available
         if (response.learning_path && response.learning_path.length > 0) {
           const firstDay = response.learning_path[0];
-          setSelectedDay(firstDay);
+          selectDay(firstDay);
         }
       }
     } catch (error: any) {
@@ -127,8 +133,51 @@ export default function AILearningPathPage() {
     return url;
   };
 
-  const handleDayClick = (day: LearningPathDay) => {
+  const needsContent = (day: LearningPathDay) => day.status === 'pending' || !day.theory;
+
+  const loadDay = async (day: LearningPathDay) => {
+    setDayLoading(true);
+    try {
+      const loaded: LearningPathDay = await getLearningPathDay(id, day.day);
+      if (viewingDay.current !== day.day) {
+        return;
+      }
+      if (loaded.status === 'pending') {
+        // Still being generated, ask again after the delay the AI service suggests
+        setTimeout(() => {
+          if (viewingDay.current === day.day) {
+            loadDay(day);
+          }
+        }, (loaded.retryAfter || 5) * 1000);
+        return;
+      }
+      setSelectedDay(loaded);
+      setLearningPath((current) =>
+        current
+          ? { ...current, learning_path: current.learning_path.map((entry) => (entry.day === loaded.day ? loaded : entry)) }
+          : current
+      );
+      setDayLoading(false);
+    } catch (error: any) {
+      console.error('Error loading day:', error);
+      if (viewingDay.current === day.day) {
+        setDayLoading(false);
+      }
+    }
+  };
+
+  const selectDay = (day: LearningPathDay) => {
+    viewingDay.current = day.day;
     setSelectedDay(day);
+    if (needsContent(day)) {
+      loadDay(day);
+    } else {
+      setDayLoading(false);
+    }
+  };
+
+  const handleDayClick = (day: LearningPathDay) => {
+    selectDay(day);
   };
 
   const isDayCompleted = (day: number) => {
@@ -236,6 +285,15 @@ export default function AILearningPathPage() {
 
                 <Divider />
 
+                {dayLoading && (
+                  <div style={{ textAlign: 'center', marginBottom: 24 }}>
+                    <Spin />
+                    <Text type="secondary" style={{ display: 'block', marginTop: 8 }}>
+                      Đang tạo nội dung cho ngày này...
+                    </Text>
+                  </div>
+                )}
+
                 {/* Video Content */}
                 {selectedDay.youtube_links && (
                   <div style={{ marginBottom: 24 }}>
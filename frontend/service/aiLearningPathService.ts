@@ -81,6 +81,20 @@ export const getLearningPath = async (id: string) => {
   }
 };
 
+/**
+ * Get one day of a learning path; days not generated yet are generated by the AI service
+ * (status "pending" with retryAfter seconds while that is still running)
+ */
+export const getLearningPathDay = async (id: string, day: number) => {
+  try {
+    const response = await getAccess(`ai-learning-paths/${id}/days/${day}`);
+    return response;
+  } catch (error: any) {
+    console.error('Error getting learning path day:', error);
+    throw error;
+  }
+};
+
 /**
  * Update progress for a learning path
  */